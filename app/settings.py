@@ -178,6 +178,8 @@ CORS_ALLOW_HEADERS = (
     'X-CSRFToken',
     'csrftoken',
     'x-requested-with',
+    'upload-offset',
+    'upload-checksum',
 )
 
 
@@ -254,3 +256,102 @@ SWAGGER_SETTINGS = {
 }
 
 
+# django-background-tasks: 실패한 회의 처리 작업은 체크포인트부터 최대 5번 재시도
+MAX_ATTEMPTS = env.int('MAX_ATTEMPTS', default=5)
+
+
+# Meeting recording processing
+MEETING_UPLOAD_ROOT = env('MEETING_UPLOAD_ROOT', default=str(BASE_DIR / 'meetings' / 'uploads'))
+MEETING_UPLOAD_MAX_CHUNK_SIZE = env.int('MEETING_UPLOAD_MAX_CHUNK_SIZE', default=8 * 1024 * 1024)
+MEETING_ARTIFACT_ROOT = env('MEETING_ARTIFACT_ROOT', default=str(BASE_DIR / 'meetings' / 'artifacts'))
+MEETING_WORK_ROOT = env('MEETING_WORK_ROOT', default=str(BASE_DIR / 'meetings' / 'work'))
+MEETING_OUTPUT_ROOT = env('MEETING_OUTPUT_ROOT', default=str(BASE_DIR / 'meetings'))
+
+# 화자 분리/STT 작업 중 섹션 오디오를 메모리에 올리는 형식 ('float32' 또는 'int16')
+# int16이면 섹션 원본 배열이 절반 크기가 된다. 화자 분리 모델은 float32 입력만 받으므로 음성 구간(VAD 적용 후)은
+# float32로 따로 만들어지며, 최대 메모리는 원본 float32 배열 대신 int16 배열을 쓰는 만큼(섹션 길이 x 2바이트) 줄어든다.
+# MEETING_VAD가 꺼져 있으면 화자 분리에 섹션 전체의 float32 복사본이 필요하므로 화자 분리 단계의 최대 메모리는 오히려 늘어난다.
+MEETING_AUDIO_DTYPE = env('MEETING_AUDIO_DTYPE', default='float32')
+
+# 회의 진행 중 실시간 전사: 16kHz mono 16bit PCM 청크를 받아 window 초 단위로 처리
+MEETING_LIVE_ROOT = env('MEETING_LIVE_ROOT', default=str(BASE_DIR / 'meetings' / 'live'))
+MEETING_LIVE_WINDOW_SECONDS = env.int('MEETING_LIVE_WINDOW_SECONDS', default=120)
+# window마다 찾은 화자를 같은 사람으로 묶는 최소 코사인 유사도 (화자 임베딩 평균 기준)
+MEETING_LIVE_SPEAKER_SIMILARITY = env.float('MEETING_LIVE_SPEAKER_SIMILARITY', default=0.5)
+
+# STT 백엔드 ('google': 구글 음성 인식, 'nemo': 로컬 NeMo 모델, 'stub': 벤치마크용 가짜 응답)
+MEETING_STT_BACKEND = env('MEETING_STT_BACKEND', default='google')
+MEETING_STT_STUB_LATENCY = env.float('MEETING_STT_STUB_LATENCY', default=0.0)
+
+# 회의록 요약 LLM 백엔드 ('openai', 'stub': 벤치마크용 가짜 응답) / 모델
+MEETING_LLM_BACKEND = env('MEETING_LLM_BACKEND', default='openai')
+MEETING_LLM_MODEL = env('MEETING_LLM_MODEL', default='gpt-4')
+MEETING_LLM_STUB_LATENCY = env.float('MEETING_LLM_STUB_LATENCY', default=0.0)
+
+# OpenAI 호환 API 주소 / API 키 / 워커당 최대 연결 수 / 연결·응답 대기 타임아웃(초) / 재시도 횟수 / 백오프 기본값(초)
+MEETING_LLM_API_BASE = env('MEETING_LLM_API_BASE', default='https://api.openai.com/v1')
+MEETING_LLM_API_KEY = env('MEETING_LLM_API_KEY', default=OPENAI_API_KEY or '')
+MEETING_LLM_MAX_CONNECTIONS = env.int('MEETING_LLM_MAX_CONNECTIONS', default=16)
+MEETING_LLM_CONNECT_TIMEOUT = env.float('MEETING_LLM_CONNECT_TIMEOUT', default=10.0)
+MEETING_LLM_READ_TIMEOUT = env.float('MEETING_LLM_READ_TIMEOUT', default=60.0)
+MEETING_LLM_RETRIES = env.int('MEETING_LLM_RETRIES', default=3)
+MEETING_LLM_BACKOFF = env.float('MEETING_LLM_BACKOFF', default=1.0)
+
+# 섹션 요약 동시 요청 수 / 요청별 타임아웃(초)
+MEETING_LLM_CONCURRENCY = env.int('MEETING_LLM_CONCURRENCY', default=4)
+MEETING_LLM_TIMEOUT = env.float('MEETING_LLM_TIMEOUT', default=120.0)
+
+# 섹션 요약 프롬프트 최대 토큰 수 (넘으면 화자 발화 단위로 나눠 요약 후 합침) / 나눌 때 조각 크기
+MEETING_LLM_MAX_PROMPT_TOKENS = env.int('MEETING_LLM_MAX_PROMPT_TOKENS', default=6000)
+MEETING_LLM_CHUNK_TOKENS = env.int('MEETING_LLM_CHUNK_TOKENS', default=3000)
+
+# 작성 중인 회의록 DB 기록 최소 간격(초) / SSE 스트림 확인 간격(초) / SSE 스트림 최대 유지 시간(초)
+MEETING_MINUTES_FLUSH_INTERVAL = env.float('MEETING_MINUTES_FLUSH_INTERVAL', default=1.0)
+MEETING_MINUTES_POLL_INTERVAL = env.float('MEETING_MINUTES_POLL_INTERVAL', default=0.5)
+MEETING_MINUTES_STREAM_TIMEOUT = env.float('MEETING_MINUTES_STREAM_TIMEOUT', default=30 * 60.0)
+
+# 요약 프롬프트/응답 캐시 (로컬 디스크, LRU): 유효 기간(초) / 최대 크기
+MEETING_LLM_CACHE = env.bool('MEETING_LLM_CACHE', default=True)
+MEETING_LLM_CACHE_ROOT = env('MEETING_LLM_CACHE_ROOT', default=str(BASE_DIR / 'meetings' / 'cache' / 'llm'))
+MEETING_LLM_CACHE_TTL = env.int('MEETING_LLM_CACHE_TTL', default=7 * 24 * 60 * 60)
+MEETING_LLM_CACHE_MAX_BYTES = env.int('MEETING_LLM_CACHE_MAX_BYTES', default=64 * 1024 * 1024)
+
+# 워커 프로세스에서 사용할 모델 ('asr', 'diarizer', 'sentence')
+MEETING_MODELS = env.list('MEETING_MODELS', default=['diarizer', 'sentence'] + (['asr'] if MEETING_STT_BACKEND == 'nemo' else []))
+MEETING_WARM_MODELS = env.bool('MEETING_WARM_MODELS', default=True)
+MEETING_ASR_MODEL = env('MEETING_ASR_MODEL', default='eesungkim/stt_kr_conformer_transducer_large')
+
+# 화자 분리/STT 전 무음 제거 (에너지 기반 VAD): 임계값(dBFS) / 이어 붙일 최소 무음 길이(초) / 구간 여유(초)
+MEETING_VAD = env.bool('MEETING_VAD', default=True)
+MEETING_VAD_THRESHOLD_DB = env.float('MEETING_VAD_THRESHOLD_DB', default=-45.0)
+MEETING_VAD_MIN_SILENCE = env.float('MEETING_VAD_MIN_SILENCE', default=0.5)
+MEETING_VAD_PAD = env.float('MEETING_VAD_PAD', default=0.2)
+
+# 같은 화자 세그먼트 합치기: 최대 간격(초) / 합친 세그먼트 최대 길이(초)
+MEETING_TURN_MERGE_GAP = env.float('MEETING_TURN_MERGE_GAP', default=0.5)
+MEETING_TURN_MAX_DURATION = env.float('MEETING_TURN_MAX_DURATION', default=30.0)
+
+# STT 요청 동시성 / 초당 요청 수 / 요청별 타임아웃(초) / 재시도 횟수 / 백오프 기본값(초)
+MEETING_STT_CONCURRENCY = env.int('MEETING_STT_CONCURRENCY', default=8)
+MEETING_STT_RATE = env.float('MEETING_STT_RATE', default=10.0)
+MEETING_STT_TIMEOUT = env.float('MEETING_STT_TIMEOUT', default=30.0)
+MEETING_STT_RETRIES = env.int('MEETING_STT_RETRIES', default=3)
+MEETING_STT_BACKOFF = env.float('MEETING_STT_BACKOFF', default=0.5)
+
+# 세그먼트별 STT 결과 캐시 (로컬 디스크, LRU)
+MEETING_STT_CACHE = env.bool('MEETING_STT_CACHE', default=True)
+MEETING_STT_CACHE_ROOT = env('MEETING_STT_CACHE_ROOT', default=str(BASE_DIR / 'meetings' / 'cache' / 'stt'))
+MEETING_STT_CACHE_MAX_BYTES = env.int('MEETING_STT_CACHE_MAX_BYTES', default=256 * 1024 * 1024)
+
+# 전사 세그먼트 bulk_create 배치 크기
+MEETING_TRANSCRIPT_BATCH_SIZE = env.int('MEETING_TRANSCRIPT_BATCH_SIZE', default=500)
+
+# NeMo 백엔드 배치 크기 / CPU 스레드 수 (미설정 시 섹션 워커에 할당된 스레드 수 사용)
+MEETING_NEMO_BATCH_SIZE = env.int('MEETING_NEMO_BATCH_SIZE', default=16)
+MEETING_NEMO_THREADS = env.int('MEETING_NEMO_THREADS', default=None)
+
+# 섹션 병렬 처리 프로세스 수 / 회의 하나가 사용할 전체 CPU 스레드 수
+MEETING_SECTION_WORKERS = env.int('MEETING_SECTION_WORKERS', default=1)
+MEETING_CPU_BUDGET = env.int('MEETING_CPU_BUDGET', default=os.cpu_count() or 1)
+
+
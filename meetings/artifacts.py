@@ -0,0 +1,71 @@
+import mmap
+import os
+from contextlib import contextmanager
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F
+from .models import Artifact
+
+
+def artifact_path(sha256):
+    return os.path.join(settings.MEETING_ARTIFACT_ROOT, sha256[:2], sha256)
+
+
+def ingest_file(path, sha256):
+    """
+    sha256 검증이 끝난 파일을 내용 주소 기반 저장소로 옮기고 참조 카운트를 1 증가시키는 함수.
+    같은 내용의 파일이 이미 저장되어 있으면 원본 파일은 삭제한다.
+    """
+    sha256 = sha256.lower()
+    dest = artifact_path(sha256)
+    os.makedirs(os.path.dirname(dest), exist_ok=True)
+
+    with transaction.atomic():
+        artifact, created = Artifact.objects.select_for_update().get_or_create(
+            sha256=sha256, defaults={'size': os.path.getsize(path)}
+        )
+        if os.path.exists(dest):
+            os.remove(path)
+        else:
+            os.replace(path, dest)
+        Artifact.objects.filter(sha256=sha256).update(ref_count=F('ref_count') + 1)
+
+    return sha256
+
+
+def acquire(sha256):
+    Artifact.objects.filter(sha256=sha256).update(ref_count=F('ref_count') + 1)
+
+
+def release(sha256):
+    """
+    참조 카운트를 1 감소시키고, 더 이상 참조가 없으면 파일과 레코드를 삭제하는 함수.
+    """
+    with transaction.atomic():
+        try:
+            artifact = Artifact.objects.select_for_update().get(sha256=sha256)
+        except Artifact.DoesNotExist:
+            return
+
+        if artifact.ref_count > 1:
+            Artifact.objects.filter(sha256=sha256).update(ref_count=F('ref_count') - 1)
+            return
+
+        artifact.delete()
+        path = artifact_path(sha256)
+        if os.path.exists(path):
+            os.remove(path)
+
+
+@contextmanager
+def open_artifact(sha256):
+    """
+    저장된 파일을 읽기 전용 mmap으로 여는 컨텍스트 매니저.
+    mmap 객체는 read/seek/tell을 지원하므로 soundfile에 파일 객체처럼 바로 넘길 수 있다.
+    """
+    with open(artifact_path(sha256), 'rb') as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            yield mapped
+        finally:
+            mapped.close()
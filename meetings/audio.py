@@ -0,0 +1,301 @@
+import os
+import subprocess
+from contextlib import ExitStack
+import numpy as np
+import soundfile as sf
+import soxr
+
+TARGET_SR = 16000
+
+# 한 번에 읽어들이는 프레임 수 (원본 샘플레이트 기준). 메모리 사용량은 이 값에 의해서만 결정된다.
+BLOCK_FRAMES = 64 * 1024
+
+# 녹음 파일 형식 판별에 필요한 헤더 길이
+HEADER_BYTES = 12
+
+SUPPORTED_FORMATS = ('wav', 'flac', 'ogg', 'mp3')
+
+# int16 오디오를 [-1, 1) float로 바꿀 때 나누는 값 (libsndfile과 같은 기준)
+PCM16_SCALE = 32768
+
+# VAD가 한 번에 float32로 바꿔 에너지를 계산하는 프레임 수 (30ms 프레임 기준 약 2분)
+VAD_BLOCK_FRAMES = 4096
+
+
+def sniff_audio_format(header):
+    """
+    파일 이름 대신 헤더 바이트로 녹음 파일 형식을 판별하는 함수.
+    'wav', 'flac', 'ogg'(Vorbis/Opus), 'mp3' 중 하나 또는 지원하지 않는 형식이면 None을 반환한다.
+    """
+    if header[:4] == b'RIFF' and header[8:12] == b'WAVE':
+        return 'wav'
+    if header[:4] == b'fLaC':
+        return 'flac'
+    if header[:4] == b'OggS':
+        return 'ogg'
+    if header[:3] == b'ID3':
+        return 'mp3'
+    # ID3 태그 없는 MP3: 11비트 프레임 동기 + layer 비트가 00이 아님 (00은 ADTS AAC)
+    if len(header) >= 2 and header[0] == 0xFF and header[1] & 0xE0 == 0xE0 and header[1] & 0x06:
+        return 'mp3'
+    return None
+
+
+def is_soundfile_readable(source):
+    """
+    libsndfile로 열 수 있는 파일인지 확인하는 함수. 파일 객체는 처음 위치로 되돌린다.
+    """
+    try:
+        sf.info(source)
+        return True
+    except RuntimeError:
+        return False
+    finally:
+        if hasattr(source, 'seek'):
+            source.seek(0)
+
+
+def as_float32(sound):
+    """
+    int16 또는 float 오디오 배열을 [-1, 1) 범위의 float32 배열로 반환하는 함수. 이미 float32면 복사하지 않는다.
+    """
+    if sound.dtype == np.int16:
+        out = sound.astype(np.float32)
+        out /= PCM16_SCALE
+        return out
+    return np.asarray(sound, dtype=np.float32)
+
+
+def fill_float32(out, sound):
+    """
+    int16 또는 float 오디오 배열을 [-1, 1) 범위의 float32로 바꿔 out(float32 배열)에 쓰는 함수.
+    변환을 out 안에서 하므로 sound 크기의 임시 float32 배열을 따로 만들지 않는다.
+    """
+    out[...] = sound
+    if sound.dtype == np.int16:
+        out /= PCM16_SCALE
+
+
+def load_audio(path, sr=TARGET_SR, dtype='float32'):
+    """
+    오디오 파일을 sr Hz mono 배열로 읽는 함수. dtype은 'float32' 또는 'int16'이다.
+    헤더를 먼저 확인해 이미 sr Hz mono이면 리샘플링/다운믹스 없이 그대로 읽고,
+    그렇지 않을 때만 다운믹스 후 soxr로 리샘플링한다. (배열, sr)을 반환한다.
+    """
+    info = sf.info(path)
+    if info.samplerate == sr and info.channels == 1:
+        sound, _ = sf.read(path, dtype=dtype)
+        return sound, sr
+
+    sound, file_sr = sf.read(path, dtype='float32', always_2d=True)
+    sound = sound.mean(axis=1, dtype=np.float32) if sound.shape[1] > 1 else sound[:, 0]
+    if file_sr != sr:
+        sound = soxr.resample(sound, file_sr, sr)
+    if dtype == 'int16':
+        sound = (np.clip(sound, -1.0, 1.0 - 1 / PCM16_SCALE) * PCM16_SCALE).astype(np.int16)
+    return sound, sr
+
+
+def split_sections(source, boundaries, save_dir, sr=TARGET_SR, block_frames=BLOCK_FRAMES):
+    """
+    녹음 파일 전체를 디코딩하지 않고 섹션 구간만 블록 단위로 읽어 섹션별 wav 파일로 저장하는 함수.
+    source는 libsndfile이 읽을 수 있는 wav/flac/ogg(Vorbis, Opus)/mp3 파일의 경로 또는 파일 객체(mmap 등),
+    boundaries는 [(시작 초, 종료 초), ...] 형식이다.
+    저장된 섹션 파일 경로 리스트를 반환한다.
+    """
+    section_file_paths = []
+    with sf.SoundFile(source) as record:
+        for idx, (start, end) in enumerate(boundaries):
+            section_audio_path = os.path.join(save_dir, f"section_{idx + 1}.wav")
+            write_section(record, start, end, section_audio_path, sr=sr, block_frames=block_frames)
+            section_file_paths.append(section_audio_path)
+    return section_file_paths
+
+
+def split_sections_ffmpeg(path, boundaries, save_dir, sr=TARGET_SR, block_frames=BLOCK_FRAMES):
+    """
+    libsndfile이 읽지 못하는 코덱을 ffmpeg(pydub이 사용하는 인코더)로 sr Hz mono 16bit PCM 스트림으로 디코딩하면서
+    섹션별 wav 파일로 나누는 함수. 마지막 섹션까지 기록하면 디코딩을 멈춘다. 저장된 섹션 파일 경로 리스트를 반환한다.
+    ffmpeg가 실패하거나 디코딩된 오디오가 마지막 섹션 종료 시각보다 짧으면 RuntimeError를 발생시킨다.
+    """
+    from pydub.utils import get_encoder_name
+
+    ranges = [(int(start * sr), int(end * sr)) for start, end in boundaries]
+    section_file_paths = [os.path.join(save_dir, f"section_{idx + 1}.wav") for idx in range(len(boundaries))]
+    last_sample = max((end for _, end in ranges), default=0)
+
+    command = [get_encoder_name(), '-v', 'error', '-i', path, '-f', 's16le', '-ac', '1', '-ar', str(sr), '-']
+    with ExitStack() as stack:
+        outs = [
+            stack.enter_context(sf.SoundFile(section_audio_path, 'w', samplerate=sr, channels=1, subtype='PCM_16'))
+            for section_audio_path in section_file_paths
+        ]
+        process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        position = 0
+        try:
+            while position < last_sample:
+                data = process.stdout.read(block_frames * 2)
+                if len(data) < 2:
+                    break
+                block = np.frombuffer(data[:len(data) // 2 * 2], dtype='<i2')
+
+                for out, (start, end) in zip(outs, ranges):
+                    lo, hi = max(start, position), min(end, position + len(block))
+                    if lo < hi:
+                        out.write(block[lo - position:hi - position])
+                position += len(block)
+        except BaseException:
+            process.kill()
+            raise
+        finally:
+            # 마지막 섹션까지 기록해 일부러 멈춘 경우에만 ffmpeg를 종료시킨다.
+            # ffmpeg가 실패하면 stdout을 먼저 닫고 종료하므로, 그 외에는 항상 종료를 기다려 종료 코드를 확인한다.
+            stopped = position >= last_sample
+            if stopped:
+                process.kill()
+            process.stdout.close()
+            stderr = process.stderr.read()
+            process.stderr.close()
+            process.wait()
+
+        if not stopped and process.returncode != 0:
+            raise RuntimeError(f"ffmpeg 디코딩 실패: {stderr.decode(errors='replace').strip()}")
+        if position < last_sample:
+            raise RuntimeError(f"ffmpeg 디코딩 결과({position / sr:.1f}초)가 섹션 구간({last_sample / sr:.1f}초)보다 짧습니다.")
+
+    return section_file_paths
+
+
+def write_section(record, start, end, path, sr=TARGET_SR, block_frames=BLOCK_FRAMES):
+    """
+    열려 있는 SoundFile에서 [start, end) 초 구간을 16kHz mono wav로 저장하는 함수.
+    스테레오 입력은 블록마다 mono로 다운믹스하고, 샘플레이트가 다를 때만 스트리밍 리샘플링한다.
+    입력이 이미 sr Hz mono이면 float 변환 없이 int16 그대로 복사한다.
+    """
+    start_frame = min(max(int(start * record.samplerate), 0), record.frames)
+    end_frame = min(max(int(end * record.samplerate), start_frame), record.frames)
+    record.seek(start_frame)
+
+    resampler = None
+    if record.samplerate != sr:
+        resampler = soxr.ResampleStream(record.samplerate, sr, 1, dtype='float32')
+    passthrough = resampler is None and record.channels == 1
+
+    with sf.SoundFile(path, 'w', samplerate=sr, channels=1, subtype='PCM_16') as out:
+        remaining = end_frame - start_frame
+        while remaining > 0:
+            if passthrough:
+                block = record.read(min(block_frames, remaining), dtype='int16')
+                if not len(block):
+                    break
+                remaining -= len(block)
+                out.write(block)
+                continue
+
+            block = record.read(min(block_frames, remaining), dtype='float32', always_2d=True)
+            if not len(block):
+                break
+            remaining -= len(block)
+
+            mono = block.mean(axis=1, dtype=np.float32) if block.shape[1] > 1 else block[:, 0]
+            if resampler is not None:
+                mono = resampler.resample_chunk(mono, last=remaining <= 0)
+            out.write(mono)
+
+        if resampler is not None and remaining > 0:
+            # 파일이 예상보다 일찍 끝난 경우 리샘플러에 남은 샘플을 비운다
+            out.write(resampler.resample_chunk(np.zeros(0, dtype=np.float32), last=True))
+
+
+def detect_speech(sound, sr=TARGET_SR, frame_ms=30, threshold_db=-45.0, dynamic_range_db=45.0, min_silence=0.5, pad=0.2):
+    """
+    프레임 RMS 에너지로 음성 구간을 찾는 벡터화된 VAD 함수. sound는 float 또는 int16 배열이다.
+    프레임 에너지가 max(threshold_db, 최대 에너지 - dynamic_range_db)를 넘으면 음성으로 보고,
+    min_silence초보다 짧은 무음은 음성으로 이어 붙이며, 각 구간 앞뒤로 pad초를 더한다.
+    [[시작 샘플, 종료 샘플), ...] 형태의 (N, 2) 배열을 반환한다.
+    """
+    frame = max(1, int(sr * frame_ms / 1000))
+    num_frames = len(sound) // frame
+    if num_frames == 0:
+        return np.zeros((0, 2), dtype=np.int64)
+
+    # int16 오디오 전체의 float32 복사본을 만들지 않도록 VAD_BLOCK_FRAMES 프레임씩 변환해 에너지를 계산
+    energy = np.empty(num_frames, dtype=np.float32)
+    for block_start in range(0, num_frames, VAD_BLOCK_FRAMES):
+        block_end = min(block_start + VAD_BLOCK_FRAMES, num_frames)
+        frames = as_float32(sound[block_start * frame:block_end * frame]).reshape(-1, frame)
+        energy[block_start:block_end] = np.einsum('ij,ij->i', frames, frames) / frame
+    db = 10 * np.log10(energy + 1e-12)
+    speech = db > max(threshold_db, db.max() - dynamic_range_db)
+
+    # 음성 구간의 시작/끝 프레임 찾기
+    edges = np.diff(np.concatenate(([0], speech.astype(np.int8), [0])))
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)
+    if len(starts) == 0:
+        return np.zeros((0, 2), dtype=np.int64)
+
+    # 짧은 무음으로 나뉜 구간 합치기
+    keep = np.concatenate(([True], (starts[1:] - ends[:-1]) * frame >= min_silence * sr))
+    starts = starts[keep]
+    ends = np.concatenate((ends[:-1][keep[1:]], ends[-1:]))
+
+    pad_samples = int(pad * sr)
+    regions = np.stack((starts * frame - pad_samples, ends * frame + pad_samples), axis=1)
+    regions = np.clip(regions, 0, len(sound))
+
+    # 패딩으로 겹치게 된 구간 합치기
+    merged = [regions[0].tolist()]
+    for start, end in regions[1:].tolist():
+        if start <= merged[-1][1]:
+            merged[-1][1] = max(merged[-1][1], end)
+        else:
+            merged.append([start, end])
+    return np.asarray(merged, dtype=np.int64)
+
+
+class TimeMap:
+    """
+    무음을 제거해 이어 붙인(compact) 오디오와 원본 오디오 사이의 샘플 위치를 변환하는 클래스.
+    regions는 detect_speech가 반환한 원본 기준 음성 구간이다.
+    """
+
+    def __init__(self, regions):
+        self.regions = np.asarray(regions, dtype=np.int64).reshape(-1, 2)
+        lengths = self.regions[:, 1] - self.regions[:, 0]
+        self.compact_starts = np.cumsum(lengths) - lengths
+        self.compact_length = int(lengths.sum())
+
+    def compact(self, sound, dtype=None):
+        """
+        음성 구간만 이어 붙인 오디오를 반환한다. dtype=np.float32이면 구간마다 float32로 바꿔 쓰므로
+        int16 오디오를 화자 분리에 넘길 때 원본 길이의 float32 복사본이나 int16 compact 배열을 따로 만들지 않는다.
+        """
+        if dtype is None:
+            if len(self.regions) == 0:
+                return sound[:0]
+            return np.concatenate([sound[start:end] for start, end in self.regions])
+
+        out = np.empty(self.compact_length, dtype=dtype)
+        for (start, end), compact_start in zip(self.regions.tolist(), self.compact_starts.tolist()):
+            fill_float32(out[compact_start:compact_start + end - start], sound[start:end])
+        return out
+
+    def to_original(self, compact_sample):
+        idx = max(0, int(np.searchsorted(self.compact_starts, compact_sample, side='right')) - 1)
+        return int(self.regions[idx, 0] + (compact_sample - self.compact_starts[idx]))
+
+    def slice(self, sound, start, end):
+        """
+        원본 기준 [start, end) 구간에서 음성 구간만 남긴 오디오를 반환한다. 구간이 하나면 복사 없이 view를 반환한다.
+        """
+        parts = [
+            (max(start, region_start), min(end, region_end))
+            for region_start, region_end in self.regions.tolist()
+            if region_start < end and region_end > start
+        ]
+        if len(parts) == 1:
+            return sound[parts[0][0]:parts[0][1]]
+        if not parts:
+            return sound[:0]
+        return np.concatenate([sound[s:e] for s, e in parts])
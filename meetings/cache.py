@@ -0,0 +1,91 @@
+import json
+import os
+import tempfile
+import time
+
+
+class DiskCache:
+    """
+    로컬 디스크에 JSON 값을 저장하는 키-값 캐시.
+    파일의 mtime을 마지막 사용 시각으로 사용하며, 전체 크기가 max_bytes를 넘으면 오래 사용하지 않은 항목부터 삭제한다(LRU).
+    ttl(초)을 지정하면 저장된 지 ttl이 지난 항목은 없는 것으로 취급한다.
+    여러 프로세스가 같은 폴더를 공유해도 되도록 쓰기는 임시 파일 + os.replace로 처리한다.
+    """
+
+    EVICT_EVERY = 64
+
+    def __init__(self, root, max_bytes, ttl=None):
+        self.root = root
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._writes = 0
+
+    def _path(self, key):
+        return os.path.join(self.root, key[:2], f"{key}.json")
+
+    def get(self, key, default=None):
+        path = self._path(key)
+        try:
+            with open(path) as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            self.misses += 1
+            return default
+
+        if self.ttl is not None and time.time() - entry['created'] > self.ttl:
+            self._remove(path)
+            self.misses += 1
+            return default
+
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        self.hits += 1
+        return entry['value']
+
+    def set(self, key, value):
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+        with os.fdopen(fd, 'w') as f:
+            json.dump({'created': time.time(), 'value': value}, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+        self._writes += 1
+        if self._writes % self.EVICT_EVERY == 0:
+            self.evict()
+
+    def evict(self):
+        entries = []
+        total = 0
+        for dirpath, _, filenames in os.walk(self.root):
+            for filename in filenames:
+                if not filename.endswith('.json'):
+                    continue
+                path = os.path.join(dirpath, filename)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+                total += stat.st_size
+
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            self._remove(path)
+            total -= size
+
+    def _remove(self, path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def stats(self):
+        return {'hits': self.hits, 'misses': self.misses}
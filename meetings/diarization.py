@@ -0,0 +1,147 @@
+from dataclasses import dataclass
+import numpy as np
+import torch
+from .audio import as_float32
+
+
+@dataclass
+class Segment:
+    """
+    화자 분리 결과 한 구간. audio는 섹션 배열의 view(복사 없음)이다.
+    """
+    index: int
+    speaker: int
+    start_sample: int
+    end_sample: int
+    audio: np.ndarray
+
+    @property
+    def name(self):
+        return f"diar{str(self.index).zfill(3)}_speaker{self.speaker}"
+
+
+def diarize_section(diar, sound, sr, max_speakers, initial_speakers=2, silence_tolerance=0.2):
+    """
+    simple_diarizer의 diarize()를 단계별로 풀어서 VAD와 x-vector 임베딩을 한 번만 계산하는 함수.
+    초기 클러스터링으로 화자 수를 추정한 뒤, 참석자 수(max_speakers)로 제한해야 할 때만
+    같은 임베딩으로 다시 클러스터링한다.
+    sound는 16kHz mono float 또는 int16 배열이며, (segments, num_speakers, centroids)를 반환한다.
+    centroids는 {화자 번호: 그 화자 x-vector 임베딩의 평균}으로, 따로 화자 분리한 구간끼리 화자를 이을 때 사용한다.
+    """
+    signal = torch.from_numpy(np.ascontiguousarray(as_float32(sound)))[None, :]
+
+    speech_ts = diar.vad(signal[0])
+    if len(speech_ts) == 0:
+        return [], 0, {}
+
+    embeds, segments = diar.recording_embeds(signal, sr, speech_ts)
+
+    labels = cluster(diar, embeds, initial_speakers)
+    detected_speakers = len(set(labels))
+    num_speakers = max(1, min(max_speakers, detected_speakers))
+
+    if num_speakers != detected_speakers:
+        labels = cluster(diar, embeds, num_speakers)
+
+    cleaned_segments = diar.join_segments(labels, segments)
+    cleaned_segments = diar.make_output_seconds(cleaned_segments, sr)
+    cleaned_segments = diar.join_samespeaker_segments(cleaned_segments, silence_tolerance=silence_tolerance)
+
+    labels = np.asarray(labels)
+    centroids = {int(label): np.asarray(embeds)[labels == label].mean(axis=0) for label in np.unique(labels)}
+    return cleaned_segments, num_speakers, centroids
+
+
+def cluster(diar, embeds, n_clusters):
+    n_clusters = min(n_clusters, len(embeds))
+    if n_clusters <= 1:
+        return np.zeros(len(embeds), dtype=int)
+    return diar.cluster(embeds, n_clusters=n_clusters, threshold=None, enhance_sim=True)
+
+
+def to_segments(diar_segments, sound, time_map=None):
+    """
+    diarize_section 결과를 섹션 배열의 slice를 담은 Segment 리스트로 변환하는 함수.
+    time_map이 주어지면 구간 중 무음으로 판정된 부분은 제외한 오디오를 담는다.
+    """
+    segments = []
+    for index, seg_ in enumerate(diar_segments):
+        start_sample = seg_['start_sample']
+        end_sample = seg_['end_sample'] + 1
+        segments.append(Segment(
+            index=index,
+            speaker=int(seg_['label']),
+            start_sample=start_sample,
+            end_sample=end_sample,
+            audio=sound[start_sample:end_sample] if time_map is None else time_map.slice(sound, start_sample, end_sample),
+        ))
+    return segments
+
+
+def merge_turns(diar_segments, sr, max_gap, max_duration):
+    """
+    같은 화자의 연속된 세그먼트 사이 간격이 max_gap초 이하이면 하나로 합치는 함수.
+    합친 세그먼트 길이는 max_duration초를 넘지 않는다. 화자 정보는 바뀌지 않는다.
+    (합친 세그먼트 리스트, 줄어든 STT 요청 수)를 반환한다.
+    """
+    merged = []
+    for seg_ in diar_segments:
+        if merged:
+            last = merged[-1]
+            gap = seg_['start_sample'] - last['end_sample']
+            if (
+                last['label'] == seg_['label']
+                and gap <= max_gap * sr
+                and seg_['end_sample'] - last['start_sample'] <= max_duration * sr
+            ):
+                last['end_sample'] = max(last['end_sample'], seg_['end_sample'])
+                continue
+        merged.append(dict(seg_))
+    return merged, len(diar_segments) - len(merged)
+
+
+def link_speakers(embeddings, groups, max_speakers, min_similarity):
+    """
+    구간(group)마다 따로 클러스터링한 화자 임베딩들을 회의 전체 화자로 묶는 함수 (average linkage 병합 클러스터링).
+    코사인 유사도가 가장 높은 클러스터부터 합치며, 유사도가 min_similarity보다 낮아지면 멈춘다.
+    클러스터 수가 max_speakers보다 많으면 유사도와 상관없이 계속 합친다.
+    같은 구간의 화자끼리는 화자 분리에서 이미 다른 사람으로 나뉜 것이므로 합치지 않는다.
+    입력 순서대로 0부터 시작하는 화자 번호 리스트를 반환한다.
+    """
+    n = len(embeddings)
+    if n == 0:
+        return []
+
+    x = np.asarray(embeddings, dtype=np.float64)
+    x /= np.linalg.norm(x, axis=1, keepdims=True) + 1e-12
+    similarity = x @ x.T
+    groups = np.asarray(groups)
+    # 합칠 수 없는 쌍은 -inf로 두면 average linkage 갱신에서도 -inf로 남는다
+    similarity[groups[:, None] == groups[None, :]] = -np.inf
+
+    sizes = np.ones(n)
+    members = [[i] for i in range(n)]
+    active = np.ones(n, dtype=bool)
+    count = n
+    while count > 1:
+        masked = np.where(active[:, None] & active[None, :], similarity, -np.inf)
+        a, b = np.unravel_index(np.argmax(masked), masked.shape)
+        score = masked[a, b]
+        if score == -np.inf or (score < min_similarity and count <= max_speakers):
+            break
+
+        with np.errstate(invalid='ignore'):
+            merged = (sizes[a] * similarity[a] + sizes[b] * similarity[b]) / (sizes[a] + sizes[b])
+        similarity[a, :] = merged
+        similarity[:, a] = merged
+        similarity[a, a] = -np.inf
+        sizes[a] += sizes[b]
+        members[a] += members[b]
+        active[b] = False
+        count -= 1
+
+    labels = [0] * n
+    for label, idx in enumerate(np.flatnonzero(active)):
+        for i in members[idx]:
+            labels[i] = label
+    return labels
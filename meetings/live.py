@@ -0,0 +1,145 @@
+import os
+from bisect import bisect_right
+from itertools import batched
+import numpy as np
+from django.conf import settings
+from django.db import transaction
+from .audio import TARGET_SR, as_float32
+from .diarization import link_speakers
+from .models import LiveTranscription, LiveWindowSpeaker, TranscriptSegment
+from .pipeline import diarize_audio, transcribe_audio, format_speaker_texts
+
+# 실시간 전사 오디오 형식: 16kHz mono 16bit little-endian PCM
+SAMPLE_WIDTH = 2
+
+# 실시간 전사 회의의 처리 단계 체크포인트에 record_artifact 대신 사용하는 값
+LIVE_ARTIFACT = 'live'
+
+
+def live_path(meeting_id):
+    return os.path.join(settings.MEETING_LIVE_ROOT, f"meeting_{meeting_id}.pcm")
+
+
+def window_samples():
+    return settings.MEETING_LIVE_WINDOW_SECONDS * TARGET_SR
+
+
+def schedule_windows(live, final=False):
+    """
+    아직 처리 예약되지 않은 오디오를 window 단위로 잘라 [(시작 샘플, 종료 샘플), ...]로 반환하고
+    scheduled_samples와 pending_windows를 갱신하는 함수. final이면 window보다 짧은 마지막 구간도 포함한다.
+    live는 select_for_update로 잠근 상태여야 한다.
+    """
+    total_samples = live.received_bytes // SAMPLE_WIDTH
+    windows = []
+    while total_samples - live.scheduled_samples >= window_samples() or (final and total_samples > live.scheduled_samples):
+        end_sample = min(live.scheduled_samples + window_samples(), total_samples)
+        windows.append((live.scheduled_samples, end_sample))
+        live.pending_windows.append([live.scheduled_samples, end_sample])
+        live.scheduled_samples = end_sample
+    live.save()
+    return windows
+
+
+def read_window(meeting_id, start_sample, end_sample):
+    pcm = np.memmap(live_path(meeting_id), dtype='<i2', mode='r')
+    if settings.MEETING_AUDIO_DTYPE == 'int16':
+        return np.array(pcm[start_sample:end_sample], dtype=np.int16)
+    return as_float32(pcm[start_sample:end_sample])
+
+
+def process_window(meeting, start_sample, end_sample, num_speakers):
+    """
+    실시간 전사 오디오의 한 window를 화자 분리/STT 처리해 섹션 없이 TranscriptSegment로 저장하는 함수.
+    start/end는 회의 시작 기준 초 단위이며, 회의 종료 시 assign_sections에서 섹션 기준으로 바뀐다.
+    화자 번호는 window마다 따로 클러스터링한 결과이며, 화자별 임베딩 평균을 LiveWindowSpeaker로 함께 저장한다.
+    결과 저장과 pending_windows에서 window를 지우는 것은 한 트랜잭션에서 하며, 이미 다른 작업이 저장한 window이면
+    결과를 버리고 None을 반환한다.
+    """
+    sound = read_window(meeting.id, start_sample, end_sample)
+    diarization = diarize_audio(sound, TARGET_SR, num_speakers)
+    transcription = transcribe_audio(sound, TARGET_SR, diarization)
+
+    offset = start_sample / TARGET_SR
+    with transaction.atomic():
+        live = LiveTranscription.objects.select_for_update().get(meeting=meeting)
+        if [start_sample, end_sample] not in live.pending_windows:
+            return None
+
+        TranscriptSegment.objects.bulk_create([
+            TranscriptSegment(
+                meeting=meeting,
+                speaker=segment['speaker'],
+                start=segment['start'] + offset,
+                end=segment['end'] + offset,
+                text=segment['text'],
+            )
+            for segment in transcription['segments']
+        ])
+        LiveWindowSpeaker.objects.bulk_create([
+            LiveWindowSpeaker(meeting=meeting, start_sample=start_sample, speaker=speaker, embedding=embedding)
+            for speaker, embedding in diarization['speaker_embeddings']
+        ])
+        live.pending_windows.remove([start_sample, end_sample])
+        live.processed_samples += end_sample - start_sample
+        live.save(update_fields=['pending_windows', 'processed_samples', 'updated_at'])
+
+    return transcription
+
+
+def link_window_speakers(meeting, max_speakers):
+    """
+    window마다 따로 매긴 화자를 임베딩 유사도로 묶어 {(window 시작 샘플, window 화자 번호): 회의 화자 번호}를 반환하는 함수.
+    회의 화자 수는 max_speakers(참석자 수)를 넘지 않는다.
+    """
+    window_speakers = list(LiveWindowSpeaker.objects.filter(meeting=meeting).order_by('start_sample', 'speaker'))
+    labels = link_speakers(
+        [window_speaker.embedding for window_speaker in window_speakers],
+        [window_speaker.start_sample for window_speaker in window_speakers],
+        max_speakers=max(1, max_speakers),
+        min_similarity=settings.MEETING_LIVE_SPEAKER_SIMILARITY,
+    )
+    return {
+        (window_speaker.start_sample, window_speaker.speaker): label
+        for window_speaker, label in zip(window_speakers, labels)
+    }
+
+
+def assign_sections(meeting, boundaries, max_speakers, batch_size=None):
+    """
+    실시간 전사로 저장된 세그먼트에 섹션을 지정하고 시간을 섹션 시작 기준으로 바꾼 뒤,
+    섹션별 "speaker0: ... ," 형식 텍스트 리스트를 반환하는 함수.
+    window마다 따로 매긴 화자 번호는 link_window_speakers로 회의 전체 화자로 묶은 뒤, 처음 등장한 순서대로 다시 번호를 매긴다.
+    임베딩이 없는 window의 화자는 다른 화자와 묶지 않는다.
+    """
+    if not boundaries:
+        return []
+
+    batch_size = batch_size or settings.MEETING_TRANSCRIPT_BATCH_SIZE
+    sections = list(meeting.sections.order_by('id'))
+    stt_dicts = [{} for _ in boundaries]
+
+    linked = link_window_speakers(meeting, max_speakers)
+    window_starts = sorted({start_sample for start_sample, _ in linked})
+
+    speakers = {}
+    segments = list(TranscriptSegment.objects.filter(meeting=meeting, section__isnull=True).order_by('start', 'id'))
+    for segment in segments:
+        position = bisect_right(window_starts, round(segment.start * TARGET_SR)) - 1
+        window_speaker = (window_starts[position] if position >= 0 else None, segment.speaker)
+        key = ('linked', linked[window_speaker]) if window_speaker in linked else ('window', *window_speaker)
+        segment.speaker = speakers.setdefault(key, len(speakers))
+        midpoint = (segment.start + segment.end) / 2
+        idx = next((i for i, (_, end) in enumerate(boundaries) if midpoint < end), len(boundaries) - 1)
+        section_start = boundaries[idx][0]
+
+        segment.section = sections[idx] if idx < len(sections) else None
+        segment.start -= section_start
+        segment.end -= section_start
+        stt_dicts[idx].setdefault(segment.speaker, []).append(segment.text)
+
+    with transaction.atomic():
+        for batch in batched(segments, batch_size):
+            TranscriptSegment.objects.bulk_update(batch, ['section', 'speaker', 'start', 'end'])
+
+    return [format_speaker_texts(dict(sorted(stt_dict.items()))) for stt_dict in stt_dicts]
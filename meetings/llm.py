@@ -0,0 +1,302 @@
+import asyncio
+import hashlib
+import json
+import random
+import threading
+from django.conf import settings
+from .cache import DiskCache
+
+# 재시도할 HTTP 상태 코드 (요청 한도 초과, 서버 오류)
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+class LLMError(Exception):
+    pass
+
+
+class WorkerLoop:
+    """
+    워커 프로세스마다 하나씩 유지하는 이벤트 루프. 백그라운드 스레드에서 계속 실행되므로
+    작업마다 asyncio.run으로 새 루프를 만들지 않고 HTTP 세션(연결 풀)을 작업 사이에 재사용할 수 있다.
+    """
+
+    def __init__(self):
+        self._loop = None
+        self._lock = threading.Lock()
+
+    def loop(self):
+        with self._lock:
+            if self._loop is None or self._loop.is_closed():
+                self._loop = asyncio.new_event_loop()
+                threading.Thread(target=self._loop.run_forever, name='llm-loop', daemon=True).start()
+        return self._loop
+
+    def run(self, coro):
+        return asyncio.run_coroutine_threadsafe(coro, self.loop()).result()
+
+
+worker_loop = WorkerLoop()
+
+
+def run_async(coro):
+    """
+    동기 코드(백그라운드 작업)에서 코루틴을 워커 이벤트 루프로 실행하고 결과를 기다리는 함수.
+    """
+    return worker_loop.run(coro)
+
+
+class LLMClient:
+    """
+    OpenAI 호환 Chat Completions API 클라이언트. 워커 이벤트 루프에서 aiohttp 세션 하나를 계속 사용하며,
+    동시 연결은 max_connections개로 제한한다. 429/5xx 응답과 연결 오류는 지수 백오프 + jitter로 retries번까지 재시도하고,
+    Retry-After 헤더가 있으면 그 시간만큼 기다린다. 스트리밍 요청은 첫 조각을 받기 전까지만 재시도한다.
+    """
+
+    def __init__(self, base_url, api_key, max_connections, connect_timeout, read_timeout, retries, backoff):
+        self.base_url = base_url.rstrip('/')
+        self.api_key = api_key
+        self.max_connections = max_connections
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.retries = retries
+        self.backoff = backoff
+        self._session = None
+
+    def session(self):
+        import aiohttp
+
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.max_connections),
+                timeout=aiohttp.ClientTimeout(sock_connect=self.connect_timeout, sock_read=self.read_timeout),
+                headers={'Authorization': f"Bearer {self.api_key}"},
+            )
+        return self._session
+
+    async def close(self):
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+
+    def delay(self, attempt, retry_after=None):
+        try:
+            return float(retry_after)
+        except (TypeError, ValueError):
+            return self.backoff * (2 ** attempt) + random.uniform(0, self.backoff)
+
+    async def request(self, payload, on_attempt=None):
+        """
+        재시도 정책을 적용해 요청을 보내고, 성공한 응답(aiohttp.ClientResponse)을 반환하는 함수.
+        반환된 응답은 호출한 쪽에서 release해야 한다.
+        """
+        import aiohttp
+
+        for attempt in range(self.retries + 1):
+            if on_attempt:
+                on_attempt()
+            retry_after = None
+            try:
+                response = await self.session().post(f"{self.base_url}/chat/completions", json=payload)
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                error = LLMError(f"LLM 요청 실패: {e!r}")
+            else:
+                if response.status < 400:
+                    return response
+                body = await response.text()
+                retry_after = response.headers.get('Retry-After')
+                response.release()
+                error = LLMError(f"LLM 요청 실패 ({response.status}): {body[:200]}")
+                if response.status not in RETRY_STATUSES:
+                    raise error
+
+            if attempt == self.retries:
+                raise error
+            await asyncio.sleep(self.delay(attempt, retry_after))
+
+    async def chat(self, model, messages, on_attempt=None):
+        response = await self.request({'model': model, 'messages': messages}, on_attempt)
+        try:
+            data = await response.json()
+        finally:
+            response.release()
+        return data['choices'][0]['message']['content']
+
+    async def chat_stream(self, model, messages, on_attempt=None):
+        response = await self.request({'model': model, 'messages': messages, 'stream': True}, on_attempt)
+        try:
+            async for line in response.content:
+                line = line.decode().strip()
+                if not line.startswith('data:'):
+                    continue
+                data = line[len('data:'):].strip()
+                if data == '[DONE]':
+                    break
+                delta = json.loads(data)['choices'][0]['delta'].get('content')
+                if delta:
+                    yield delta
+        finally:
+            response.release()
+
+
+_llm_client = None
+
+
+def get_llm_client():
+    """
+    워커 프로세스에서 공유하는 LLMClient를 반환하는 함수. 세션은 워커 이벤트 루프 안에서 처음 요청할 때 만든다.
+    """
+    global _llm_client
+    if _llm_client is None:
+        _llm_client = LLMClient(
+            base_url=settings.MEETING_LLM_API_BASE,
+            api_key=settings.MEETING_LLM_API_KEY,
+            max_connections=settings.MEETING_LLM_MAX_CONNECTIONS,
+            connect_timeout=settings.MEETING_LLM_CONNECT_TIMEOUT,
+            read_timeout=settings.MEETING_LLM_READ_TIMEOUT,
+            retries=settings.MEETING_LLM_RETRIES,
+            backoff=settings.MEETING_LLM_BACKOFF,
+        )
+    return _llm_client
+
+
+class LLMBackend:
+    """
+    회의록 요약에 사용하는 LLM 백엔드 인터페이스. complete()는 시스템 프롬프트와 사용자 프롬프트를 받아 응답 텍스트를 반환하고,
+    stream()은 응답을 생성되는 대로 조각(delta) 단위로 내보내는 async generator이다.
+    calls는 지금까지 외부 서비스에 보낸 요청 수이다.
+    """
+    name = None
+
+    def __init__(self):
+        self.calls = 0
+
+    def config(self):
+        return {}
+
+    async def complete(self, system_prompt, prompt):
+        raise NotImplementedError
+
+    async def stream(self, system_prompt, prompt):
+        yield await self.complete(system_prompt, prompt)
+
+
+class OpenAILLMBackend(LLMBackend):
+    name = 'openai'
+
+    def __init__(self, client=None):
+        super().__init__()
+        self.client = client or get_llm_client()
+
+    def config(self):
+        return {'model': settings.MEETING_LLM_MODEL}
+
+    def messages(self, system_prompt, prompt):
+        return [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": prompt}
+        ]
+
+    def count_call(self):
+        self.calls += 1
+
+    async def complete(self, system_prompt, prompt):
+        return await self.client.chat(settings.MEETING_LLM_MODEL, self.messages(system_prompt, prompt), self.count_call)
+
+    async def stream(self, system_prompt, prompt):
+        async for delta in self.client.chat_stream(settings.MEETING_LLM_MODEL, self.messages(system_prompt, prompt), self.count_call):
+            yield delta
+
+
+class StubLLMBackend(LLMBackend):
+    """
+    네트워크 없이 파이프라인을 측정하기 위한 백엔드. MEETING_LLM_STUB_LATENCY초 기다린 뒤 고정된 형식의 요약을 반환한다.
+    """
+    name = 'stub'
+
+    async def complete(self, system_prompt, prompt):
+        self.calls += 1
+        await asyncio.sleep(settings.MEETING_LLM_STUB_LATENCY)
+        return self.response(prompt)
+
+    async def stream(self, system_prompt, prompt):
+        self.calls += 1
+        words = self.response(prompt).split(' ')
+        for idx, word in enumerate(words):
+            await asyncio.sleep(settings.MEETING_LLM_STUB_LATENCY / len(words))
+            yield word if idx == 0 else f" {word}"
+
+    def response(self, prompt):
+        return f"- 요약 (프롬프트 {len(prompt)}자)"
+
+
+class CachedLLMBackend(LLMBackend):
+    """
+    백엔드 이름/모델, 시스템 프롬프트, 사용자 프롬프트 해시를 키로 응답을 캐시하는 백엔드 래퍼.
+    바뀌지 않은 섹션을 다시 요약하거나 작업이 재시도되면 LLM을 호출하지 않고 저장된 응답을 반환한다.
+    refresh이면 캐시를 읽지 않고 새로 생성한 응답으로 덮어쓴다.
+    """
+
+    def __init__(self, backend, cache, refresh=False):
+        self.backend = backend
+        self.cache = cache
+        self.refresh = refresh
+        self.name = backend.name
+        self.hits = 0
+
+    @property
+    def calls(self):
+        return self.backend.calls
+
+    def config(self):
+        return self.backend.config()
+
+    def key(self, system_prompt, prompt):
+        digest = hashlib.sha256()
+        digest.update(json.dumps([self.backend.name, self.backend.config(), system_prompt], sort_keys=True, ensure_ascii=False).encode())
+        digest.update(hashlib.sha256(prompt.encode()).digest())
+        return digest.hexdigest()
+
+    async def complete(self, system_prompt, prompt):
+        key = self.key(system_prompt, prompt)
+        if not self.refresh:
+            cached = self.cache.get(key)
+            if cached is not None:
+                self.hits += 1
+                return cached
+
+        response = await self.backend.complete(system_prompt, prompt)
+        self.cache.set(key, response)
+        return response
+
+    async def stream(self, system_prompt, prompt):
+        key = self.key(system_prompt, prompt)
+        if not self.refresh:
+            cached = self.cache.get(key)
+            if cached is not None:
+                self.hits += 1
+                yield cached
+                return
+
+        # 응답을 끝까지 받은 경우에만 캐시에 저장한다
+        parts = []
+        async for delta in self.backend.stream(system_prompt, prompt):
+            parts.append(delta)
+            yield delta
+        self.cache.set(key, ''.join(parts))
+
+
+LLM_BACKENDS = {
+    OpenAILLMBackend.name: OpenAILLMBackend,
+    StubLLMBackend.name: StubLLMBackend,
+}
+
+llm_cache = DiskCache(settings.MEETING_LLM_CACHE_ROOT, settings.MEETING_LLM_CACHE_MAX_BYTES, ttl=settings.MEETING_LLM_CACHE_TTL)
+
+
+def get_llm_backend(name=None, refresh=False):
+    """
+    MEETING_LLM_BACKEND 백엔드를 반환하는 함수. MEETING_LLM_CACHE가 꺼져 있으면 캐시를 사용하지 않는다.
+    """
+    backend = LLM_BACKENDS[name or settings.MEETING_LLM_BACKEND]()
+    if settings.MEETING_LLM_CACHE:
+        backend = CachedLLMBackend(backend, llm_cache, refresh=refresh)
+    return backend
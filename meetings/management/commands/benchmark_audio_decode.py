@@ -0,0 +1,85 @@
+import json
+import os
+import tempfile
+import time
+import tracemalloc
+import numpy as np
+import soundfile as sf
+from django.core.management.base import BaseCommand
+from meetings.audio import TARGET_SR, load_audio
+
+# (이름, 샘플레이트, 채널 수)
+INPUT_FORMATS = [
+    ('16k_mono', 16000, 1),
+    ('44k_stereo', 44100, 2),
+    ('48k_mono', 48000, 1),
+]
+
+
+def librosa_decode(path):
+    """
+    기존 워커의 디코딩 방식: librosa로 항상 리샘플링/float 변환하고, mono는 stereo로 복제한다.
+    """
+    import librosa
+
+    sound, sr_ = librosa.load(path, sr=TARGET_SR, mono=False)
+    if sound.ndim == 1:
+        sound = np.stack([sound, sound])
+    return sound, sr_
+
+
+DECODERS = {
+    'librosa': librosa_decode,
+    'fast_float32': lambda path: load_audio(path, dtype='float32'),
+    'fast_int16': lambda path: load_audio(path, dtype='int16'),
+}
+
+
+def write_synthetic(path, seconds, sr_, channels):
+    t = np.arange(int(seconds * sr_), dtype=np.float32) / sr_
+    tone = 0.3 * np.sin(2 * np.pi * 220 * t) * (1 + np.sin(2 * np.pi * 0.5 * t)) / 2
+    sf.write(path, np.repeat(tone[:, None], channels, axis=1), sr_, subtype='PCM_16')
+
+
+def measure(decode, path, repeat):
+    wall_seconds = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        decode(path)
+        wall_seconds.append(time.perf_counter() - started)
+
+    tracemalloc.start()
+    sound, _ = decode(path)
+    _, peak_bytes = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        'best_seconds': round(min(wall_seconds), 4),
+        'peak_alloc_bytes': peak_bytes,
+        'result_bytes': sound.nbytes,
+        'dtype': str(sound.dtype),
+        'shape': list(sound.shape),
+    }
+
+
+class Command(BaseCommand):
+    help = 'Compare the librosa decode path with the header-aware fast path on synthetic recordings (JSON output).'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--seconds', type=float, default=600.0, help='합성 녹음 길이(초)')
+        parser.add_argument('--repeat', type=int, default=3, help='디코더별 반복 횟수 (최솟값을 기록)')
+        parser.add_argument('--decoders', nargs='+', default=list(DECODERS), choices=list(DECODERS))
+
+    def handle(self, *args, **options):
+        results = {}
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            for name, sr_, channels in INPUT_FORMATS:
+                path = os.path.join(tmp_dir, f"{name}.wav")
+                write_synthetic(path, options['seconds'], sr_, channels)
+
+                results[name] = {
+                    decoder: measure(DECODERS[decoder], path, options['repeat'])
+                    for decoder in options['decoders']
+                }
+
+        self.stdout.write(json.dumps({'seconds': options['seconds'], 'results': results}, indent=2))
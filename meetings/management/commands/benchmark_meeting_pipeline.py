@@ -0,0 +1,181 @@
+import json
+import os
+import tempfile
+import numpy as np
+import soundfile as sf
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.test.utils import override_settings
+
+# 화자별 기본 주파수(Hz). 화자 수가 더 많으면 순서대로 다시 사용하면서 조금씩 높인다.
+SPEAKER_F0 = [110, 150, 205, 250, 130, 180, 230, 270]
+
+FORMATS = {
+    'wav': ('WAV', 'PCM_16'),
+    'flac': ('FLAC', 'PCM_16'),
+    'ogg': ('OGG', 'OPUS'),
+}
+
+
+def speaker_voice(speaker, seconds, sr_, rng):
+    """
+    화자마다 다른 기본 주파수/배음 구성을 가진 합성 음성. 음절 단위(약 4Hz)로 크기가 바뀐다.
+    """
+    f0 = SPEAKER_F0[speaker % len(SPEAKER_F0)] * (1 + 0.05 * (speaker // len(SPEAKER_F0)))
+    t = np.arange(int(seconds * sr_), dtype=np.float32) / sr_
+    pitch = f0 * (1 + 0.03 * np.sin(2 * np.pi * rng.uniform(0.2, 0.6) * t))
+    phase = 2 * np.pi * np.cumsum(pitch) / sr_
+
+    tilt = 0.5 + 0.1 * (speaker % 4)
+    voice = sum(np.sin(harmonic * phase) * tilt ** harmonic for harmonic in range(1, 9))
+    envelope = 0.6 + 0.4 * np.sin(2 * np.pi * rng.uniform(3.0, 5.0) * t)
+    return (0.2 * voice * envelope / np.abs(voice).max()).astype(np.float32)
+
+
+def synthesize_meeting(seconds, num_speakers, sr_, seed=0):
+    """
+    화자들이 2~8초씩 번갈아 말하고 사이사이 0.2~1.5초 무음이 있는 합성 회의 녹음을 만드는 함수.
+    """
+    rng = np.random.default_rng(seed)
+    sound = np.zeros(int(seconds * sr_), dtype=np.float32)
+    position = 0
+    speaker = 0
+    while position < len(sound):
+        position += int(rng.uniform(0.2, 1.5) * sr_)
+        turn = speaker_voice(speaker, rng.uniform(2.0, 8.0), sr_, rng)[:max(0, len(sound) - position)]
+        sound[position:position + len(turn)] = turn
+        position += len(turn)
+        speaker = (speaker + int(rng.integers(1, num_speakers))) % num_speakers if num_speakers > 1 else 0
+    sound += rng.normal(0, 0.002, len(sound)).astype(np.float32)
+    return sound
+
+
+def format_elapsed(date, seconds):
+    """
+    회의 시작 후 경과 시간을 section_end_times 형식('YYYY-MM-DD HH:MM:SS')으로 바꾸는 함수.
+    """
+    seconds = int(seconds)
+    return f"{date} {seconds // 3600:02d}:{seconds % 3600 // 60:02d}:{seconds % 60:02d}"
+
+
+class Command(BaseCommand):
+    help = (
+        'Run process_meeting_data stage by stage on synthetic multi-speaker audio with stub STT/LLM backends '
+        'in a throwaway test database, and print throughput, peak memory and per-stage times as JSON. '
+        'Diarization and sentence models must already be in the local model cache.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--seconds', type=float, default=600.0, help='합성 녹음 길이(초)')
+        parser.add_argument('--speakers', type=int, default=3, help='화자 수 (참석자 수)')
+        parser.add_argument('--sections', type=int, default=3, help='섹션 수 (녹음을 균등하게 나눔)')
+        parser.add_argument('--sample-rate', type=int, default=16000, help='합성 녹음 샘플레이트')
+        parser.add_argument('--channels', type=int, default=1, help='합성 녹음 채널 수')
+        parser.add_argument('--format', choices=list(FORMATS), default='wav', help='합성 녹음 파일 형식')
+        parser.add_argument('--stt', default='stub', help='STT 백엔드 (MEETING_STT_BACKEND)')
+        parser.add_argument('--llm', default='stub', help='LLM 백엔드 (MEETING_LLM_BACKEND)')
+        parser.add_argument('--seed', type=int, default=0)
+        parser.add_argument('--output', help='결과 JSON을 저장할 파일 경로')
+
+    def handle(self, *args, **options):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            overrides = {
+                'MEETING_STT_BACKEND': options['stt'],
+                'MEETING_LLM_BACKEND': options['llm'],
+                'MEETING_STT_CACHE': False,
+                'MEETING_LLM_CACHE': False,
+                'MEETING_UPLOAD_ROOT': os.path.join(tmp_dir, 'uploads'),
+                'MEETING_ARTIFACT_ROOT': os.path.join(tmp_dir, 'artifacts'),
+                'MEETING_WORK_ROOT': os.path.join(tmp_dir, 'work'),
+                'MEETING_OUTPUT_ROOT': os.path.join(tmp_dir, 'output'),
+            }
+            # spawn으로 시작하는 섹션 워커는 환경 변수에서 설정을 다시 읽는다
+            os.environ.update({key: str(value) for key, value in overrides.items()})
+
+            old_name = connection.creation.create_test_db(verbosity=0, autoclobber=True, serialize=False)
+            try:
+                with override_settings(**overrides):
+                    result = self.run_benchmark(tmp_dir, options)
+            finally:
+                connection.creation.destroy_test_db(old_name, verbosity=0)
+
+        output = json.dumps(result, indent=2, ensure_ascii=False)
+        if options['output']:
+            with open(options['output'], 'w') as f:
+                f.write(output)
+        self.stdout.write(output)
+
+    def run_benchmark(self, tmp_dir, options):
+        from accounts.models import CustomUser
+        from organizations.models import Organization
+        from meetings.artifacts import ingest_file
+        from meetings.models import Meeting, MeetingParticipant, Section, ProcessingStageReport
+        from meetings.profiling import StageTimer
+        from meetings.registry import registry
+        from meetings.uploads import file_sha256
+        from meetings.views import process_meeting_data
+
+        seconds, num_speakers, num_sections = options['seconds'], options['speakers'], options['sections']
+
+        # 합성 녹음을 만들어 artifact 저장소에 넣는다
+        sound = synthesize_meeting(seconds, num_speakers, options['sample_rate'], seed=options['seed'])
+        file_format, subtype = FORMATS[options['format']]
+        record_path = os.path.join(tmp_dir, f"record.{options['format']}")
+        sf.write(record_path, np.repeat(sound[:, None], options['channels'], axis=1), options['sample_rate'], format=file_format, subtype=subtype)
+        record_size = os.path.getsize(record_path)
+        record_artifact = file_sha256(record_path)
+        ingest_file(record_path, record_artifact)
+
+        users = [
+            CustomUser.objects.create(email=f"speaker{idx}@benchmark.local", name=f"speaker{idx}")
+            for idx in range(num_speakers)
+        ]
+        organization = Organization.objects.create(name='benchmark', owner=users[0])
+        meeting = Meeting.objects.create(title='benchmark', organization=organization, creator=users[0], is_active='false')
+        for user in users:
+            MeetingParticipant.objects.create(meeting=meeting, user=user)
+        section_titles = [f"section {idx + 1}" for idx in range(num_sections)]
+        for title in section_titles:
+            Section.objects.create(meeting=meeting, name=title)
+
+        date = '2024-12-01'
+        section_end_times = [format_elapsed(date, seconds * (idx + 1) / num_sections) for idx in range(num_sections)]
+
+        registry.warm_up()
+        with StageTimer() as timer:
+            process_meeting_data.now(
+                meeting_id=meeting.id,
+                meeting_title=meeting.title,
+                section_titles=section_titles,
+                section_end_times=section_end_times,
+                start_time=date,
+                record_artifact=record_artifact,
+                num_speakers=num_speakers,
+            )
+
+        stages = {
+            report.stage: {
+                'wall_seconds': round(report.wall_seconds, 3),
+                'cpu_seconds': round(report.cpu_seconds, 3),
+                'peak_rss_bytes': report.peak_rss_bytes,
+                'audio_seconds': report.audio_seconds,
+                'segment_count': report.segment_count,
+                'external_calls': report.external_calls,
+            }
+            for report in ProcessingStageReport.objects.filter(meeting=meeting).order_by('created_at')
+        }
+
+        return {
+            'config': {
+                key: options[key]
+                for key in ('seconds', 'speakers', 'sections', 'sample_rate', 'channels', 'format', 'stt', 'llm', 'seed')
+            },
+            'record_bytes': record_size,
+            'audio_seconds': seconds,
+            'wall_seconds': round(timer.wall_seconds, 3),
+            'cpu_seconds': round(timer.cpu_seconds, 3),
+            'peak_rss_bytes': timer.peak_rss_bytes,
+            'throughput': round(seconds / timer.wall_seconds, 3) if timer.wall_seconds else None,
+            'stages': stages,
+            'models': registry.stats(),
+        }
@@ -0,0 +1,125 @@
+import asyncio
+import json
+import random
+import time
+from django.core.management.base import BaseCommand
+
+
+class FakeOpenAI:
+    """
+    OpenAI 호환 /v1/chat/completions를 흉내 내는 로컬 서버. 응답 지연, 조각 간격, 429/5xx 오류 비율을 조절할 수 있다.
+    GET /stats는 지금까지 받은 요청 수와 상태 코드별 응답 수를 반환한다.
+    """
+
+    def __init__(self, latency, token_delay, tokens, error_rate, seed=None):
+        self.latency = latency
+        self.token_delay = token_delay
+        self.tokens = tokens
+        self.error_rate = error_rate
+        self.random = random.Random(seed)
+        self.requests = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.statuses = {}
+
+    def app(self):
+        from aiohttp import web
+
+        app = web.Application()
+        app.router.add_post('/v1/chat/completions', self.chat_completions)
+        app.router.add_get('/stats', self.stats)
+        return app
+
+    def record(self, status):
+        self.statuses[status] = self.statuses.get(status, 0) + 1
+
+    def content(self, payload):
+        prompt = payload['messages'][-1]['content'] if payload.get('messages') else ''
+        return [f"요약{idx}" if idx else f"- 요약 (프롬프트 {len(prompt)}자)" for idx in range(self.tokens)]
+
+    async def chat_completions(self, request):
+        from aiohttp import web
+
+        self.requests += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            payload = await request.json()
+            await asyncio.sleep(self.latency)
+
+            if self.random.random() < self.error_rate:
+                status = self.random.choice([429, 500, 503])
+                self.record(status)
+                headers = {'Retry-After': '0.1'} if status == 429 else {}
+                return web.json_response({'error': {'message': 'fake error', 'type': 'server_error'}}, status=status, headers=headers)
+
+            words = self.content(payload)
+            created = int(time.time())
+            self.record(200)
+
+            if not payload.get('stream'):
+                await asyncio.sleep(self.token_delay * len(words))
+                return web.json_response({
+                    'id': f"chatcmpl-fake-{self.requests}",
+                    'object': 'chat.completion',
+                    'created': created,
+                    'model': payload.get('model'),
+                    'choices': [{'index': 0, 'message': {'role': 'assistant', 'content': ' '.join(words)}, 'finish_reason': 'stop'}],
+                })
+
+            response = web.StreamResponse(headers={'Content-Type': 'text/event-stream'})
+            await response.prepare(request)
+            for idx, word in enumerate(words):
+                await asyncio.sleep(self.token_delay)
+                chunk = {
+                    'id': f"chatcmpl-fake-{self.requests}",
+                    'object': 'chat.completion.chunk',
+                    'created': created,
+                    'model': payload.get('model'),
+                    'choices': [{'index': 0, 'delta': {'content': word if idx == 0 else f" {word}"}, 'finish_reason': None}],
+                }
+                await response.write(f"data: {json.dumps(chunk, ensure_ascii=False)}\n\n".encode())
+            await response.write(b"data: [DONE]\n\n")
+            await response.write_eof()
+            return response
+        finally:
+            self.in_flight -= 1
+
+    async def stats(self, request):
+        from aiohttp import web
+
+        return web.json_response({
+            'requests': self.requests,
+            'in_flight': self.in_flight,
+            'max_in_flight': self.max_in_flight,
+            'statuses': self.statuses,
+        })
+
+
+class Command(BaseCommand):
+    help = (
+        'Run a local OpenAI-compatible chat completions server for offline load and failure testing. '
+        'Point MEETING_LLM_API_BASE at http://<host>:<port>/v1.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--host', default='127.0.0.1')
+        parser.add_argument('--port', type=int, default=8001)
+        parser.add_argument('--latency', type=float, default=0.5, help='첫 응답까지 지연(초)')
+        parser.add_argument('--token-delay', type=float, default=0.02, help='응답 조각 사이 간격(초)')
+        parser.add_argument('--tokens', type=int, default=50, help='응답 조각 수')
+        parser.add_argument('--error-rate', type=float, default=0.0, help='429/500/503 응답 비율 (0~1)')
+        parser.add_argument('--seed', type=int, default=None)
+
+    def handle(self, *args, **options):
+        from aiohttp import web
+
+        server = FakeOpenAI(
+            latency=options['latency'],
+            token_delay=options['token_delay'],
+            tokens=options['tokens'],
+            error_rate=options['error_rate'],
+            seed=options['seed'],
+        )
+        self.stdout.write(f"Fake OpenAI server: http://{options['host']}:{options['port']}/v1")
+        web.run_app(server.app(), host=options['host'], port=options['port'], print=None)
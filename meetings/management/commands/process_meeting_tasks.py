@@ -0,0 +1,13 @@
+from background_task.management.commands.process_tasks import Command as ProcessTasksCommand
+from django.conf import settings
+from meetings.registry import registry
+
+
+class Command(ProcessTasksCommand):
+    help = 'Load meeting models once, then run the background task queue (same options as process_tasks).'
+
+    def handle(self, *args, **options):
+        if settings.MEETING_WARM_MODELS:
+            registry.warm_up()
+            self.stdout.write(f"Models warmed up: {registry.stats()}")
+        super().handle(*args, **options)
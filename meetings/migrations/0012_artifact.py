@@ -0,0 +1,22 @@
+# Generated by Django 5.1.3 on 2026-10-17 09:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('meetings', '0011_recordingupload'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Artifact',
+            fields=[
+                ('sha256', models.CharField(max_length=64, primary_key=True, serialize=False)),
+                ('size', models.BigIntegerField()),
+                ('ref_count', models.PositiveIntegerField(default=0)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.1.3 on 2026-10-17 11:00
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('meetings', '0012_artifact'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProcessingCheckpoint',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('record_artifact', models.CharField(max_length=64)),
+                ('stage', models.CharField(choices=[('split', 'Split'), ('diarize', 'Diarize'), ('transcribe', 'Transcribe'), ('summarize', 'Summarize'), ('save', 'Save')], max_length=20)),
+                ('data', models.JSONField(blank=True, null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('meeting', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='processing_checkpoints', to='meetings.meeting')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('meeting', 'record_artifact', 'stage'), name='unique_processing_checkpoint')],
+            },
+        ),
+    ]
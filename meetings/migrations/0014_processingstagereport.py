@@ -0,0 +1,30 @@
+# Generated by Django 5.1.3 on 2026-10-17 11:30
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('meetings', '0013_processingcheckpoint'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProcessingStageReport',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('record_artifact', models.CharField(max_length=64)),
+                ('stage', models.CharField(choices=[('split', 'Split'), ('diarize', 'Diarize'), ('transcribe', 'Transcribe'), ('summarize', 'Summarize'), ('save', 'Save')], max_length=20)),
+                ('wall_seconds', models.FloatField()),
+                ('cpu_seconds', models.FloatField()),
+                ('peak_rss_bytes', models.BigIntegerField()),
+                ('audio_seconds', models.FloatField(default=0)),
+                ('segment_count', models.IntegerField(default=0)),
+                ('external_calls', models.IntegerField(default=0)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('meeting', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='processing_reports', to='meetings.meeting')),
+            ],
+        ),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 5.1.3 on 2026-10-17 12:30
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('meetings', '0014_processingstagereport'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TranscriptSegment',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('speaker', models.IntegerField()),
+                ('start', models.FloatField()),
+                ('end', models.FloatField()),
+                ('text', models.TextField()),
+                ('meeting', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='transcript_segments', to='meetings.meeting')),
+                ('section', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='transcript_segments', to='meetings.section')),
+            ],
+        ),
+    ]
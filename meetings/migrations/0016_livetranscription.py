@@ -0,0 +1,26 @@
+# Generated by Django 5.1.3 on 2026-10-17 13:00
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('meetings', '0015_transcriptsegment'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='LiveTranscription',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('received_bytes', models.BigIntegerField(default=0)),
+                ('scheduled_samples', models.BigIntegerField(default=0)),
+                ('processed_samples', models.BigIntegerField(default=0)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('meeting', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='live_transcription', to='meetings.meeting')),
+            ],
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.1.3 on 2026-10-17 15:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('meetings', '0016_livetranscription'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='livetranscription',
+            name='pending_windows',
+            field=models.JSONField(default=list),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.1.3 on 2026-10-17 15:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('meetings', '0017_livetranscription_pending_windows'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='meeting',
+            name='minutes_status',
+            field=models.CharField(choices=[('none', 'None'), ('processing', 'Processing'), ('done', 'Done')], default='none', max_length=10),
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.1.3 on 2026-10-17 18:00
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('meetings', '0018_meeting_minutes_status'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='LiveWindowSpeaker',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('start_sample', models.BigIntegerField()),
+                ('speaker', models.IntegerField()),
+                ('embedding', models.JSONField()),
+                ('meeting', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='live_window_speakers', to='meetings.meeting')),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name='livewindowspeaker',
+            constraint=models.UniqueConstraint(fields=('meeting', 'start_sample', 'speaker'), name='unique_live_window_speaker'),
+        ),
+    ]
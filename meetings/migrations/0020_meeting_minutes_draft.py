@@ -0,0 +1,23 @@
+# Generated by Django 5.1.3 on 2026-10-17 18:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('meetings', '0019_livewindowspeaker'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='meeting',
+            name='minutes_draft',
+            field=models.TextField(blank=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name='meeting',
+            name='minutes_status',
+            field=models.CharField(choices=[('none', 'None'), ('processing', 'Processing'), ('done', 'Done'), ('failed', 'Failed')], default='none', max_length=10),
+        ),
+    ]
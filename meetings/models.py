@@ -1,3 +1,4 @@
+import uuid
 from django.db import models
 from accounts.models import CustomUser
 from organizations.models import Organization
@@ -8,6 +9,26 @@ STATUS_CHOICES = [
     ("false", "False"),
 ]
 
+PROCESSING_STAGE_CHOICES = [
+    ("split", "Split"),
+    ("diarize", "Diarize"),
+    ("transcribe", "Transcribe"),
+    ("summarize", "Summarize"),
+    ("save", "Save"),
+]
+
+MINUTES_STATUS_CHOICES = [
+    ("none", "None"),
+    ("processing", "Processing"),
+    ("done", "Done"),
+    ("failed", "Failed"),
+]
+
+UPLOAD_STATUS_CHOICES = [
+    ("uploading", "Uploading"),
+    ("complete", "Complete"),
+]
+
 
 class Meeting(models.Model):
     title = models.CharField(max_length=255)
@@ -16,6 +37,8 @@ class Meeting(models.Model):
     total_duration = models.DurationField(null=True, blank=True)
     save_minutes = models.BooleanField(default=True)
     meeting_minutes = models.TextField(blank=True, null=True)
+    minutes_draft = models.TextField(blank=True, null=True)
+    minutes_status = models.CharField(max_length=10, choices=MINUTES_STATUS_CHOICES, default="none")
     is_active = models.CharField(max_length=10, choices=STATUS_CHOICES, default="true", blank=True)
 
     attendees = models.ManyToManyField(CustomUser, through='MeetingParticipant')
@@ -43,3 +66,105 @@ class MeetingParticipant(models.Model):
 
     def __str__(self):
         return f"{self.user.username} - {self.meeting.title}"
+
+
+class RecordingUpload(models.Model):
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    meeting = models.ForeignKey(Meeting, related_name='record_uploads', on_delete=models.CASCADE)
+    filename = models.CharField(max_length=255)
+    total_size = models.BigIntegerField()
+    offset = models.BigIntegerField(default=0)
+    sha256 = models.CharField(max_length=64)
+    status = models.CharField(max_length=10, choices=UPLOAD_STATUS_CHOICES, default="uploading")
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.meeting.title} - {self.filename} ({self.offset}/{self.total_size})"
+
+
+class Artifact(models.Model):
+    sha256 = models.CharField(max_length=64, primary_key=True)
+    size = models.BigIntegerField()
+    ref_count = models.PositiveIntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return f"{self.sha256} (refs: {self.ref_count})"
+
+
+class ProcessingCheckpoint(models.Model):
+    meeting = models.ForeignKey(Meeting, related_name='processing_checkpoints', on_delete=models.CASCADE)
+    record_artifact = models.CharField(max_length=64)
+    stage = models.CharField(max_length=20, choices=PROCESSING_STAGE_CHOICES)
+    data = models.JSONField(null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['meeting', 'record_artifact', 'stage'], name='unique_processing_checkpoint'),
+        ]
+
+    def __str__(self):
+        return f"{self.meeting.title} - {self.stage}"
+
+
+class ProcessingStageReport(models.Model):
+    meeting = models.ForeignKey(Meeting, related_name='processing_reports', on_delete=models.CASCADE)
+    record_artifact = models.CharField(max_length=64)
+    stage = models.CharField(max_length=20, choices=PROCESSING_STAGE_CHOICES)
+    wall_seconds = models.FloatField()
+    cpu_seconds = models.FloatField()
+    peak_rss_bytes = models.BigIntegerField()
+    audio_seconds = models.FloatField(default=0)
+    segment_count = models.IntegerField(default=0)
+    external_calls = models.IntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return f"{self.meeting.title} - {self.stage} ({self.wall_seconds:.1f}s)"
+
+
+class TranscriptSegment(models.Model):
+    meeting = models.ForeignKey(Meeting, related_name='transcript_segments', on_delete=models.CASCADE)
+    section = models.ForeignKey(Section, related_name='transcript_segments', on_delete=models.SET_NULL, null=True, blank=True)
+    speaker = models.IntegerField()
+    start = models.FloatField()
+    end = models.FloatField()
+    text = models.TextField()
+
+    def __str__(self):
+        return f"{self.meeting.title} - speaker{self.speaker} ({self.start:.1f}s)"
+
+
+class LiveTranscription(models.Model):
+    meeting = models.OneToOneField(Meeting, related_name='live_transcription', on_delete=models.CASCADE)
+    received_bytes = models.BigIntegerField(default=0)
+    scheduled_samples = models.BigIntegerField(default=0)
+    processed_samples = models.BigIntegerField(default=0)
+    # 예약되었지만 아직 결과가 저장되지 않은 window [[시작 샘플, 종료 샘플], ...]
+    pending_windows = models.JSONField(default=list)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.meeting.title} - live ({self.processed_samples} samples)"
+
+
+class LiveWindowSpeaker(models.Model):
+    """
+    실시간 전사 window 하나에서 화자 분리로 찾은 화자와 그 화자의 x-vector 임베딩 평균.
+    회의 종료 시 window들의 화자를 회의 전체 화자로 묶는 데 사용한다.
+    """
+    meeting = models.ForeignKey(Meeting, related_name='live_window_speakers', on_delete=models.CASCADE)
+    start_sample = models.BigIntegerField()
+    speaker = models.IntegerField()
+    embedding = models.JSONField()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['meeting', 'start_sample', 'speaker'], name='unique_live_window_speaker'),
+        ]
+
+    def __str__(self):
+        return f"{self.meeting.title} - window {self.start_sample} speaker{self.speaker}"
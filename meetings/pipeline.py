@@ -0,0 +1,234 @@
+import shutil
+from itertools import batched
+from django.conf import settings
+from django.db import transaction
+import numpy as np
+import soundfile as sf
+from .artifacts import artifact_path, open_artifact
+from .audio import split_sections, split_sections_ffmpeg, is_soundfile_readable, load_audio, detect_speech, TimeMap
+from .diarization import diarize_section, to_segments, merge_turns
+from .models import ProcessingCheckpoint, ProcessingStageReport, TranscriptSegment
+from .profiling import StageTimer
+from .registry import registry
+from .stt import get_stt_backend
+from .workers import map_sections
+from .workspace import JobWorkspace, output_dir
+
+
+def run_stage(meeting, record_artifact, stage, fn, is_valid=None, measure=None):
+    """
+    단계 결과가 체크포인트로 저장되어 있으면 그대로 반환하고, 없으면 fn()을 실행해 결과를 저장하는 함수.
+    작업이 실패해 재시도되면 마지막으로 완료된 단계 다음부터 다시 진행된다.
+    is_valid가 주어지면 저장된 결과가 아직 사용 가능한지(예: 파일이 남아 있는지) 확인한다.
+    실행한 단계는 측정값을 ProcessingStageReport로 남기며, measure(data)는
+    audio_seconds, segment_count, external_calls 중 필요한 값을 담은 dict를 반환한다.
+    """
+    checkpoint = ProcessingCheckpoint.objects.filter(meeting=meeting, record_artifact=record_artifact, stage=stage).first()
+    if checkpoint and (is_valid is None or is_valid(checkpoint.data)):
+        print(f"[meeting {meeting.id}] '{stage}' 단계 체크포인트를 사용합니다.")
+        return checkpoint.data
+
+    with StageTimer() as timer:
+        data = fn()
+
+    ProcessingStageReport.objects.create(
+        meeting=meeting,
+        record_artifact=record_artifact,
+        stage=stage,
+        wall_seconds=timer.wall_seconds,
+        cpu_seconds=timer.cpu_seconds,
+        peak_rss_bytes=timer.peak_rss_bytes,
+        **(measure(data) if measure else {}),
+    )
+    print(f"[meeting {meeting.id}] '{stage}' 단계 완료: {timer.wall_seconds:.1f}s (CPU {timer.cpu_seconds:.1f}s)")
+
+    ProcessingCheckpoint.objects.update_or_create(
+        meeting=meeting, record_artifact=record_artifact, stage=stage, defaults={'data': data}
+    )
+    return data
+
+
+def clear_checkpoints(meeting_id, record_artifact):
+    """
+    작업이 끝난 뒤(성공했거나 마지막 재시도까지 실패한 뒤) 회의/녹음의 단계 체크포인트와 녹음별 출력 폴더(섹션 파일)를 지우는 함수.
+    체크포인트는 실패한 작업을 재시도할 때만 필요하며, 남겨 두면 같은 녹음을 다시 처리할 때 모든 단계를 건너뛴다.
+    """
+    ProcessingCheckpoint.objects.filter(meeting_id=meeting_id, record_artifact=record_artifact).delete()
+    shutil.rmtree(output_dir(meeting_id, record_artifact), ignore_errors=True)
+
+
+def split_recording(meeting_id, record_artifact, boundaries):
+    """
+    독립된 작업 공간에서 녹음 파일을 섹션별로 나누고, 섹션 파일을 녹음별 출력 폴더로 옮겨 경로 리스트를 반환하는 함수.
+    """
+    with JobWorkspace(meeting_id, record_artifact) as workspace:
+        # 전체 녹음을 디코딩하지 않고 섹션 구간만 블록 단위로 읽어 저장
+        with open_artifact(record_artifact) as record_file:
+            if is_soundfile_readable(record_file):
+                section_file_paths = split_sections(record_file, boundaries, workspace.sections_dir)
+            else:
+                # libsndfile이 지원하지 않는 코덱은 ffmpeg로 스트리밍 디코딩
+                section_file_paths = split_sections_ffmpeg(artifact_path(record_artifact), boundaries, workspace.sections_dir)
+
+        return [workspace.promote(section_audio_path) for section_audio_path in section_file_paths]
+
+
+def diarize_section_file(file_path, max_speakers):
+    """
+    섹션 파일 하나를 화자 분리해 JSON으로 저장 가능한 형태로 반환하는 함수.
+    MEETING_VAD가 켜져 있으면 무음 구간을 잘라낸 오디오로 화자 분리한 뒤, 세그먼트 위치를 원본 기준으로 되돌린다.
+    """
+    print(f"Diarizing {file_path}...")
+    sound_raw, sr_ = load_audio(file_path, dtype=settings.MEETING_AUDIO_DTYPE)
+    return diarize_audio(sound_raw, sr_, max_speakers)
+
+
+def diarize_audio(sound_raw, sr_, max_speakers):
+    time_map = None
+    speech_regions = None
+    sound = sound_raw
+    if settings.MEETING_VAD:
+        speech_regions = detect_speech(
+            sound_raw, sr_,
+            threshold_db=settings.MEETING_VAD_THRESHOLD_DB,
+            min_silence=settings.MEETING_VAD_MIN_SILENCE,
+            pad=settings.MEETING_VAD_PAD,
+        )
+        time_map = TimeMap(speech_regions)
+        # 화자 분리 모델은 float32 입력을 받으므로 음성 구간만 float32로 바꿔 이어 붙인다 (int16 원본의 float32 복사본은 만들지 않는다)
+        sound = time_map.compact(sound_raw, dtype=np.float32)
+        print(f"VAD: {len(sound_raw) / sr_:.1f}s -> {len(sound) / sr_:.1f}s")
+
+    seg, section_speakers, centroids = [], 0, {}
+    if len(sound):
+        # VAD/임베딩은 한 번만 계산하고, 화자 수는 참석자 수로 제한해 재클러스터링
+        seg, section_speakers, centroids = diarize_section(registry.get('diarizer'), sound, sr_, max_speakers=max_speakers)
+
+    to_original = time_map.to_original if time_map else int
+    segments = [
+        {'start_sample': to_original(int(seg_['start_sample'])), 'end_sample': to_original(int(seg_['end_sample'])), 'label': int(seg_['label'])}
+        for seg_ in seg
+    ]
+
+    # 같은 화자의 짧은 간격 세그먼트를 합쳐 STT 요청 수 줄이기
+    segments, merged_turns = merge_turns(
+        segments, sr_,
+        max_gap=settings.MEETING_TURN_MERGE_GAP,
+        max_duration=settings.MEETING_TURN_MAX_DURATION,
+    )
+    print(f"Turn merge: {len(segments) + merged_turns} -> {len(segments)} segments ({merged_turns} STT requests saved)")
+
+    return {
+        'audio_seconds': len(sound_raw) / sr_,
+        'speech_seconds': len(sound) / sr_,
+        'speech_regions': speech_regions.tolist() if speech_regions is not None else None,
+        'num_speakers': section_speakers,
+        'speaker_embeddings': [[label, centroid.tolist()] for label, centroid in sorted(centroids.items())],
+        'merged_turns': merged_turns,
+        'segments': segments,
+    }
+
+
+def transcribe_section_file(file_path, diarization):
+    """
+    화자 분리 결과를 이용해 섹션 파일 하나를 STT 처리하는 함수.
+    "speaker0: ... , speaker1: ... ," 형식의 텍스트와 세그먼트 수, 외부 STT 요청 수를 반환한다.
+    """
+    print(f"Transcribing {file_path}...")
+    sound_raw, sr_ = load_audio(file_path, dtype=settings.MEETING_AUDIO_DTYPE)
+    return transcribe_audio(sound_raw, sr_, diarization)
+
+
+def transcribe_audio(sound_raw, sr_, diarization):
+    # 화자 분리 구간을 파일로 저장하지 않고 섹션 배열의 view로 STT에 전달 (무음 구간은 제외)
+    time_map = TimeMap(diarization['speech_regions']) if diarization.get('speech_regions') is not None else None
+    segments = to_segments(diarization['segments'], sound_raw, time_map)
+    stt_dict = {i: [] for i in range(diarization['num_speakers'])}
+
+    stt_backend = get_stt_backend()
+    stt_texts = stt_backend.transcribe(segments, sr_)
+
+    # STT 결과를 화자별로 저장 (원래 diarNNN 순서 유지)
+    transcript_segments = []
+    for segment, stt_text in zip(segments, stt_texts):
+        if stt_text is not None:
+            stt_dict[segment.speaker].append(stt_text)
+            transcript_segments.append({
+                'speaker': segment.speaker,
+                'start': segment.start_sample / sr_,
+                'end': segment.end_sample / sr_,
+                'text': stt_text,
+            })
+
+    return {
+        'text': format_speaker_texts(stt_dict),
+        'segments': transcript_segments,
+        'audio_seconds': len(sound_raw) / sr_,
+        'segment_count': len(segments),
+        'external_calls': stt_backend.calls,
+    }
+
+
+def format_speaker_texts(stt_dict):
+    """
+    {화자: [텍스트, ...]}를 "speaker0: ... , speaker1: ... ," 형식으로 합치는 함수.
+    """
+    return ' '.join(f"speaker{speaker}: {' '.join(transcripts)}," for speaker, transcripts in stt_dict.items())
+
+
+def save_transcript_segments(meeting, transcriptions, batch_size=None):
+    """
+    섹션별 STT 결과를 TranscriptSegment로 저장하는 함수. 기존 결과는 지우고 batch_size개씩 bulk_create한다.
+    start/end는 섹션 시작 기준 초 단위이다.
+    """
+    batch_size = batch_size or settings.MEETING_TRANSCRIPT_BATCH_SIZE
+    sections = list(meeting.sections.order_by('id'))
+
+    def build():
+        for idx, transcription in enumerate(transcriptions):
+            section = sections[idx] if idx < len(sections) else None
+            for transcript_segment in transcription['segments']:
+                yield TranscriptSegment(meeting=meeting, section=section, **transcript_segment)
+
+    with transaction.atomic():
+        TranscriptSegment.objects.filter(meeting=meeting).delete()
+        for batch in batched(build(), batch_size):
+            TranscriptSegment.objects.bulk_create(batch)
+
+
+def measure_sections(section_file_paths):
+    return {
+        'audio_seconds': sum(sf.info(path).duration for path in section_file_paths),
+        'segment_count': len(section_file_paths),
+    }
+
+
+def measure_diarizations(diarizations):
+    return {
+        'audio_seconds': sum(diarization['audio_seconds'] for diarization in diarizations),
+        'segment_count': sum(len(diarization['segments']) for diarization in diarizations),
+    }
+
+
+def measure_transcriptions(transcriptions):
+    return {
+        key: sum(transcription[key] for transcription in transcriptions)
+        for key in ('audio_seconds', 'segment_count', 'external_calls')
+    }
+
+
+def process_sections(fn, section_file_paths, *iterables, max_workers=None, cpu_budget=None):
+    """
+    섹션마다 fn(section_file_path, *args)를 프로세스 풀에서 병렬로 실행하고 섹션 순서대로 결과를 반환하는 함수.
+    cpu_budget은 회의 하나가 사용할 전체 CPU 스레드 수로, 동시에 실행되는 워커(min(max_workers, 섹션 수))가 나눠 쓴다.
+    프로세스 풀은 워커 프로세스마다 하나를 만들어 단계와 작업 사이에 재사용한다(meetings.workers).
+    """
+    max_workers = max_workers or settings.MEETING_SECTION_WORKERS
+    cpu_budget = cpu_budget or settings.MEETING_CPU_BUDGET
+
+    if max_workers == 1 or len(section_file_paths) <= 1:
+        import torch
+        torch.set_num_threads(cpu_budget)
+        return list(map(fn, section_file_paths, *iterables))
+
+    return map_sections(fn, max_workers, cpu_budget, section_file_paths, *iterables)
@@ -0,0 +1,81 @@
+import resource
+import threading
+import time
+
+# 스레드마다 실행 중인 StageTimer (중첩될 수 있다)
+_active = threading.local()
+
+
+def current_rss():
+    """
+    현재 프로세스의 RSS(바이트)를 반환하는 함수. /proc을 읽을 수 없으면 최대 RSS를 반환한다.
+    """
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * resource.getpagesize()
+    except OSError:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def record_worker_usage(pid, cpu_seconds, peak_rss_bytes):
+    """
+    종료되지 않는 풀 워커가 보고한 CPU 시간과 최대 RSS를 현재 스레드에서 실행 중인 StageTimer에 더하는 함수.
+    """
+    for timer in getattr(_active, 'timers', []):
+        timer.add_worker_usage(pid, cpu_seconds, peak_rss_bytes)
+
+
+class StageTimer:
+    """
+    한 단계의 wall time, CPU time(자식 프로세스 포함), 최대 RSS를 측정하는 컨텍스트 매니저.
+    RSS는 백그라운드 스레드에서 interval초마다 샘플링하며, 단계 중 종료된 자식 프로세스의 최대 RSS도 반영한다.
+    풀 워커처럼 종료되지 않는 자식 프로세스는 RUSAGE_CHILDREN에 잡히지 않으므로 record_worker_usage로 보고받아,
+    CPU 시간은 더하고 최대 RSS는 워커별 최대값의 합을 부모 RSS에 더한다.
+    """
+
+    def __init__(self, interval=0.05):
+        self.interval = interval
+        self.wall_seconds = 0.0
+        self.cpu_seconds = 0.0
+        self.peak_rss_bytes = 0
+        self._worker_cpu_seconds = 0.0
+        self._worker_peak_rss = {}
+        self._stop = threading.Event()
+
+    def add_worker_usage(self, pid, cpu_seconds, peak_rss_bytes):
+        self._worker_cpu_seconds += cpu_seconds
+        self._worker_peak_rss[pid] = max(self._worker_peak_rss.get(pid, 0), peak_rss_bytes)
+
+    def _sample(self):
+        while not self._stop.wait(self.interval):
+            self.peak_rss_bytes = max(self.peak_rss_bytes, current_rss())
+
+    def __enter__(self):
+        self._children_before = resource.getrusage(resource.RUSAGE_CHILDREN)
+        self._cpu_before = time.process_time()
+        self._wall_before = time.perf_counter()
+        self.peak_rss_bytes = current_rss()
+        self._sampler = threading.Thread(target=self._sample, daemon=True)
+        self._sampler.start()
+        if not hasattr(_active, 'timers'):
+            _active.timers = []
+        _active.timers.append(self)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        _active.timers.remove(self)
+        self._stop.set()
+        self._sampler.join()
+
+        children = resource.getrusage(resource.RUSAGE_CHILDREN)
+        self.wall_seconds = time.perf_counter() - self._wall_before
+        self.cpu_seconds = (
+            time.process_time() - self._cpu_before
+            + (children.ru_utime + children.ru_stime)
+            - (self._children_before.ru_utime + self._children_before.ru_stime)
+            + self._worker_cpu_seconds
+        )
+        self.peak_rss_bytes = max(self.peak_rss_bytes, current_rss())
+        if children.ru_maxrss > self._children_before.ru_maxrss:
+            self.peak_rss_bytes = max(self.peak_rss_bytes, children.ru_maxrss * 1024)
+        self.peak_rss_bytes += sum(self._worker_peak_rss.values())
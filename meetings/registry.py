@@ -0,0 +1,70 @@
+import threading
+import time
+from django.conf import settings
+from .profiling import current_rss
+
+
+def load_asr():
+    import nemo.collections.asr as nemo_asr
+    return nemo_asr.models.ASRModel.from_pretrained(settings.MEETING_ASR_MODEL)
+
+
+def load_diarizer():
+    from simple_diarizer.diarizer import Diarizer
+    return Diarizer(embed_model='xvec', cluster_method='sc')
+
+
+def load_sentence_transformer():
+    from sentence_transformers import SentenceTransformer
+    return SentenceTransformer('all-MiniLM-L6-v2')
+
+
+MODEL_LOADERS = {
+    'asr': load_asr,
+    'diarizer': load_diarizer,
+    'sentence': load_sentence_transformer,
+}
+
+
+class ModelRegistry:
+    """
+    워커 프로세스마다 모델을 한 번만 로드해서 재사용하기 위한 레지스트리.
+    MEETING_MODELS에 설정된 모델만 로드하며, 로드 시간과 메모리 증가량을 기록한다.
+    """
+
+    def __init__(self, enabled):
+        self.enabled = set(enabled)
+        self._models = {}
+        self._stats = {}
+        self._lock = threading.Lock()
+
+    def get(self, name):
+        if name not in self.enabled:
+            raise ValueError(f"'{name}' 모델은 MEETING_MODELS에 설정되어 있지 않습니다.")
+
+        with self._lock:
+            if name not in self._models:
+                rss_before = current_rss()
+                started = time.perf_counter()
+                self._models[name] = MODEL_LOADERS[name]()
+                self._stats[name] = {
+                    'load_seconds': round(time.perf_counter() - started, 3),
+                    'rss_delta_bytes': current_rss() - rss_before,
+                }
+                print(f"Model '{name}' loaded in {self._stats[name]['load_seconds']}s")
+        return self._models[name]
+
+    def warm_up(self, names=None):
+        for name in sorted(self.enabled if names is None else names):
+            self.get(name)
+
+    def stats(self):
+        return {
+            'loaded': sorted(self._models),
+            'enabled': sorted(self.enabled),
+            'models': dict(self._stats),
+            'rss_bytes': current_rss(),
+        }
+
+
+registry = ModelRegistry(settings.MEETING_MODELS)
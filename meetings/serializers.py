@@ -1,5 +1,5 @@
 from rest_framework import serializers
-from .models import Meeting, Section, MeetingParticipant
+from .models import Meeting, Section, MeetingParticipant, ProcessingStageReport, TranscriptSegment
 from accounts.models import CustomUser
 from accounts.serializers import UserSerializer
 
@@ -39,4 +39,18 @@ class MeetingCreateSerializer(serializers.ModelSerializer):
             except CustomUser.DoesNotExist:
                 continue 
 
-        return meeting
\ No newline at end of file
+        return meeting
+
+
+class ProcessingStageReportSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = ProcessingStageReport
+        fields = ['stage', 'record_artifact', 'wall_seconds', 'cpu_seconds', 'peak_rss_bytes', 'audio_seconds', 'segment_count', 'external_calls', 'created_at']
+
+
+class TranscriptSegmentSerializer(serializers.ModelSerializer):
+    section = serializers.CharField(source='section.name', default=None, read_only=True)
+
+    class Meta:
+        model = TranscriptSegment
+        fields = ['id', 'section', 'speaker', 'start', 'end', 'text']
@@ -0,0 +1,41 @@
+import json
+import os
+from background_task.signals import task_failed
+from django.db.models.signals import post_delete
+from django.dispatch import receiver
+from .artifacts import release
+from .models import Meeting, RecordingUpload
+from .uploads import upload_path
+
+# 회의록을 만드는 작업 (views를 import하지 않도록 background_task 작업 이름으로 구분한다)
+MINUTES_TASKS = ('meetings.views.process_meeting_data', 'meetings.views.finalize_live_meeting')
+
+
+@receiver(post_delete, sender=RecordingUpload)
+def release_recording_upload(sender, instance, **kwargs):
+    if instance.status == "complete":
+        release(instance.sha256)
+    elif os.path.exists(upload_path(instance)):
+        os.remove(upload_path(instance))
+
+
+@receiver(task_failed)
+def fail_meeting_minutes(sender, task_id, completed_task, **kwargs):
+    """
+    회의록 작업이 MAX_ATTEMPTS번까지 모두 실패해 더 이상 재시도되지 않으면 회의록 상태를 failed로 바꾸는 함수.
+    작성 중이던 초안은 지우고, 이전 회의록(meeting_minutes)은 그대로 둔다.
+    재시도용으로 남겨 둔 체크포인트와 섹션 파일을 지우고, 녹음 파일 작업이면 작업이 가진 녹음 파일 참조도 해제한다.
+    """
+    if completed_task.task_name not in MINUTES_TASKS:
+        return
+    from .live import LIVE_ARTIFACT
+    from .pipeline import clear_checkpoints
+
+    _, task_kwargs = json.loads(completed_task.task_params)
+    meeting_id = task_kwargs['meeting_id']
+    Meeting.objects.filter(id=meeting_id).update(minutes_status="failed", minutes_draft=None)
+
+    record_artifact = task_kwargs.get('record_artifact')
+    clear_checkpoints(meeting_id, record_artifact or LIVE_ARTIFACT)
+    if record_artifact:
+        release(record_artifact)
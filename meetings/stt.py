@@ -0,0 +1,285 @@
+import hashlib
+import json
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from django.conf import settings
+import numpy as np
+import speech_recognition as sr
+from .audio import as_float32
+from .cache import DiskCache
+
+
+class TokenBucket:
+    """
+    초당 rate개의 토큰이 채워지고 최대 capacity개까지 쌓이는 토큰 버킷.
+    acquire()는 토큰이 생길 때까지 대기한다.
+    """
+
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+def to_audio_data(audio, sr_):
+    """
+    float 또는 int16 배열을 파일을 거치지 않고 16bit PCM AudioData로 변환하는 함수.
+    """
+    if audio.dtype == np.int16:
+        pcm = audio.astype('<i2', copy=False)
+    else:
+        pcm = (np.clip(audio, -1.0, 1.0) * 32767).astype('<i2')
+    return sr.AudioData(pcm.tobytes(), sr_, 2)
+
+
+def recognize_google(audio, timeout):
+    """
+    구글 음성 인식으로 AudioData를 텍스트로 변환하는 함수. 인식 결과가 없으면 None을 반환한다.
+    """
+    r = sr.Recognizer()
+    r.operation_timeout = timeout
+
+    stt = r.recognize_google(audio, language='ko-KR', show_all=True)
+    if 'alternative' in stt and len(stt['alternative']) > 0:
+        transcripts = [alt['transcript'] for alt in stt['alternative']]
+        return ' '.join(transcripts)
+    return None
+
+
+# 요청이 실패해 결과를 알 수 없는 세그먼트. 인식 결과가 없는 경우(None)와 달리 캐시하지 않는다.
+FAILED = object()
+
+
+class STTDispatcher:
+    """
+    세그먼트 오디오 배열들을 동시에 STT 서비스로 보내고, 결과를 입력 순서대로 반환하는 디스패처.
+    16bit PCM 변환은 요청을 보내기 직전에 세그먼트마다 하므로, 변환된 사본은 동시 요청 수만큼만 메모리에 있다.
+    동시 요청 수, 초당 요청 수, 요청별 타임아웃과 재시도(지수 백오프)를 설정할 수 있다.
+    재시도 후에도 요청이 실패한 세그먼트는 None 대신 FAILED를 반환한다.
+    """
+
+    def __init__(self, recognize=recognize_google, concurrency=None, rate=None, timeout=None, retries=None, backoff=None):
+        self.recognize = recognize
+        self.concurrency = concurrency or settings.MEETING_STT_CONCURRENCY
+        self.timeout = timeout or settings.MEETING_STT_TIMEOUT
+        self.retries = settings.MEETING_STT_RETRIES if retries is None else retries
+        self.backoff = settings.MEETING_STT_BACKOFF if backoff is None else backoff
+        self.bucket = TokenBucket(rate or settings.MEETING_STT_RATE, self.concurrency)
+        self.calls = 0
+        self._calls_lock = threading.Lock()
+
+    def transcribe(self, audios, sr_, names=None):
+        names = names or [str(idx) for idx in range(len(audios))]
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            return list(executor.map(self._call, audios, [sr_] * len(audios), names))
+
+    def _call(self, audio, sr_, name):
+        audio = to_audio_data(audio, sr_)
+        for attempt in range(self.retries + 1):
+            self.bucket.acquire()
+            with self._calls_lock:
+                self.calls += 1
+            try:
+                return self.recognize(audio, self.timeout)
+            except sr.UnknownValueError:
+                print(f"Google Speech Recognition could not understand audio in {name}.")
+                return None
+            except sr.RequestError as e:
+                if attempt == self.retries:
+                    print(f"Could not request results from Google Speech Recognition service for {name}; {e}")
+                    return FAILED
+                time.sleep(self.backoff * (2 ** attempt) + random.uniform(0, self.backoff))
+            except Exception as e:
+                print(f"Error processing {name}: {e}")
+                return FAILED
+
+
+class STTBackend:
+    """
+    STT 백엔드 인터페이스. transcribe()는 Segment 리스트를 받아 같은 순서의 텍스트(또는 None) 리스트를 반환한다.
+    calls는 지금까지 외부 서비스에 보낸 요청 수이고, failed는 마지막 transcribe()에서 요청이 실패해
+    None을 반환한 세그먼트 인덱스이다(음성이 인식되지 않은 세그먼트는 포함하지 않는다).
+    """
+    name = None
+    calls = 0
+    failed = frozenset()
+
+    def config(self):
+        return {}
+
+    def transcribe(self, segments, sr_):
+        raise NotImplementedError
+
+
+class GoogleSTTBackend(STTBackend):
+    name = 'google'
+
+    def __init__(self, dispatcher=None):
+        self.dispatcher = dispatcher or STTDispatcher()
+
+    @property
+    def calls(self):
+        return self.dispatcher.calls
+
+    def config(self):
+        return {'language': 'ko-KR'}
+
+    def transcribe(self, segments, sr_):
+        results = self.dispatcher.transcribe(
+            [segment.audio for segment in segments], sr_,
+            names=[segment.name for segment in segments],
+        )
+        self.failed = frozenset(i for i, text in enumerate(results) if text is FAILED)
+        return [None if text is FAILED else text for text in results]
+
+
+class NemoSTTBackend(STTBackend):
+    """
+    워커에 로드된 NeMo conformer 모델로 로컬 CPU 추론을 하는 백엔드.
+    세그먼트를 길이순으로 정렬해 비슷한 길이끼리 배치로 묶어 패딩을 최소화한다.
+    """
+    name = 'nemo'
+
+    def __init__(self, batch_size=None, num_threads=None):
+        self.batch_size = batch_size or settings.MEETING_NEMO_BATCH_SIZE
+        self.num_threads = num_threads or settings.MEETING_NEMO_THREADS
+
+    def config(self):
+        return {'model': settings.MEETING_ASR_MODEL}
+
+    def transcribe(self, segments, sr_):
+        import torch
+        from .registry import registry
+
+        asr_model = registry.get('asr')
+        if self.num_threads:
+            torch.set_num_threads(self.num_threads)
+
+        order = sorted(range(len(segments)), key=lambda i: len(segments[i].audio))
+        results = [None] * len(segments)
+
+        cpu_started = time.process_time()
+        for start in range(0, len(order), self.batch_size):
+            batch = order[start:start + self.batch_size]
+            audios = [np.ascontiguousarray(as_float32(segments[i].audio)) for i in batch]
+
+            with torch.inference_mode():
+                hypotheses = asr_model.transcribe(audios, batch_size=len(audios), verbose=False)
+            # transducer 모델은 (best, all) 튜플을 반환하는 버전이 있다
+            if isinstance(hypotheses, tuple):
+                hypotheses = hypotheses[0]
+
+            for i, hypothesis in zip(batch, hypotheses):
+                text = getattr(hypothesis, 'text', hypothesis)
+                results[i] = text or None
+
+        cpu_seconds = time.process_time() - cpu_started
+        audio_seconds = sum(len(segment.audio) for segment in segments) / sr_
+        if cpu_seconds > 0:
+            print(f"NeMo STT: {audio_seconds:.1f}s audio / {cpu_seconds:.1f} CPU s ({audio_seconds / cpu_seconds:.2f}x)")
+
+        return results
+
+
+class CachedSTTBackend(STTBackend):
+    """
+    세그먼트 PCM과 백엔드 이름/설정의 해시를 키로 STT 결과를 캐시하는 백엔드 래퍼.
+    캐시에 없는 세그먼트만 실제 백엔드로 보내므로, 같은 녹음을 다시 처리하면 STT를 건너뛴다.
+    요청이 실패한 세그먼트(backend.failed)는 캐시하지 않아 다음 처리에서 다시 요청한다.
+    """
+
+    def __init__(self, backend, cache):
+        self.backend = backend
+        self.cache = cache
+        self.name = backend.name
+
+    @property
+    def calls(self):
+        return self.backend.calls
+
+    def config(self):
+        return self.backend.config()
+
+    def key(self, segment, sr_):
+        digest = hashlib.sha256()
+        digest.update(json.dumps([self.backend.name, self.backend.config(), sr_], sort_keys=True).encode())
+        digest.update(np.ascontiguousarray(as_float32(segment.audio)).data)
+        return digest.hexdigest()
+
+    def transcribe(self, segments, sr_):
+        keys = [self.key(segment, sr_) for segment in segments]
+        results = [None] * len(segments)
+
+        missing = []
+        for i, key in enumerate(keys):
+            entry = self.cache.get(key)
+            if entry is None:
+                missing.append(i)
+            else:
+                results[i] = entry['text']
+
+        self.failed = frozenset()
+        if missing:
+            texts = self.backend.transcribe([segments[i] for i in missing], sr_)
+            self.failed = frozenset(missing[j] for j in self.backend.failed)
+            for i, text in zip(missing, texts):
+                results[i] = text
+                if i not in self.failed:
+                    self.cache.set(keys[i], {'text': text})
+
+        print(f"STT cache: {len(segments) - len(missing)} hits, {len(missing)} misses, {len(self.failed)} failed (total {self.cache.stats()})")
+        return results
+
+
+class StubSTTBackend(STTBackend):
+    """
+    네트워크 없이 파이프라인을 측정하기 위한 백엔드. 세그먼트마다 MEETING_STT_STUB_LATENCY초 기다린 뒤
+    세그먼트 이름과 길이를 텍스트로 반환한다. 요청은 MEETING_STT_CONCURRENCY개까지 동시에 처리한다.
+    """
+    name = 'stub'
+
+    def __init__(self):
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def _call(self, segment, sr_):
+        with self._lock:
+            self.calls += 1
+        time.sleep(settings.MEETING_STT_STUB_LATENCY)
+        return f"{segment.name} {len(segment.audio) / sr_:.1f}s"
+
+    def transcribe(self, segments, sr_):
+        with ThreadPoolExecutor(max_workers=settings.MEETING_STT_CONCURRENCY) as executor:
+            return list(executor.map(self._call, segments, [sr_] * len(segments)))
+
+
+STT_BACKENDS = {
+    GoogleSTTBackend.name: GoogleSTTBackend,
+    NemoSTTBackend.name: NemoSTTBackend,
+    StubSTTBackend.name: StubSTTBackend,
+}
+
+stt_cache = DiskCache(settings.MEETING_STT_CACHE_ROOT, settings.MEETING_STT_CACHE_MAX_BYTES)
+
+
+def get_stt_backend(name=None):
+    backend = STT_BACKENDS[name or settings.MEETING_STT_BACKEND]()
+    if settings.MEETING_STT_CACHE:
+        backend = CachedSTTBackend(backend, stt_cache)
+    return backend
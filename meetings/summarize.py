@@ -0,0 +1,183 @@
+import asyncio
+import re
+import time
+from functools import lru_cache
+from django.conf import settings
+from .models import Meeting
+
+SYSTEM_PROMPT = "당신은 전문 회의록 작성자입니다."
+
+# format_speaker_texts 형식("speaker0: ... , speaker1: ... ,")에서 화자 발화가 시작되는 위치
+SPEAKER_BOUNDARY = re.compile(r'(?=speaker\d+:)')
+SPEAKER_LABEL = re.compile(r'^(speaker\d+:)\s*')
+
+# 부분 요약을 다시 나눠 줄이는 최대 횟수 (요약이 줄어들지 않는 경우 무한히 반복하지 않도록)
+MAX_REDUCE_DEPTH = 2
+
+
+@lru_cache(maxsize=1)
+def get_encoding():
+    try:
+        import tiktoken
+    except ImportError:
+        return None
+    try:
+        return tiktoken.encoding_for_model(settings.MEETING_LLM_MODEL)
+    except KeyError:
+        return tiktoken.get_encoding('cl100k_base')
+
+
+def count_tokens(text):
+    """
+    프롬프트 토큰 수를 세는 함수. tiktoken이 설치되어 있지 않으면
+    한글 등 비ASCII 문자는 1자당 1토큰, ASCII는 4자당 1토큰으로 넉넉하게 추정한다.
+    """
+    encoding = get_encoding()
+    if encoding is not None:
+        return len(encoding.encode(text))
+    non_ascii = sum(1 for char in text if ord(char) > 127)
+    return non_ascii + (len(text) - non_ascii + 3) // 4
+
+
+def split_speech(speech, max_tokens):
+    """
+    화자 발화 경계에서 speech를 max_tokens 이하의 조각으로 나누는 함수.
+    한 화자의 발화가 max_tokens를 넘으면 단어 경계에서 나누고, 각 조각 앞에 화자 이름을 다시 붙인다.
+    합친 문자열을 매번 다시 세지 않도록 단어/발화마다 앞의 구분자(공백)를 포함해 한 번만 세고 누적한다.
+    """
+    turns = []
+    for turn in SPEAKER_BOUNDARY.split(speech):
+        turn = turn.strip()
+        if not turn:
+            continue
+        turn_tokens = count_tokens(turn)
+        if turn_tokens <= max_tokens:
+            turns.append((turn, turn_tokens))
+            continue
+
+        match = SPEAKER_LABEL.match(turn)
+        label = match.group(1) if match else ''
+        words = turn[match.end():].split() if match else turn.split()
+        label_tokens = count_tokens(label) if label else 0
+        part, part_tokens = [], label_tokens
+        for word in words:
+            word_tokens = count_tokens(f" {word}") if part or label else count_tokens(word)
+            if part and part_tokens + word_tokens > max_tokens:
+                turns.append((' '.join([label, *part]).strip(), part_tokens))
+                part, part_tokens = [], label_tokens
+                if not label:
+                    word_tokens = count_tokens(word)
+            part.append(word)
+            part_tokens += word_tokens
+        if part:
+            turns.append((' '.join([label, *part]).strip(), part_tokens))
+
+    separator_tokens = count_tokens(' ')
+    chunks, current, current_tokens = [], [], 0
+    for turn, turn_tokens in turns:
+        if current and current_tokens + separator_tokens + turn_tokens > max_tokens:
+            chunks.append(' '.join(current))
+            current, current_tokens = [], 0
+        current_tokens += turn_tokens + (separator_tokens if current else 0)
+        current.append(turn)
+    if current:
+        chunks.append(' '.join(current))
+    return chunks
+
+
+def render_minutes(topic, date, sub_topics, summaries, topic_info=None):
+    """
+    회의록 markdown을 만드는 함수. topic_info(종합 정리)가 없으면 작성 중인 초안 형식이다.
+    """
+    minutes = f"# {topic}\n\n**회의 일시**: {date}\n\n" + "\n\n".join(
+        f"## {sub_topic}\n{summary}" for sub_topic, summary in zip(sub_topics, summaries)
+    )
+    if topic_info is not None:
+        minutes += f"\n\n---\n\n### 종합 정리\n{topic_info}"
+    return minutes
+
+
+class MinutesDraft:
+    """
+    섹션 요약이 생성되는 대로 회의의 minutes_draft에 초안을 기록하는 클래스.
+    기존 회의록(meeting_minutes)은 최종 회의록을 저장할 때만 바뀌므로, 작업이 실패해도 이전 회의록이 그대로 남는다.
+    DB 쓰기는 MEETING_MINUTES_FLUSH_INTERVAL초에 한 번으로 제한하며, 섹션 요약이 끝났을 때는 바로 기록한다.
+    """
+
+    def __init__(self, meeting, topic, date, sub_topics):
+        self.meeting = meeting
+        self.topic = topic
+        self.date = date
+        self.sub_topics = sub_topics
+        self.summaries = ['' for _ in sub_topics]
+        self._flushed_at = 0.0
+        self._lock = asyncio.Lock()
+
+    def on_delta(self, idx):
+        async def append(delta):
+            self.summaries[idx] += delta
+            await self.flush()
+        return append
+
+    async def set(self, idx, summary):
+        self.summaries[idx] = summary
+        await self.flush(force=True)
+
+    async def flush(self, force=False):
+        if not force and time.monotonic() - self._flushed_at < settings.MEETING_MINUTES_FLUSH_INTERVAL:
+            return
+        async with self._lock:
+            self._flushed_at = time.monotonic()
+            minutes = render_minutes(self.topic, self.date, self.sub_topics, self.summaries)
+            await Meeting.objects.filter(id=self.meeting.id).aupdate(minutes_draft=minutes)
+
+
+async def stream_completion(llm, prompt, on_delta):
+    parts = []
+    async for delta in llm.stream(SYSTEM_PROMPT, prompt):
+        parts.append(delta)
+        await on_delta(delta)
+    return ''.join(parts)
+
+
+async def complete(llm, prompt, semaphore, on_delta=None):
+    """
+    semaphore 안에서 LLM을 호출하는 함수. on_delta가 주어지면 스트리밍 응답의 조각마다 on_delta(delta)를 호출한다.
+    MEETING_LLM_TIMEOUT초 안에 응답이 끝나지 않으면 취소한다.
+    """
+    async with semaphore:
+        if on_delta is None:
+            return await asyncio.wait_for(llm.complete(SYSTEM_PROMPT, prompt), timeout=settings.MEETING_LLM_TIMEOUT)
+        return await asyncio.wait_for(stream_completion(llm, prompt, on_delta), timeout=settings.MEETING_LLM_TIMEOUT)
+
+
+async def summarize_section(llm, sub_topic, speech, summary_style, semaphore, depth=0, on_delta=None):
+    """
+    섹션 하나를 요약하는 함수. 프롬프트가 MEETING_LLM_MAX_PROMPT_TOKENS 이하이면 한 번에 요약하고,
+    넘으면 MEETING_LLM_CHUNK_TOKENS 크기 조각으로 나눠 동시에 요약(map)한 뒤 부분 요약을 합쳐 다시 요약(reduce)한다.
+    부분 요약을 합친 것도 너무 길면 같은 방식으로 MAX_REDUCE_DEPTH번까지 더 줄인다.
+    on_delta는 최종 요약(단일 호출 또는 reduce)만 스트리밍으로 받는다.
+    """
+    prompt = f"""
+        다음 스타일로 회의 내용을 요약하세요:
+        {summary_style}
+
+        소주제: {sub_topic}
+        내용: {speech}
+        """
+    if count_tokens(prompt) <= settings.MEETING_LLM_MAX_PROMPT_TOKENS or depth >= MAX_REDUCE_DEPTH:
+        return await complete(llm, prompt, semaphore, on_delta)
+
+    chunks = split_speech(speech, settings.MEETING_LLM_CHUNK_TOKENS)
+    print(f"'{sub_topic}' 섹션이 길어 {len(chunks)}개 조각으로 나누어 요약합니다.")
+    partial_summaries = await asyncio.gather(*(
+        complete(llm, f"""
+        다음은 긴 회의 내용의 일부({idx + 1}/{len(chunks)})입니다. 누가 어떤 의견과 결정을 말했는지 빠짐없이 요약하세요.
+
+        소주제: {sub_topic}
+        내용: {chunk}
+        """, semaphore)
+        for idx, chunk in enumerate(chunks)
+    ))
+
+    return await summarize_section(llm, sub_topic, '\n'.join(partial_summaries), summary_style, semaphore, depth + 1, on_delta)
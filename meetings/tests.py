@@ -1,3 +1,837 @@
-from django.test import TestCase
+import hashlib
+import io
+import json
+import os
+import shutil
+import tempfile
+import time
+from unittest import mock
+import numpy as np
+import soundfile as sf
+from background_task.models import CompletedTask
+from background_task.signals import task_failed
+from django.conf import settings
+from django.test import SimpleTestCase, TestCase, override_settings
+from rest_framework.test import APIRequestFactory
+from accounts.authenticate import SafeJWTAuthentication
+from accounts.models import CustomUser
+from organizations.models import Organization
+from .audio import as_float32, detect_speech, sniff_audio_format, split_sections_ffmpeg, TimeMap
+from .cache import DiskCache
+from .diarization import link_speakers, merge_turns
+from .management.commands.fake_openai_server import FakeOpenAI
+from .llm import LLMClient, LLMError
+from .live import SAMPLE_WIDTH, assign_sections, live_path, process_window, schedule_windows
+from .artifacts import artifact_path
+from .models import (
+    Artifact, LiveTranscription, Meeting, ProcessingCheckpoint, ProcessingStageReport, RecordingUpload, Section, TranscriptSegment,
+)
+from .pipeline import clear_checkpoints, run_stage
+from .profiling import StageTimer, record_worker_usage
+from .stt import TokenBucket
+from .summarize import split_speech
+from .uploads import write_chunk_at
+from .views import (
+    MeetingLiveAudioView, MeetingMinutesStreamView, RecordingUploadDetailView, finalize_live_meeting, process_live_window,
+)
+from .workspace import output_dir
+from .workers import discard_section_pool, map_sections
 
-# Create your tests here.
+
+def create_meeting(title='test', sections=()):
+    user = CustomUser.objects.create(email=f"{title}@test.local", name=title)
+    organization = Organization.objects.create(name=title, owner=user)
+    meeting = Meeting.objects.create(title=title, organization=organization, creator=user)
+    for name in sections:
+        Section.objects.create(meeting=meeting, name=name)
+    return meeting
+
+
+def burn_cpu(seconds):
+    started = time.process_time()
+    while time.process_time() - started < seconds:
+        pass
+    return seconds
+
+
+def tone(seconds, sr=16000, amplitude=0.5):
+    t = np.arange(int(seconds * sr), dtype=np.float32) / sr
+    return (amplitude * np.sin(2 * np.pi * 220 * t)).astype(np.float32)
+
+
+def silence(seconds, sr=16000):
+    return np.zeros(int(seconds * sr), dtype=np.float32)
+
+
+class DetectSpeechTests(SimpleTestCase):
+    def test_finds_padded_regions(self):
+        sound = np.concatenate([silence(1), tone(1), silence(1), tone(1)])
+        regions = detect_speech(sound, pad=0.2, min_silence=0.5)
+
+        self.assertEqual(regions.shape, (2, 2))
+        # 프레임(30ms) 경계만큼의 오차를 허용한다
+        frame = 480
+        self.assertLessEqual(abs(regions[0, 0] - (16000 - 3200)), frame)
+        self.assertLessEqual(abs(regions[0, 1] - (32000 + 3200)), frame)
+        self.assertLessEqual(abs(regions[1, 0] - (48000 - 3200)), frame)
+        self.assertEqual(regions[1, 1], len(sound))
+
+    def test_merges_short_silence(self):
+        sound = np.concatenate([silence(1), tone(1), silence(0.2), tone(1), silence(1)])
+        regions = detect_speech(sound, pad=0.0, min_silence=0.5)
+        self.assertEqual(len(regions), 1)
+
+    def test_silence_only(self):
+        self.assertEqual(detect_speech(silence(2)).shape, (0, 2))
+        self.assertEqual(detect_speech(silence(0.01)).shape, (0, 2))
+
+    def test_energy_is_computed_per_block(self):
+        sound = np.concatenate([silence(1), tone(1), silence(1), tone(1)])
+        expected = detect_speech(sound, pad=0.2, min_silence=0.5)
+        # 블록 크기가 프레임 수의 약수가 아니어도 한 번에 계산한 것과 같다
+        with mock.patch('meetings.audio.VAD_BLOCK_FRAMES', 7):
+            np.testing.assert_array_equal(detect_speech(sound, pad=0.2, min_silence=0.5), expected)
+
+    def test_int16_matches_float(self):
+        sound = np.concatenate([silence(1), tone(1), silence(1)])
+        pcm = (sound * 32767).astype(np.int16)
+        np.testing.assert_array_equal(detect_speech(sound), detect_speech(pcm))
+
+
+class SplitSectionsFfmpegTests(SimpleTestCase):
+    """
+    ffmpeg 대신 16kHz 16bit PCM을 stdout으로 내보내는 셸 스크립트로 split_sections_ffmpeg를 확인한다.
+    """
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.source = os.path.join(self.tmp_dir, 'record.m4a')
+        open(self.source, 'wb').close()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def split(self, script, boundaries):
+        encoder = os.path.join(self.tmp_dir, 'ffmpeg')
+        with open(encoder, 'w') as f:
+            f.write(f"#!/bin/sh\n{script}\n")
+        os.chmod(encoder, 0o755)
+        with mock.patch('pydub.utils.get_encoder_name', return_value=encoder):
+            return split_sections_ffmpeg(self.source, boundaries, self.tmp_dir)
+
+    def test_splits_and_stops_after_last_section(self):
+        # 끝나지 않는 스트림이어도 마지막 섹션까지 읽으면 멈춘다
+        paths = self.split('cat /dev/zero', [(0, 1), (1, 2.5)])
+        self.assertEqual([sf.info(path).frames for path in paths], [16000, 24000])
+
+    def test_ffmpeg_failure_raises(self):
+        for _ in range(10):
+            with self.assertRaisesMessage(RuntimeError, 'broken input'):
+                self.split('echo "broken input" >&2; exit 1', [(0, 1)])
+
+    def test_ffmpeg_failure_after_partial_output_raises(self):
+        with self.assertRaisesMessage(RuntimeError, 'ffmpeg'):
+            self.split('head -c 16000 /dev/zero; exit 1', [(0, 1)])
+
+    def test_short_output_raises(self):
+        with self.assertRaisesMessage(RuntimeError, '짧습니다'):
+            self.split('head -c 32000 /dev/zero', [(0, 1), (1, 2)])
+
+
+class TimeMapTests(SimpleTestCase):
+    def setUp(self):
+        self.time_map = TimeMap([[100, 200], [300, 400]])
+        self.sound = np.arange(500)
+
+    def test_compact(self):
+        compact = self.time_map.compact(self.sound)
+        self.assertEqual(len(compact), self.time_map.compact_length)
+        np.testing.assert_array_equal(compact, np.concatenate([np.arange(100, 200), np.arange(300, 400)]))
+
+    def test_compact_int16_to_float32(self):
+        pcm = np.arange(-250, 250, dtype=np.int16) * 100
+        compact = self.time_map.compact(pcm, dtype=np.float32)
+        self.assertEqual(compact.dtype, np.float32)
+        np.testing.assert_array_equal(compact, as_float32(self.time_map.compact(pcm)))
+
+    def test_to_original(self):
+        self.assertEqual(self.time_map.to_original(0), 100)
+        self.assertEqual(self.time_map.to_original(50), 150)
+        self.assertEqual(self.time_map.to_original(100), 300)
+        self.assertEqual(self.time_map.to_original(150), 350)
+
+    def test_slice_across_regions(self):
+        np.testing.assert_array_equal(
+            self.time_map.slice(self.sound, 150, 350),
+            np.concatenate([np.arange(150, 200), np.arange(300, 350)]),
+        )
+
+    def test_slice_single_region_is_view(self):
+        part = self.time_map.slice(self.sound, 120, 180)
+        np.testing.assert_array_equal(part, np.arange(120, 180))
+        self.assertTrue(np.shares_memory(part, self.sound))
+
+    def test_slice_silence(self):
+        self.assertEqual(len(self.time_map.slice(self.sound, 200, 300)), 0)
+
+    def test_empty_regions(self):
+        time_map = TimeMap(np.zeros((0, 2), dtype=np.int64))
+        self.assertEqual(time_map.compact_length, 0)
+        self.assertEqual(len(time_map.compact(self.sound)), 0)
+
+
+class MergeTurnsTests(SimpleTestCase):
+    def segment(self, label, start, end):
+        return {'label': label, 'start_sample': start, 'end_sample': end}
+
+    def test_merges_same_speaker_within_gap(self):
+        segments = [self.segment(0, 0, 1000), self.segment(0, 1200, 2000), self.segment(1, 2100, 3000)]
+        merged, saved = merge_turns(segments, sr=1000, max_gap=0.5, max_duration=30)
+
+        self.assertEqual(saved, 1)
+        self.assertEqual(merged, [self.segment(0, 0, 2000), self.segment(1, 2100, 3000)])
+        # 입력 세그먼트는 바꾸지 않는다
+        self.assertEqual(segments[0], self.segment(0, 0, 1000))
+
+    def test_keeps_long_gap_and_other_speaker(self):
+        segments = [self.segment(0, 0, 1000), self.segment(1, 1100, 2000), self.segment(1, 3000, 4000)]
+        merged, saved = merge_turns(segments, sr=1000, max_gap=0.5, max_duration=30)
+        self.assertEqual(saved, 0)
+        self.assertEqual(merged, segments)
+
+    def test_respects_max_duration(self):
+        segments = [self.segment(0, 0, 1000), self.segment(0, 1100, 2000), self.segment(0, 2100, 3000)]
+        merged, saved = merge_turns(segments, sr=1000, max_gap=0.5, max_duration=2)
+        self.assertEqual(saved, 1)
+        self.assertEqual(merged, [self.segment(0, 0, 2000), self.segment(0, 2100, 3000)])
+
+
+# 토큰 수는 tiktoken 설치 여부와 상관없이 단어 수로 센다
+@mock.patch('meetings.summarize.count_tokens', lambda text: len(text.split()))
+@mock.patch('meetings.summarize.count_tokens', side_effect=lambda text: len(text.split()))
+class SplitSpeechTests(SimpleTestCase):
+    """
+    토큰 수를 단어 수로 세어 나누는 위치를 확인한다.
+    """
+    speech = "speaker0: a b c, speaker1: d e f g h i,"
+
+    def test_splits_at_speaker_boundaries(self, count_tokens):
+        self.assertEqual(split_speech(self.speech, 10), ["speaker0: a b c,", "speaker1: d e f g h i,"])
+
+    def test_splits_long_turn_and_keeps_label(self, count_tokens):
+        self.assertEqual(
+            split_speech(self.speech, 4),
+            ["speaker0: a b c,", "speaker1: d e f", "speaker1: g h i,"],
+        )
+
+    def test_short_speech_is_one_chunk(self, count_tokens):
+        self.assertEqual(split_speech(self.speech, 100), [self.speech])
+
+    def test_counts_each_word_once(self, count_tokens):
+        speech = "speaker0: " + " ".join(["word"] * 2000)
+        chunks = split_speech(speech, 100)
+
+        self.assertTrue(all(len(chunk.split()) <= 100 for chunk in chunks))
+        self.assertEqual(sum(len(chunk.split()) - 1 for chunk in chunks), 2000)
+        # 합친 문자열을 다시 세지 않으므로 센 글자 수는 speech 길이에 비례한다
+        counted = sum(len(call.args[0]) for call in count_tokens.call_args_list)
+        self.assertLess(counted, 3 * len(speech))
+
+
+class SniffAudioFormatTests(SimpleTestCase):
+    def test_formats(self):
+        self.assertEqual(sniff_audio_format(b'RIFF\x24\x08\x00\x00WAVE'), 'wav')
+        self.assertEqual(sniff_audio_format(b'fLaC\x00\x00\x00\x22'), 'flac')
+        self.assertEqual(sniff_audio_format(b'OggS\x00\x02\x00\x00'), 'ogg')
+        self.assertEqual(sniff_audio_format(b'ID3\x04\x00\x00'), 'mp3')
+        self.assertEqual(sniff_audio_format(b'\xff\xfb\x90\x64'), 'mp3')
+
+    def test_unsupported(self):
+        # ADTS AAC는 프레임 동기가 같지만 layer 비트가 00이다
+        self.assertIsNone(sniff_audio_format(b'\xff\xf1\x50\x80'))
+        self.assertIsNone(sniff_audio_format(b'RIFF\x24\x08\x00\x00AVI '))
+        self.assertIsNone(sniff_audio_format(b''))
+
+
+class WriteChunkAtTests(SimpleTestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmp_dir, 'upload', 'chunk.part')
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def write(self, offset, data, checksum=None, length=None):
+        checksum = checksum or hashlib.sha256(data).hexdigest()
+        return write_chunk_at(self.path, offset, io.BytesIO(data), len(data) if length is None else length, checksum)
+
+    def read(self):
+        with open(self.path, 'rb') as f:
+            return f.read()
+
+    def test_appends_chunks(self):
+        self.assertEqual(self.write(0, b'hello'), 5)
+        self.assertEqual(self.write(5, b' world'), 11)
+        self.assertEqual(self.read(), b'hello world')
+
+    def test_bad_checksum_rolls_back(self):
+        self.write(0, b'hello')
+        with self.assertRaisesMessage(ValueError, '체크섬'):
+            self.write(5, b' world', checksum='0' * 64)
+        self.assertEqual(self.read(), b'hello')
+
+    def test_short_body_rolls_back(self):
+        self.write(0, b'hello')
+        with self.assertRaisesMessage(ValueError, 'Content-Length'):
+            self.write(5, b' wo', length=6)
+        self.assertEqual(self.read(), b'hello')
+
+    def test_retry_truncates_leftover(self):
+        self.write(0, b'hello world')
+        self.write(5, b' w')
+        self.assertEqual(self.read(), b'hello w')
+
+
+
+def wav_bytes(seconds=0.1):
+    buffer = io.BytesIO()
+    sf.write(buffer, tone(seconds), 16000, format='WAV', subtype='PCM_16')
+    return buffer.getvalue()
+
+
+class ChunkUploadTests(TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.settings_override = override_settings(
+            MEETING_UPLOAD_ROOT=os.path.join(self.tmp_dir, 'uploads'),
+            MEETING_ARTIFACT_ROOT=os.path.join(self.tmp_dir, 'artifacts'),
+            MEETING_LIVE_ROOT=os.path.join(self.tmp_dir, 'live'),
+        )
+        self.settings_override.enable()
+        self.meeting = create_meeting()
+        self.auth = mock.patch.object(SafeJWTAuthentication, 'authenticate', return_value=(self.meeting.creator, None))
+        self.auth.start()
+        self.factory = APIRequestFactory()
+        self.data = wav_bytes()
+
+    def tearDown(self):
+        self.auth.stop()
+        self.settings_override.disable()
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def create_upload(self, sha256=None):
+        return RecordingUpload.objects.create(
+            meeting=self.meeting, filename='meeting.wav', total_size=len(self.data),
+            sha256=sha256 or hashlib.sha256(self.data).hexdigest(),
+        )
+
+    def put(self, upload, offset, data, checksum=None):
+        request = self.factory.put(
+            f'/uploads/{upload.id}', data, content_type='application/octet-stream',
+            HTTP_UPLOAD_OFFSET=str(offset), HTTP_UPLOAD_CHECKSUM=checksum or hashlib.sha256(data).hexdigest(),
+        )
+        return RecordingUploadDetailView.as_view()(request, upload_id=upload.id)
+
+    def upload_files(self):
+        return os.listdir(settings.MEETING_UPLOAD_ROOT) if os.path.exists(settings.MEETING_UPLOAD_ROOT) else []
+
+    def test_chunks_are_finalized_into_artifact(self):
+        upload = self.create_upload()
+        self.assertEqual(self.put(upload, 0, self.data[:1000]).data['offset'], 1000)
+        response = self.put(upload, 1000, self.data[1000:])
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['status'], "complete")
+        self.assertEqual(Artifact.objects.get(sha256=upload.sha256).ref_count, 1)
+        with open(artifact_path(upload.sha256), 'rb') as f:
+            self.assertEqual(f.read(), self.data)
+        # 청크 임시 파일과 업로드 중인 파일은 남지 않는다
+        self.assertEqual(self.upload_files(), [])
+
+    def test_offset_mismatch_conflicts(self):
+        upload = self.create_upload()
+        response = self.put(upload, 1000, self.data[1000:2000])
+
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual(response.data['offset'], 0)
+        self.assertEqual(self.upload_files(), [])
+
+    def test_bad_chunk_checksum_keeps_offset(self):
+        upload = self.create_upload()
+        self.put(upload, 0, self.data[:1000])
+        response = self.put(upload, 1000, self.data[1000:2000], checksum='0' * 64)
+
+        self.assertEqual(response.status_code, 400)
+        upload.refresh_from_db()
+        self.assertEqual(upload.offset, 1000)
+        self.assertEqual(self.upload_files(), [f"{upload.id}.part"])
+
+    def test_invalid_headers(self):
+        upload = self.create_upload()
+        response = self.put(upload, 'abc', self.data[:1000])
+        self.assertEqual(response.status_code, 400)
+
+    def test_file_checksum_mismatch_restarts_upload(self):
+        upload = self.create_upload(sha256='0' * 64)
+        response = self.put(upload, 0, self.data)
+
+        self.assertEqual(response.status_code, 400)
+        upload.refresh_from_db()
+        self.assertEqual((upload.offset, upload.status), (0, "uploading"))
+        self.assertFalse(Artifact.objects.exists())
+
+    def test_artifact_is_released_with_last_reference(self):
+        first, second = self.create_upload(), self.create_upload()
+        self.put(first, 0, self.data)
+        self.put(second, 0, self.data)
+        self.assertEqual(Artifact.objects.get(sha256=first.sha256).ref_count, 2)
+
+        RecordingUpload.objects.get(id=first.id).delete()
+        self.assertEqual(Artifact.objects.get(sha256=first.sha256).ref_count, 1)
+        self.assertTrue(os.path.exists(artifact_path(first.sha256)))
+
+        RecordingUpload.objects.get(id=second.id).delete()
+        self.assertFalse(Artifact.objects.exists())
+        self.assertFalse(os.path.exists(artifact_path(first.sha256)))
+
+    def test_live_audio_creates_transcription(self):
+        Meeting.objects.filter(id=self.meeting.id).update(is_active="ongoing")
+        pcm = np.zeros(1600, dtype='<i2').tobytes()
+        request = self.factory.post(
+            f'/meetings/{self.meeting.id}/live', pcm, content_type='application/octet-stream',
+            HTTP_UPLOAD_OFFSET='0', HTTP_UPLOAD_CHECKSUM=hashlib.sha256(pcm).hexdigest(),
+        )
+        response = MeetingLiveAudioView.as_view()(request, meeting_id=self.meeting.id)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['offset'], len(pcm))
+        self.assertEqual(LiveTranscription.objects.get(meeting=self.meeting).received_bytes, len(pcm))
+
+
+class TokenBucketTests(SimpleTestCase):
+    def test_burst_up_to_capacity(self):
+        bucket = TokenBucket(rate=1, capacity=3)
+        started = time.monotonic()
+        for _ in range(3):
+            bucket.acquire()
+        self.assertLess(time.monotonic() - started, 0.5)
+
+    def test_waits_for_refill(self):
+        bucket = TokenBucket(rate=50, capacity=1)
+        bucket.acquire()
+        started = time.monotonic()
+        for _ in range(5):
+            bucket.acquire()
+        # 토큰 5개가 채워지려면 0.1초가 걸린다
+        self.assertGreaterEqual(time.monotonic() - started, 0.08)
+
+
+class DiskCacheTests(SimpleTestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def test_get_set(self):
+        cache = DiskCache(self.root, max_bytes=1024 * 1024)
+        self.assertIsNone(cache.get('ab01'))
+        cache.set('ab01', {'text': '안녕하세요'})
+        self.assertEqual(cache.get('ab01'), {'text': '안녕하세요'})
+        self.assertEqual(cache.stats(), {'hits': 1, 'misses': 1})
+
+    def test_ttl_expires_entry(self):
+        cache = DiskCache(self.root, max_bytes=1024 * 1024, ttl=60)
+        cache.set('ab01', 'old')
+        cache.set('ab02', 'new')
+
+        path = cache._path('ab01')
+        with open(path) as f:
+            entry = json.load(f)
+        entry['created'] -= 120
+        with open(path, 'w') as f:
+            json.dump(entry, f)
+
+        self.assertIsNone(cache.get('ab01'))
+        self.assertFalse(os.path.exists(path))
+        self.assertEqual(cache.get('ab02'), 'new')
+
+    def test_evicts_least_recently_used(self):
+        cache = DiskCache(self.root, max_bytes=1024 * 1024)
+        for idx, key in enumerate(['ab01', 'ab02', 'ab03']):
+            cache.set(key, 'x' * 100)
+            os.utime(cache._path(key), (1000 + idx, 1000 + idx))
+
+        # ab01은 가장 오래 전에 저장했지만 방금 읽었으므로 남는다
+        cache.get('ab01')
+        cache.max_bytes = sum(os.path.getsize(cache._path(key)) for key in ['ab01', 'ab02', 'ab03']) - 1
+        cache.evict()
+
+        self.assertFalse(os.path.exists(cache._path('ab02')))
+        self.assertEqual(cache.get('ab01'), 'x' * 100)
+        self.assertEqual(cache.get('ab03'), 'x' * 100)
+
+
+class SectionPoolTests(SimpleTestCase):
+    def tearDown(self):
+        discard_section_pool()
+
+    def test_worker_usage_is_added_to_stage_timer(self):
+        # 워커는 spawn으로 시작하며 설정을 환경 변수에서 다시 읽는다
+        with mock.patch.dict(os.environ, {'MEETING_WARM_MODELS': 'False'}):
+            with StageTimer() as timer:
+                results = map_sections(burn_cpu, 2, 2, [0.3, 0.2, 0.1])
+
+        self.assertEqual(results, [0.3, 0.2, 0.1])
+        # 부모 프로세스는 기다리기만 하므로 CPU 시간은 대부분 워커에서 보고한 값이다
+        self.assertGreaterEqual(timer.cpu_seconds, 0.6)
+
+    def test_record_worker_usage_without_timer(self):
+        record_worker_usage(1, 1.0, 1024)
+
+    def test_nested_timers_and_peak_rss(self):
+        with StageTimer() as outer:
+            with StageTimer() as inner:
+                record_worker_usage(101, 1.5, 100 * 1024 * 1024)
+                record_worker_usage(101, 0.5, 120 * 1024 * 1024)
+                record_worker_usage(102, 1.0, 50 * 1024 * 1024)
+            record_worker_usage(103, 2.0, 10 * 1024 * 1024)
+
+        self.assertGreaterEqual(inner.cpu_seconds, 3.0)
+        self.assertGreaterEqual(outer.cpu_seconds, 5.0)
+        # 워커별 최대 RSS의 합(120MB + 50MB)을 부모 RSS에 더한다
+        self.assertGreaterEqual(inner.peak_rss_bytes, 170 * 1024 * 1024)
+        self.assertGreater(outer.peak_rss_bytes, inner.peak_rss_bytes)
+
+
+class LinkSpeakersTests(SimpleTestCase):
+    def test_links_same_speaker_across_windows(self):
+        # window 0: A, B / window 1: B, A / window 2: A
+        embeddings = [[1, 0.1], [0.1, 1], [0.2, 1], [1, 0], [0.9, 0.1]]
+        groups = [0, 0, 1, 1, 2]
+        labels = link_speakers(embeddings, groups, max_speakers=2, min_similarity=0.5)
+        self.assertEqual(labels, [0, 1, 1, 0, 0])
+
+    def test_does_not_merge_speakers_of_same_window(self):
+        labels = link_speakers([[1, 0], [1, 0.01]], [0, 0], max_speakers=1, min_similarity=0.5)
+        self.assertEqual(labels, [0, 1])
+
+    def test_caps_at_max_speakers(self):
+        embeddings = [[1, 0, 0], [0, 1, 0], [0, 0, 1]]
+        self.assertEqual(len(set(link_speakers(embeddings, [0, 1, 2], max_speakers=3, min_similarity=0.5))), 3)
+        self.assertEqual(len(set(link_speakers(embeddings, [0, 1, 2], max_speakers=1, min_similarity=0.5))), 1)
+
+    def test_empty(self):
+        self.assertEqual(link_speakers([], [], max_speakers=2, min_similarity=0.5), [])
+
+
+class LiveWindowTests(TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.settings_override = override_settings(MEETING_LIVE_ROOT=self.tmp_dir, MEETING_LIVE_WINDOW_SECONDS=1)
+        self.settings_override.enable()
+        self.meeting = create_meeting(sections=['first', 'second'])
+
+        samples = int(2.5 * 16000)
+        with open(live_path(self.meeting.id), 'wb') as f:
+            f.write(np.zeros(samples, dtype='<i2').tobytes())
+        self.live = LiveTranscription.objects.create(meeting=self.meeting, received_bytes=samples * SAMPLE_WIDTH)
+
+    def tearDown(self):
+        self.settings_override.disable()
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def process(self, start_sample, end_sample, speakers):
+        """
+        speakers는 window 안의 화자 번호 순서대로 (임베딩, 텍스트)이다.
+        """
+        diarization = {'speaker_embeddings': [[idx, embedding] for idx, (embedding, _) in enumerate(speakers)]}
+        transcription = {'segments': [
+            {'speaker': idx, 'start': 0.1 + 0.3 * idx, 'end': 0.3 + 0.3 * idx, 'text': text}
+            for idx, (_, text) in enumerate(speakers)
+        ]}
+        with mock.patch('meetings.live.diarize_audio', return_value=diarization), \
+                mock.patch('meetings.live.transcribe_audio', return_value=transcription):
+            return process_window(self.meeting, start_sample, end_sample, num_speakers=2)
+
+    def test_schedule_tracks_pending_windows(self):
+        self.assertEqual(schedule_windows(self.live), [(0, 16000), (16000, 32000)])
+        self.assertEqual(schedule_windows(self.live, final=True), [(32000, 40000)])
+        self.live.refresh_from_db()
+        self.assertEqual(self.live.pending_windows, [[0, 16000], [16000, 32000], [32000, 40000]])
+
+    def test_processed_window_is_removed_once(self):
+        schedule_windows(self.live)
+        self.assertIsNotNone(self.process(0, 16000, [([1, 0], 'a')]))
+        # 같은 window를 다른 작업이 다시 처리해도 결과를 중복 저장하지 않는다
+        self.assertIsNone(self.process(0, 16000, [([1, 0], 'a')]))
+
+        self.live.refresh_from_db()
+        self.assertEqual(self.live.pending_windows, [[16000, 32000]])
+        self.assertEqual(self.live.processed_samples, 16000)
+        self.assertEqual(TranscriptSegment.objects.filter(meeting=self.meeting).count(), 1)
+
+    def test_failed_window_stays_pending(self):
+        schedule_windows(self.live)
+        with mock.patch('meetings.live.diarize_audio', side_effect=RuntimeError('diarizer failed')):
+            with self.assertRaises(RuntimeError):
+                process_window(self.meeting, 0, 16000, num_speakers=2)
+
+        self.live.refresh_from_db()
+        self.assertEqual(self.live.pending_windows, [[0, 16000], [16000, 32000]])
+        self.assertFalse(TranscriptSegment.objects.filter(meeting=self.meeting).exists())
+
+    def test_assign_sections_links_speakers_across_windows(self):
+        schedule_windows(self.live, final=True)
+        self.process(0, 16000, [([1, 0], 'A1'), ([0, 1], 'B1')])
+        # 두 번째 window에서는 화자 분리 번호가 바뀌었다
+        self.process(16000, 32000, [([0.1, 1], 'B2'), ([1, 0.1], 'A2')])
+        self.process(32000, 40000, [([0.9, 0.2], 'A3')])
+
+        texts = assign_sections(self.meeting, [(0, 1.8), (1.8, 2.5)], max_speakers=2)
+
+        self.assertEqual(texts, ["speaker0: A1 A2, speaker1: B1 B2,", "speaker0: A3,"])
+        self.assertEqual(
+            set(TranscriptSegment.objects.filter(meeting=self.meeting).values_list('speaker', flat=True)),
+            {0, 1},
+        )
+
+    def test_finalize_processes_windows_left_by_failed_tasks(self):
+        schedule_windows(self.live)
+        diarization = {'speaker_embeddings': [[0, [1, 0]]]}
+        transcription = {'segments': [{'speaker': 0, 'start': 0.1, 'end': 0.3, 'text': 'a'}]}
+
+        with mock.patch('meetings.live.diarize_audio', return_value=diarization), \
+                mock.patch('meetings.live.transcribe_audio', return_value=transcription):
+            process_live_window.now(self.meeting.id, 0, 16000, 2)
+        # 두 번째 window 작업은 재시도 횟수를 넘겨 실패했다
+        with mock.patch('meetings.live.diarize_audio', side_effect=RuntimeError('diarizer failed')):
+            with self.assertRaises(RuntimeError):
+                process_live_window.now(self.meeting.id, 16000, 32000, 2)
+
+        with mock.patch('meetings.live.diarize_audio', return_value=diarization), \
+                mock.patch('meetings.live.transcribe_audio', return_value=transcription), \
+                mock.patch('meetings.views.get_llm_backend', return_value=mock.Mock(calls=0)), \
+                mock.patch('meetings.views.create_minutes', new=mock.AsyncMock(return_value="minutes")) as create_minutes:
+            finalize_live_meeting.now(
+                self.meeting.id, self.meeting.title, ['first', 'second'],
+                ['2024-12-01 00:00:02', '2024-12-01 00:00:03'], '2024-12-01 00:00:00', 2,
+            )
+
+        self.live.refresh_from_db()
+        self.assertEqual(self.live.pending_windows, [])
+        self.assertEqual(self.live.processed_samples, 40000)
+        self.assertEqual(create_minutes.call_args.args[2], ["speaker0: a a,", "speaker0: a,"])
+        self.meeting.refresh_from_db()
+        self.assertEqual(self.meeting.meeting_minutes, "minutes")
+        self.assertEqual(self.meeting.minutes_status, "done")
+        self.assertFalse(os.path.exists(live_path(self.meeting.id)))
+
+
+@override_settings(MEETING_MINUTES_POLL_INTERVAL=0.01, MEETING_MINUTES_STREAM_TIMEOUT=0.1)
+class MinutesStreamTests(TestCase):
+    def setUp(self):
+        self.meeting = create_meeting()
+
+    def events(self):
+        events = []
+        for message in MeetingMinutesStreamView().events(self.meeting.id):
+            if message.startswith('event: '):
+                event, data = message.strip().split('\n')
+                events.append((event[len('event: '):], json.loads(data[len('data: '):])))
+        return events
+
+    def test_done_sends_saved_minutes(self):
+        Meeting.objects.filter(id=self.meeting.id).update(meeting_minutes="final", minutes_status="done")
+        self.assertEqual(self.events(), [('done', {'minutes': "final"})])
+
+    def test_processing_streams_draft_until_timeout(self):
+        Meeting.objects.filter(id=self.meeting.id).update(meeting_minutes="old", minutes_draft="draft", minutes_status="processing")
+        started = time.monotonic()
+        # 초안은 바뀌었을 때만 한 번 보내고, 타임아웃이 지나면 종료한다
+        self.assertEqual(self.events(), [('minutes', {'minutes': "draft"})])
+        self.assertGreaterEqual(time.monotonic() - started, 0.1)
+
+    def test_failed_sends_error_with_previous_minutes(self):
+        Meeting.objects.filter(id=self.meeting.id).update(meeting_minutes="old", minutes_status="failed")
+        [(event, data)] = self.events()
+        self.assertEqual(event, 'error')
+        self.assertEqual(data['minutes'], "old")
+
+    def test_final_task_failure_marks_minutes_failed(self):
+        Meeting.objects.filter(id=self.meeting.id).update(meeting_minutes="old", minutes_draft="draft", minutes_status="processing")
+        completed = CompletedTask(
+            task_name='meetings.views.process_meeting_data',
+            task_params=json.dumps(([], {'meeting_id': self.meeting.id, 'record_artifact': 'abc'})),
+        )
+        task_failed.send(sender=CompletedTask, task_id=1, completed_task=completed)
+
+        self.meeting.refresh_from_db()
+        self.assertEqual(self.meeting.minutes_status, "failed")
+        self.assertIsNone(self.meeting.minutes_draft)
+        self.assertEqual(self.meeting.meeting_minutes, "old")
+
+
+class RunStageTests(TestCase):
+    def setUp(self):
+        self.meeting = create_meeting()
+
+    def test_resumes_from_checkpoint(self):
+        calls = []
+
+        def split():
+            calls.append(1)
+            return ['a.wav', 'b.wav']
+
+        self.assertEqual(run_stage(self.meeting, 'abc', 'split', split), ['a.wav', 'b.wav'])
+        # 재시도: 저장된 결과를 사용하고 단계를 다시 실행하지 않는다
+        self.assertEqual(run_stage(self.meeting, 'abc', 'split', split), ['a.wav', 'b.wav'])
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(ProcessingStageReport.objects.filter(meeting=self.meeting, stage='split').count(), 1)
+
+    def test_invalid_checkpoint_runs_stage_again(self):
+        run_stage(self.meeting, 'abc', 'split', lambda: ['old.wav'])
+        data = run_stage(self.meeting, 'abc', 'split', lambda: ['new.wav'], is_valid=lambda paths: False)
+
+        self.assertEqual(data, ['new.wav'])
+        self.assertEqual(ProcessingCheckpoint.objects.get(meeting=self.meeting, stage='split').data, ['new.wav'])
+
+    def test_checkpoints_are_per_recording(self):
+        run_stage(self.meeting, 'abc', 'split', lambda: ['abc.wav'])
+        self.assertEqual(run_stage(self.meeting, 'def', 'split', lambda: ['def.wav']), ['def.wav'])
+
+
+class MinutesTaskCleanupTests(TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.settings_override = override_settings(
+            MEETING_OUTPUT_ROOT=os.path.join(self.tmp_dir, 'output'),
+            MEETING_ARTIFACT_ROOT=os.path.join(self.tmp_dir, 'artifacts'),
+        )
+        self.settings_override.enable()
+        self.meeting = create_meeting()
+        self.sha256 = 'ab' * 32
+
+        os.makedirs(output_dir(self.meeting.id, self.sha256))
+        with open(os.path.join(output_dir(self.meeting.id, self.sha256), 'section_1.wav'), 'wb') as f:
+            f.write(b'wav')
+        ProcessingCheckpoint.objects.create(meeting=self.meeting, record_artifact=self.sha256, stage='split', data=[])
+
+    def tearDown(self):
+        self.settings_override.disable()
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def test_clear_checkpoints_removes_output_dir(self):
+        clear_checkpoints(self.meeting.id, self.sha256)
+
+        self.assertFalse(ProcessingCheckpoint.objects.filter(meeting=self.meeting).exists())
+        self.assertFalse(os.path.exists(output_dir(self.meeting.id, self.sha256)))
+
+    def test_final_failure_releases_recording(self):
+        os.makedirs(os.path.dirname(artifact_path(self.sha256)))
+        with open(artifact_path(self.sha256), 'wb') as f:
+            f.write(b'recording')
+        Artifact.objects.create(sha256=self.sha256, size=9, ref_count=1)
+
+        completed = CompletedTask(
+            task_name='meetings.views.process_meeting_data',
+            task_params=json.dumps(([], {'meeting_id': self.meeting.id, 'record_artifact': self.sha256})),
+        )
+        task_failed.send(sender=CompletedTask, task_id=1, completed_task=completed)
+
+        self.assertFalse(Artifact.objects.filter(sha256=self.sha256).exists())
+        self.assertFalse(os.path.exists(artifact_path(self.sha256)))
+        self.assertFalse(ProcessingCheckpoint.objects.filter(meeting=self.meeting).exists())
+        self.assertFalse(os.path.exists(output_dir(self.meeting.id, self.sha256)))
+
+    def test_other_task_failure_is_ignored(self):
+        completed = CompletedTask(
+            task_name='meetings.views.process_live_window',
+            task_params=json.dumps(([], {'meeting_id': self.meeting.id})),
+        )
+        task_failed.send(sender=CompletedTask, task_id=1, completed_task=completed)
+
+        self.meeting.refresh_from_db()
+        self.assertEqual(self.meeting.minutes_status, "none")
+        self.assertTrue(ProcessingCheckpoint.objects.filter(meeting=self.meeting).exists())
+
+
+class LLMClientTests(SimpleTestCase):
+    """
+    aiohttp 테스트 서버(FakeOpenAI 또는 상태 코드를 차례로 돌려주는 서버)로 LLMClient의 재시도 정책을 확인한다.
+    """
+
+    def llm_client(self, server, retries=2, backoff=0):
+        return LLMClient(
+            base_url=str(server.make_url('/v1')), api_key='test', max_connections=4,
+            connect_timeout=1, read_timeout=5, retries=retries, backoff=backoff,
+        )
+
+    def status_app(self, responses):
+        """
+        요청마다 responses의 (상태 코드, 헤더)를 차례로 돌려주고, 다 쓰면 정상 응답을 돌려주는 앱.
+        """
+        from aiohttp import web
+
+        requests = []
+
+        async def chat_completions(request):
+            requests.append(time.monotonic())
+            if len(requests) <= len(responses):
+                status, headers = responses[len(requests) - 1]
+                return web.json_response({'error': {'message': 'error'}}, status=status, headers=headers)
+            return web.json_response({'choices': [{'message': {'content': 'ok'}}]})
+
+        app = web.Application()
+        app.router.add_post('/v1/chat/completions', chat_completions)
+        return app, requests
+
+    async def chat(self, app, messages=(), **kwargs):
+        from aiohttp.test_utils import TestServer
+
+        async with TestServer(app) as server:
+            client = self.llm_client(server, **kwargs)
+            try:
+                return await client.chat('model', list(messages))
+            finally:
+                await client.close()
+
+    async def test_fake_server_completion_and_stream(self):
+        from aiohttp.test_utils import TestServer
+
+        fake = FakeOpenAI(latency=0, token_delay=0, tokens=3, error_rate=0)
+        async with TestServer(fake.app()) as server:
+            client = self.llm_client(server)
+            try:
+                messages = [{'role': 'user', 'content': 'abc'}]
+                content = await client.chat('model', messages)
+                deltas = [delta async for delta in client.chat_stream('model', messages)]
+            finally:
+                await client.close()
+
+        self.assertEqual(content, "- 요약 (프롬프트 3자) 요약1 요약2")
+        self.assertEqual(''.join(deltas), content)
+        self.assertEqual(fake.requests, 2)
+
+    async def test_retries_until_success(self):
+        app, requests = self.status_app([(503, {}), (500, {})])
+        self.assertEqual(await self.chat(app), 'ok')
+        self.assertEqual(len(requests), 3)
+
+    async def test_gives_up_after_retries(self):
+        fake = FakeOpenAI(latency=0, token_delay=0, tokens=1, error_rate=1, seed=0)
+        with self.assertRaises(LLMError):
+            await self.chat(fake.app(), retries=2)
+        self.assertEqual(fake.requests, 3)
+
+    async def test_client_error_is_not_retried(self):
+        app, requests = self.status_app([(400, {})])
+        with self.assertRaises(LLMError):
+            await self.chat(app)
+        self.assertEqual(len(requests), 1)
+
+    async def test_waits_for_retry_after(self):
+        # backoff가 0이므로 두 요청 사이의 간격은 Retry-After 값에서만 생긴다
+        app, requests = self.status_app([(429, {'Retry-After': '0.2'})])
+        self.assertEqual(await self.chat(app), 'ok')
+        self.assertGreaterEqual(requests[1] - requests[0], 0.2)
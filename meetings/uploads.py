@@ -0,0 +1,186 @@
+import hashlib
+import os
+import shutil
+import tempfile
+from django.conf import settings
+from .artifacts import ingest_file
+from .audio import HEADER_BYTES, SUPPORTED_FORMATS, sniff_audio_format
+
+BLOCK_SIZE = 64 * 1024
+
+
+def upload_path(upload):
+    return os.path.join(settings.MEETING_UPLOAD_ROOT, f"{upload.id}.part")
+
+
+def file_sha256(path):
+    """
+    파일을 블록 단위로 읽어 sha256 해시를 계산하는 함수. (메모리 사용량 고정)
+    """
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(BLOCK_SIZE), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def check_audio_format(path):
+    """
+    파일 헤더로 지원하는 녹음 형식(wav, flac, ogg/opus, mp3)인지 확인하는 함수.
+    지원하지 않는 형식이면 ValueError를 발생시킨다.
+    """
+    with open(path, 'rb') as f:
+        audio_format = sniff_audio_format(f.read(HEADER_BYTES))
+    if audio_format is None:
+        raise ValueError(f"지원하지 않는 녹음 파일 형식입니다. ({', '.join(SUPPORTED_FORMATS)})")
+    return audio_format
+
+
+def parse_chunk_headers(request):
+    """
+    청크 전송 요청의 Upload-Offset, Content-Length, Upload-Checksum 헤더를 검증해 (offset, length, checksum)을 반환하는 함수.
+    헤더가 올바르지 않거나 청크가 MEETING_UPLOAD_MAX_CHUNK_SIZE를 넘으면 ValueError를 발생시킨다.
+    """
+    try:
+        offset = int(request.headers.get('Upload-Offset'))
+        length = int(request.META.get('CONTENT_LENGTH') or 0)
+    except (TypeError, ValueError):
+        raise ValueError("Upload-Offset 헤더가 올바르지 않습니다.")
+
+    checksum = request.headers.get('Upload-Checksum')
+    if not checksum or length <= 0:
+        raise ValueError("요청 데이터가 누락되었습니다.")
+
+    if length > settings.MEETING_UPLOAD_MAX_CHUNK_SIZE:
+        raise ValueError(f"청크 크기는 {settings.MEETING_UPLOAD_MAX_CHUNK_SIZE} 바이트를 넘을 수 없습니다.")
+    return offset, length, checksum
+
+
+def receive_chunk(upload, stream, length, checksum):
+    """
+    stream에서 length 바이트를 읽어 업로드 폴더의 임시 파일에 저장하고 청크 체크섬을 검증한 뒤 임시 파일 경로를 반환하는 함수.
+    업로드 레코드를 잠그기 전에 호출해, 느린 클라이언트의 본문을 받는 동안 같은 업로드의 다른 요청을 막지 않는다.
+    체크섬이 다르거나 본문이 짧으면 임시 파일을 지우고 ValueError를 발생시킨다. 임시 파일은 호출한 쪽에서 지워야 한다.
+    """
+    os.makedirs(settings.MEETING_UPLOAD_ROOT, exist_ok=True)
+    fd, chunk_path = tempfile.mkstemp(dir=settings.MEETING_UPLOAD_ROOT, prefix=f"{upload.id}.", suffix='.chunk')
+    os.close(fd)
+    try:
+        write_chunk_at(chunk_path, 0, stream, length, checksum)
+    except ValueError:
+        os.remove(chunk_path)
+        raise
+    return chunk_path
+
+
+def append_chunk(upload, chunk_path):
+    """
+    receive_chunk로 받은 청크를 업로드 파일의 upload.offset 위치에 기록하고 새 offset을 반환하는 함수.
+    업로드 레코드를 select_for_update로 잠근 상태에서 호출해야 한다.
+    첫 청크는 헤더로 녹음 파일 형식을 확인해, 지원하지 않는 형식이면 나머지를 받기 전에 거절한다.
+    """
+    path = upload_path(upload)
+    with open(chunk_path, 'rb') as chunk, open(path, 'r+b' if os.path.exists(path) else 'wb') as f:
+        f.seek(upload.offset)
+        shutil.copyfileobj(chunk, f, BLOCK_SIZE)
+        # 이전 시도에서 남은 데이터가 있다면 잘라낸다
+        f.truncate()
+        f.flush()
+        os.fsync(f.fileno())
+
+    offset = upload.offset + os.path.getsize(chunk_path)
+    if upload.offset == 0 and offset >= HEADER_BYTES:
+        try:
+            check_audio_format(path)
+        except ValueError:
+            os.remove(path)
+            raise
+    return offset
+
+
+def write_chunk_at(path, offset, stream, length, checksum):
+    """
+    stream에서 length 바이트를 읽어 path 파일의 offset 위치에 기록하고 청크 체크섬을 검증하는 함수.
+    """
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+
+    digest = hashlib.sha256()
+    remaining = length
+    with open(path, 'r+b' if os.path.exists(path) else 'wb') as f:
+        f.seek(offset)
+        while remaining > 0:
+            block = stream.read(min(BLOCK_SIZE, remaining))
+            if not block:
+                break
+            digest.update(block)
+            f.write(block)
+            remaining -= len(block)
+
+        if remaining or digest.hexdigest() != checksum.lower():
+            f.truncate(offset)
+            if remaining:
+                raise ValueError("청크 데이터가 Content-Length보다 짧습니다.")
+            raise ValueError("청크 체크섬이 일치하지 않습니다.")
+
+        # 이전 시도에서 남은 데이터가 있다면 잘라낸다
+        f.truncate()
+        f.flush()
+        os.fsync(f.fileno())
+
+    return offset + length
+
+
+def finalize_upload(upload):
+    """
+    모든 청크가 도착한 업로드의 전체 체크섬을 검증하고 artifact 저장소로 옮긴 뒤 완료 상태로 변경하는 함수.
+    artifact의 참조 하나는 업로드 레코드가 소유하며, 레코드가 삭제될 때 해제된다.
+    체크섬이 다르면 업로드를 처음부터 다시 받도록 초기화하고 ValueError를 발생시킨다.
+    """
+    path = upload_path(upload)
+    if file_sha256(path) != upload.sha256.lower():
+        os.remove(path)
+        upload.offset = 0
+        upload.save()
+        raise ValueError("업로드된 파일의 체크섬이 일치하지 않습니다. 처음부터 다시 업로드하세요.")
+
+    try:
+        check_audio_format(path)
+    except ValueError:
+        os.remove(path)
+        upload.offset = 0
+        upload.save()
+        raise
+
+    ingest_file(path, upload.sha256)
+    upload.status = "complete"
+    upload.save()
+
+
+def save_uploaded_file(upload, uploaded_file):
+    """
+    multipart로 한 번에 전송된 파일을 청크 단위로 업로드 경로에 저장하는 함수.
+    (기존 record_file 방식 호환용) 지원하지 않는 녹음 형식이면 ValueError를 발생시킨다.
+    """
+    path = upload_path(upload)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+
+    digest = hashlib.sha256()
+    size = 0
+    with open(path, 'wb') as f:
+        for chunk in uploaded_file.chunks(BLOCK_SIZE):
+            digest.update(chunk)
+            f.write(chunk)
+            size += len(chunk)
+
+    try:
+        check_audio_format(path)
+    except ValueError:
+        os.remove(path)
+        raise
+
+    upload.total_size = size
+    upload.offset = size
+    upload.sha256 = digest.hexdigest()
+    ingest_file(path, upload.sha256)
+    upload.status = "complete"
+    upload.save()
@@ -1,8 +1,14 @@
 from django.urls import path
-from .views import MeetingView, MeetingDetailView, MeetingStatusUpdateView
+from .views import MeetingView, MeetingDetailView, MeetingStatusUpdateView, RecordingUploadView, RecordingUploadDetailView, MeetingProcessingReportView, MeetingTranscriptView, MeetingLiveAudioView, MeetingMinutesStreamView
 
 urlpatterns = [
     path("", MeetingView.as_view()),
     path("<int:meeting_id>/", MeetingDetailView.as_view()),
     path("status/<int:meeting_id>/", MeetingStatusUpdateView.as_view()),
+    path("<int:meeting_id>/uploads/", RecordingUploadView.as_view()),
+    path("uploads/<uuid:upload_id>/", RecordingUploadDetailView.as_view()),
+    path("<int:meeting_id>/processing/", MeetingProcessingReportView.as_view()),
+    path("<int:meeting_id>/transcript/", MeetingTranscriptView.as_view()),
+    path("<int:meeting_id>/live/", MeetingLiveAudioView.as_view()),
+    path("<int:meeting_id>/minutes/stream/", MeetingMinutesStreamView.as_view()),
 ]
\ No newline at end of file
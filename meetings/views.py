@@ -1,16 +1,28 @@
-from django.http import JsonResponse
+from django.http import JsonResponse, StreamingHttpResponse
 import asyncio
-from asgiref.sync import sync_to_async
-from sentence_transformers import SentenceTransformer, util
-import base64
+from sentence_transformers import util
 from pydub import AudioSegment
-from io import BytesIO
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.permissions import AllowAny
 from rest_framework import status
-from .models import Meeting
-from .serializers import MeetingCreateSerializer
+from rest_framework.pagination import PageNumberPagination
+from django.db import IntegrityError, transaction
+from django.core.exceptions import ValidationError
+from django.conf import settings
+from .models import Meeting, RecordingUpload, ProcessingStageReport, TranscriptSegment, LiveTranscription
+from .uploads import parse_chunk_headers, receive_chunk, append_chunk, write_chunk_at, finalize_upload, save_uploaded_file
+from .live import LIVE_ARTIFACT, live_path, schedule_windows, process_window, assign_sections
+from .audio import TARGET_SR
+from .artifacts import acquire, release
+from .registry import registry
+from .llm import CachedLLMBackend, get_llm_backend, run_async
+from .summarize import MinutesDraft, render_minutes, summarize_section
+from .pipeline import (
+    run_stage, clear_checkpoints, split_recording, process_sections, diarize_section_file, transcribe_section_file, save_transcript_segments,
+    measure_sections, measure_diarizations, measure_transcriptions,
+)
+from .serializers import MeetingCreateSerializer, ProcessingStageReportSerializer, TranscriptSegmentSerializer
 from accounts.authenticate import SafeJWTAuthentication
 from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
@@ -19,16 +31,9 @@ from datetime import datetime
 from background_task import background
 from datetime import timedelta
 import os
-from tqdm import tqdm
 import numpy as np
-import soundfile as sf
-import librosa
-import glob
-import speech_recognition as sr
-import nemo.collections.asr as nemo_asr
-from simple_diarizer.diarizer import Diarizer
-import openai
 import json
+import time
 
 
 class MeetingView(APIView):
@@ -256,9 +261,514 @@ class MeetingDetailView(APIView):
         return Response(serializer.data, status=status.HTTP_200_OK)
 
 
-openai.api_key = os.getenv("OPENAI_API_KEY")
 
-model = SentenceTransformer('all-MiniLM-L6-v2')
+class MeetingProcessingReportView(APIView):
+    permission_classes = [AllowAny]
+    authentication_classes = [SafeJWTAuthentication]
+
+    @swagger_auto_schema(
+        operation_summary="회의 처리 단계별 리포트 조회",
+        operation_description="회의 녹음 처리의 단계별 소요 시간, CPU 시간, 최대 메모리, 처리한 오디오 길이, 세그먼트 수, 외부 호출 수를 조회합니다.",
+        responses={
+            200: openapi.Response(
+                description='Processing report retrieved successfully',
+                schema=openapi.Schema(
+                    type=openapi.TYPE_OBJECT,
+                    properties={
+                        'meeting_id': openapi.Schema(type=openapi.TYPE_INTEGER, description='회의 ID'),
+                        'stages': openapi.Schema(
+                            type=openapi.TYPE_ARRAY,
+                            items=openapi.Schema(
+                                type=openapi.TYPE_OBJECT,
+                                properties={
+                                    'stage': openapi.Schema(type=openapi.TYPE_STRING, enum=["split", "diarize", "transcribe", "summarize", "save"], description='처리 단계'),
+                                    'record_artifact': openapi.Schema(type=openapi.TYPE_STRING, description='녹음 파일 sha256'),
+                                    'wall_seconds': openapi.Schema(type=openapi.TYPE_NUMBER, description='소요 시간 (초)'),
+                                    'cpu_seconds': openapi.Schema(type=openapi.TYPE_NUMBER, description='CPU 시간 (초, 자식 프로세스 포함)'),
+                                    'peak_rss_bytes': openapi.Schema(type=openapi.TYPE_INTEGER, description='최대 메모리 사용량 (바이트)'),
+                                    'audio_seconds': openapi.Schema(type=openapi.TYPE_NUMBER, description='처리한 오디오 길이 (초)'),
+                                    'segment_count': openapi.Schema(type=openapi.TYPE_INTEGER, description='세그먼트 수'),
+                                    'external_calls': openapi.Schema(type=openapi.TYPE_INTEGER, description='외부 API 호출 수'),
+                                    'created_at': openapi.Schema(type=openapi.TYPE_STRING, format='date-time', description='기록 시각'),
+                                }
+                            )
+                        ),
+                        'total_wall_seconds': openapi.Schema(type=openapi.TYPE_NUMBER, description='전체 소요 시간 (초)'),
+                    }
+                )
+            ),
+            401: openapi.Response(description='Authentication failed'),
+            404: openapi.Response(description='Meeting not found')
+        }
+    )
+    def get(self, request, meeting_id):
+        authentication = SafeJWTAuthentication()
+        user, auth_error = authentication.authenticate(request)
+
+        if not user:
+            return Response({'error': 'Authentication failed.'}, status=status.HTTP_401_UNAUTHORIZED)
+
+        if not Meeting.objects.filter(id=meeting_id).exists():
+            return Response({"error": "Meeting not found"}, status=status.HTTP_404_NOT_FOUND)
+
+        reports = ProcessingStageReport.objects.filter(meeting_id=meeting_id).order_by('created_at')
+        serializer = ProcessingStageReportSerializer(reports, many=True)
+        return Response({
+            "meeting_id": meeting_id,
+            "stages": serializer.data,
+            "total_wall_seconds": sum(report.wall_seconds for report in reports),
+        }, status=status.HTTP_200_OK)
+
+
+class TranscriptSegmentPagination(PageNumberPagination):
+    page_size = 100
+    page_size_query_param = 'page_size'
+    max_page_size = 1000
+
+
+class MeetingTranscriptView(APIView):
+    permission_classes = [AllowAny]
+    authentication_classes = [SafeJWTAuthentication]
+
+    @swagger_auto_schema(
+        operation_summary="회의 전사 결과 조회",
+        operation_description="회의의 화자별 전사 세그먼트를 페이지 단위로 조회합니다. start/end는 섹션 시작 기준 초 단위입니다.",
+        manual_parameters=[
+            openapi.Parameter('page', openapi.IN_QUERY, type=openapi.TYPE_INTEGER, description="페이지 번호"),
+            openapi.Parameter('page_size', openapi.IN_QUERY, type=openapi.TYPE_INTEGER, description="페이지 크기 (최대 1000)"),
+            openapi.Parameter('section', openapi.IN_QUERY, type=openapi.TYPE_STRING, description="섹션 이름으로 필터링"),
+            openapi.Parameter('speaker', openapi.IN_QUERY, type=openapi.TYPE_INTEGER, description="화자 번호로 필터링"),
+        ],
+        responses={
+            200: openapi.Response(
+                description='Transcript retrieved successfully',
+                schema=openapi.Schema(
+                    type=openapi.TYPE_OBJECT,
+                    properties={
+                        'count': openapi.Schema(type=openapi.TYPE_INTEGER, description='전체 세그먼트 수'),
+                        'next': openapi.Schema(type=openapi.TYPE_STRING, description='다음 페이지 URL'),
+                        'previous': openapi.Schema(type=openapi.TYPE_STRING, description='이전 페이지 URL'),
+                        'results': openapi.Schema(
+                            type=openapi.TYPE_ARRAY,
+                            items=openapi.Schema(
+                                type=openapi.TYPE_OBJECT,
+                                properties={
+                                    'id': openapi.Schema(type=openapi.TYPE_INTEGER, description='세그먼트 ID'),
+                                    'section': openapi.Schema(type=openapi.TYPE_STRING, description='섹션 이름'),
+                                    'speaker': openapi.Schema(type=openapi.TYPE_INTEGER, description='화자 번호'),
+                                    'start': openapi.Schema(type=openapi.TYPE_NUMBER, description='시작 시각 (초)'),
+                                    'end': openapi.Schema(type=openapi.TYPE_NUMBER, description='종료 시각 (초)'),
+                                    'text': openapi.Schema(type=openapi.TYPE_STRING, description='전사 텍스트'),
+                                }
+                            )
+                        ),
+                    }
+                )
+            ),
+            401: openapi.Response(description='Authentication failed'),
+            404: openapi.Response(description='Meeting not found')
+        }
+    )
+    def get(self, request, meeting_id):
+        authentication = SafeJWTAuthentication()
+        user, auth_error = authentication.authenticate(request)
+
+        if not user:
+            return Response({'error': 'Authentication failed.'}, status=status.HTTP_401_UNAUTHORIZED)
+
+        if not Meeting.objects.filter(id=meeting_id).exists():
+            return Response({"error": "Meeting not found"}, status=status.HTTP_404_NOT_FOUND)
+
+        segments = TranscriptSegment.objects.filter(meeting_id=meeting_id).select_related('section').order_by('section__id', 'start', 'id')
+
+        section = request.query_params.get('section')
+        if section:
+            segments = segments.filter(section__name=section)
+
+        speaker = request.query_params.get('speaker')
+        if speaker is not None and speaker.isdigit():
+            segments = segments.filter(speaker=int(speaker))
+
+        paginator = TranscriptSegmentPagination()
+        page = paginator.paginate_queryset(segments, request, view=self)
+        serializer = TranscriptSegmentSerializer(page, many=True)
+        return paginator.get_paginated_response(serializer.data)
+
+
+class MeetingMinutesStreamView(APIView):
+    permission_classes = [AllowAny]
+    authentication_classes = [SafeJWTAuthentication]
+
+    @swagger_auto_schema(
+        operation_summary="회의록 작성 과정 스트리밍 (SSE)",
+        operation_description=(
+            "회의록이 생성되는 동안 작성 중인 회의록 전체를 server-sent events로 전송합니다. "
+            "내용이 바뀔 때마다 'minutes' 이벤트({\"minutes\": ...})를 보내고, 이번 회의록 작업의 저장이 끝나면 "
+            "최종 회의록과 함께 'done' 이벤트를 보낸 뒤 연결을 종료합니다. "
+            "작업이 마지막 재시도까지 실패하면 이전 회의록과 함께 'error' 이벤트를 보낸 뒤 연결을 종료합니다."
+        ),
+        responses={
+            200: openapi.Response(description='text/event-stream'),
+            401: openapi.Response(description='인증 실패'),
+            404: openapi.Response(description='회의를 찾을 수 없습니다.')
+        }
+    )
+    def get(self, request, meeting_id):
+        authentication = SafeJWTAuthentication()
+        user, auth_error = authentication.authenticate(request)
+
+        if not user:
+            return Response({'error': '인증에 실패했습니다.'}, status=status.HTTP_401_UNAUTHORIZED)
+
+        if not Meeting.objects.filter(id=meeting_id).exists():
+            return Response({"error": "회의를 찾을 수 없습니다."}, status=status.HTTP_404_NOT_FOUND)
+
+        response = StreamingHttpResponse(self.events(meeting_id), content_type='text/event-stream')
+        response['Cache-Control'] = 'no-cache'
+        response['X-Accel-Buffering'] = 'no'
+        return response
+
+    def events(self, meeting_id):
+        """
+        회의록을 MEETING_MINUTES_POLL_INTERVAL초마다 확인해 바뀐 경우에만 전송하는 generator.
+        작업이 진행 중이면 작성 중인 초안(minutes_draft)을, 아니면 저장된 회의록(meeting_minutes)을 보낸다.
+        회의의 minutes_status가 done(현재 작업의 회의록 저장 완료)이나 failed(마지막 재시도까지 실패)가 되거나
+        MEETING_MINUTES_STREAM_TIMEOUT초가 지나면 종료한다.
+        """
+        deadline = time.monotonic() + settings.MEETING_MINUTES_STREAM_TIMEOUT
+        last_minutes = None
+        heartbeat_at = time.monotonic()
+        while time.monotonic() < deadline:
+            minutes, minutes_draft, minutes_status = Meeting.objects.filter(id=meeting_id).values_list(
+                'meeting_minutes', 'minutes_draft', 'minutes_status'
+            ).first() or (None, None, None)
+
+            if minutes_status == 'done':
+                yield f"event: done\ndata: {json.dumps({'minutes': minutes}, ensure_ascii=False)}\n\n"
+                return
+
+            if minutes_status == 'failed':
+                yield f"event: error\ndata: {json.dumps({'error': '회의록 생성에 실패했습니다.', 'minutes': minutes}, ensure_ascii=False)}\n\n"
+                return
+
+            if minutes_status == 'processing':
+                minutes = minutes_draft
+
+            if minutes != last_minutes:
+                last_minutes = minutes
+                heartbeat_at = time.monotonic()
+                yield f"event: minutes\ndata: {json.dumps({'minutes': minutes}, ensure_ascii=False)}\n\n"
+            elif time.monotonic() - heartbeat_at >= 15:
+                # 프록시가 유휴 연결을 끊지 않도록 주석 줄을 보낸다
+                heartbeat_at = time.monotonic()
+                yield ": keep-alive\n\n"
+
+            time.sleep(settings.MEETING_MINUTES_POLL_INTERVAL)
+
+
+class RecordingUploadView(APIView):
+    permission_classes = [AllowAny]
+    authentication_classes = [SafeJWTAuthentication]
+
+    @swagger_auto_schema(
+        operation_summary="녹음 파일 업로드 생성",
+        operation_description=(
+            "녹음 파일을 청크 단위로 나누어 업로드하기 위한 업로드 세션을 생성합니다. "
+            "wav, flac, ogg/opus, mp3 형식을 지원하며, 형식은 파일 이름이 아니라 첫 청크의 헤더로 확인합니다."
+        ),
+        request_body=openapi.Schema(
+            type=openapi.TYPE_OBJECT,
+            properties={
+                'filename': openapi.Schema(type=openapi.TYPE_STRING, description="녹음 파일 이름"),
+                'total_size': openapi.Schema(type=openapi.TYPE_INTEGER, description="전체 파일 크기 (바이트)"),
+                'sha256': openapi.Schema(type=openapi.TYPE_STRING, description="전체 파일의 sha256 체크섬 (hex)"),
+            },
+            required=['filename', 'total_size', 'sha256'],
+        ),
+        responses={
+            201: openapi.Response(
+                description='업로드가 생성되었습니다.',
+                schema=openapi.Schema(
+                    type=openapi.TYPE_OBJECT,
+                    properties={
+                        'upload_id': openapi.Schema(type=openapi.TYPE_STRING, format='uuid', description='업로드 ID'),
+                        'offset': openapi.Schema(type=openapi.TYPE_INTEGER, description='다음 청크를 기록할 위치'),
+                        'max_chunk_size': openapi.Schema(type=openapi.TYPE_INTEGER, description='청크 최대 크기 (바이트)'),
+                    }
+                )
+            ),
+            400: openapi.Response(description='요청이 올바르지 않습니다.'),
+            401: openapi.Response(description='인증 실패'),
+            404: openapi.Response(description='회의를 찾을 수 없습니다.')
+        }
+    )
+    def post(self, request, meeting_id):
+        authentication = SafeJWTAuthentication()
+        user, auth_error = authentication.authenticate(request)
+
+        if not user:
+            return Response({'error': '인증에 실패했습니다.'}, status=status.HTTP_401_UNAUTHORIZED)
+
+        try:
+            meeting = Meeting.objects.get(id=meeting_id)
+        except Meeting.DoesNotExist:
+            return Response({"error": "회의를 찾을 수 없습니다."}, status=status.HTTP_404_NOT_FOUND)
+
+        filename = request.data.get('filename')
+        total_size = request.data.get('total_size')
+        sha256 = request.data.get('sha256')
+
+        if not filename or not total_size or not sha256:
+            return Response({"error": "요청 데이터가 누락되었습니다."}, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            total_size = int(total_size)
+        except (TypeError, ValueError):
+            return Response({"error": "total_size는 정수여야 합니다."}, status=status.HTTP_400_BAD_REQUEST)
+
+        if total_size <= 0 or len(sha256) != 64:
+            return Response({"error": "total_size 또는 sha256 값이 올바르지 않습니다."}, status=status.HTTP_400_BAD_REQUEST)
+
+        upload = RecordingUpload.objects.create(meeting=meeting, filename=filename, total_size=total_size, sha256=sha256.lower())
+
+        return Response({
+            "upload_id": str(upload.id),
+            "offset": upload.offset,
+            "max_chunk_size": settings.MEETING_UPLOAD_MAX_CHUNK_SIZE,
+        }, status=status.HTTP_201_CREATED)
+
+
+class RecordingUploadDetailView(APIView):
+    permission_classes = [AllowAny]
+    authentication_classes = [SafeJWTAuthentication]
+
+    @swagger_auto_schema(
+        operation_summary="녹음 파일 업로드 상태 조회",
+        operation_description="업로드가 끊겼을 때 이어서 전송할 수 있도록 현재 offset과 상태를 조회합니다.",
+        responses={
+            200: openapi.Response(
+                description='업로드 상태',
+                schema=openapi.Schema(
+                    type=openapi.TYPE_OBJECT,
+                    properties={
+                        'upload_id': openapi.Schema(type=openapi.TYPE_STRING, format='uuid', description='업로드 ID'),
+                        'offset': openapi.Schema(type=openapi.TYPE_INTEGER, description='다음 청크를 기록할 위치'),
+                        'total_size': openapi.Schema(type=openapi.TYPE_INTEGER, description='전체 파일 크기 (바이트)'),
+                        'status': openapi.Schema(type=openapi.TYPE_STRING, enum=["uploading", "complete"], description='업로드 상태'),
+                    }
+                )
+            ),
+            401: openapi.Response(description='인증 실패'),
+            404: openapi.Response(description='업로드를 찾을 수 없습니다.')
+        }
+    )
+    def get(self, request, upload_id):
+        authentication = SafeJWTAuthentication()
+        user, auth_error = authentication.authenticate(request)
+
+        if not user:
+            return Response({'error': '인증에 실패했습니다.'}, status=status.HTTP_401_UNAUTHORIZED)
+
+        try:
+            upload = RecordingUpload.objects.get(id=upload_id)
+        except RecordingUpload.DoesNotExist:
+            return Response({"error": "업로드를 찾을 수 없습니다."}, status=status.HTTP_404_NOT_FOUND)
+
+        return Response({
+            "upload_id": str(upload.id),
+            "offset": upload.offset,
+            "total_size": upload.total_size,
+            "status": upload.status,
+        }, status=status.HTTP_200_OK)
+
+    @swagger_auto_schema(
+        operation_summary="녹음 파일 청크 업로드",
+        operation_description=(
+            "요청 본문(application/octet-stream)의 청크를 Upload-Offset 위치에 기록합니다. "
+            "Upload-Checksum 헤더에는 청크의 sha256 체크섬(hex)을 담아야 하며, "
+            "마지막 청크가 기록되면 전체 파일의 체크섬을 검증한 뒤 업로드를 완료합니다."
+        ),
+        manual_parameters=[
+            openapi.Parameter('Upload-Offset', openapi.IN_HEADER, type=openapi.TYPE_INTEGER, required=True, description="청크의 시작 위치"),
+            openapi.Parameter('Upload-Checksum', openapi.IN_HEADER, type=openapi.TYPE_STRING, required=True, description="청크의 sha256 체크섬 (hex)"),
+        ],
+        responses={
+            200: openapi.Response(description='청크가 기록되었습니다.'),
+            400: openapi.Response(description='요청이 올바르지 않거나 체크섬이 일치하지 않습니다.'),
+            401: openapi.Response(description='인증 실패'),
+            404: openapi.Response(description='업로드를 찾을 수 없습니다.'),
+            409: openapi.Response(description='offset이 현재 업로드 위치와 다릅니다.'),
+        }
+    )
+    def put(self, request, upload_id):
+        authentication = SafeJWTAuthentication()
+        user, auth_error = authentication.authenticate(request)
+
+        if not user:
+            return Response({'error': '인증에 실패했습니다.'}, status=status.HTTP_401_UNAUTHORIZED)
+
+        try:
+            offset, length, checksum = parse_chunk_headers(request)
+        except ValueError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            upload = RecordingUpload.objects.get(id=upload_id)
+        except RecordingUpload.DoesNotExist:
+            return Response({"error": "업로드를 찾을 수 없습니다."}, status=status.HTTP_404_NOT_FOUND)
+
+        # 본문은 잠그기 전에 임시 파일로 받아 체크섬을 확인하고, 잠금은 offset 확인과 기록에만 사용한다
+        try:
+            chunk_path = receive_chunk(upload, request.stream, length, checksum)
+        except ValueError as e:
+            return Response({"error": str(e), "offset": upload.offset}, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            with transaction.atomic():
+                upload = RecordingUpload.objects.select_for_update().get(id=upload_id)
+
+                if upload.status == "complete":
+                    return Response({"error": "이미 완료된 업로드입니다.", "offset": upload.offset}, status=status.HTTP_409_CONFLICT)
+
+                if offset != upload.offset:
+                    return Response({"error": "offset이 현재 업로드 위치와 다릅니다.", "offset": upload.offset}, status=status.HTTP_409_CONFLICT)
+
+                if offset + length > upload.total_size:
+                    return Response({"error": "청크가 전체 파일 크기를 넘습니다."}, status=status.HTTP_400_BAD_REQUEST)
+
+                upload.offset = append_chunk(upload, chunk_path)
+                upload.save()
+        except ValueError as e:
+            return Response({"error": str(e), "offset": upload.offset}, status=status.HTTP_400_BAD_REQUEST)
+        except RecordingUpload.DoesNotExist:
+            return Response({"error": "업로드를 찾을 수 없습니다."}, status=status.HTTP_404_NOT_FOUND)
+        finally:
+            os.remove(chunk_path)
+
+        # 마지막 청크를 기록한 요청만 여기에 오므로(이후 청크는 offset 확인에서 거절된다) 전체 체크섬 검증은 잠금 밖에서 한다
+        if upload.offset == upload.total_size:
+            try:
+                finalize_upload(upload)
+            except ValueError as e:
+                return Response({"error": str(e), "offset": upload.offset}, status=status.HTTP_400_BAD_REQUEST)
+
+        return Response({
+            "upload_id": str(upload.id),
+            "offset": upload.offset,
+            "total_size": upload.total_size,
+            "status": upload.status,
+        }, status=status.HTTP_200_OK)
+
+
+class MeetingLiveAudioView(APIView):
+    permission_classes = [AllowAny]
+    authentication_classes = [SafeJWTAuthentication]
+
+    @swagger_auto_schema(
+        operation_summary="실시간 전사 상태 조회",
+        operation_description="진행 중인 회의에서 수신한 오디오 크기와 전사 처리 진행 상황을 조회합니다.",
+        responses={
+            200: openapi.Response(
+                description='실시간 전사 상태',
+                schema=openapi.Schema(
+                    type=openapi.TYPE_OBJECT,
+                    properties={
+                        'offset': openapi.Schema(type=openapi.TYPE_INTEGER, description='다음 청크를 기록할 위치 (바이트)'),
+                        'scheduled_seconds': openapi.Schema(type=openapi.TYPE_NUMBER, description='전사 작업이 예약된 오디오 길이 (초)'),
+                        'processed_seconds': openapi.Schema(type=openapi.TYPE_NUMBER, description='전사가 끝난 오디오 길이 (초)'),
+                    }
+                )
+            ),
+            401: openapi.Response(description='인증 실패'),
+            404: openapi.Response(description='회의를 찾을 수 없습니다.')
+        }
+    )
+    def get(self, request, meeting_id):
+        authentication = SafeJWTAuthentication()
+        user, auth_error = authentication.authenticate(request)
+
+        if not user:
+            return Response({'error': '인증에 실패했습니다.'}, status=status.HTTP_401_UNAUTHORIZED)
+
+        try:
+            meeting = Meeting.objects.get(id=meeting_id)
+        except Meeting.DoesNotExist:
+            return Response({"error": "회의를 찾을 수 없습니다."}, status=status.HTTP_404_NOT_FOUND)
+
+        live = LiveTranscription.objects.filter(meeting=meeting).first() or LiveTranscription(meeting=meeting)
+        return Response(self.live_status(live), status=status.HTTP_200_OK)
+
+    @swagger_auto_schema(
+        operation_summary="실시간 전사 오디오 청크 전송",
+        operation_description=(
+            "진행 중인 회의의 오디오를 16kHz mono 16bit PCM(application/octet-stream) 청크로 이어서 전송합니다. "
+            "Upload-Offset에는 지금까지 보낸 바이트 수를, Upload-Checksum에는 청크의 sha256 체크섬(hex)을 담아야 합니다. "
+            "오디오가 일정 길이만큼 쌓이면 해당 구간의 화자 분리/STT 작업이 예약되며, 결과는 전사 조회 API에서 바로 확인할 수 있습니다."
+        ),
+        manual_parameters=[
+            openapi.Parameter('Upload-Offset', openapi.IN_HEADER, type=openapi.TYPE_INTEGER, required=True, description="청크의 시작 위치"),
+            openapi.Parameter('Upload-Checksum', openapi.IN_HEADER, type=openapi.TYPE_STRING, required=True, description="청크의 sha256 체크섬 (hex)"),
+        ],
+        responses={
+            200: openapi.Response(description='청크가 기록되었습니다.'),
+            400: openapi.Response(description='요청이 올바르지 않거나 체크섬이 일치하지 않습니다.'),
+            401: openapi.Response(description='인증 실패'),
+            404: openapi.Response(description='회의를 찾을 수 없습니다.'),
+            409: openapi.Response(description='진행 중인 회의가 아니거나 offset이 현재 위치와 다릅니다.'),
+        }
+    )
+    def post(self, request, meeting_id):
+        authentication = SafeJWTAuthentication()
+        user, auth_error = authentication.authenticate(request)
+
+        if not user:
+            return Response({'error': '인증에 실패했습니다.'}, status=status.HTTP_401_UNAUTHORIZED)
+
+        try:
+            offset, length, checksum = parse_chunk_headers(request)
+        except ValueError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            meeting = Meeting.objects.get(id=meeting_id)
+        except Meeting.DoesNotExist:
+            return Response({"error": "회의를 찾을 수 없습니다."}, status=status.HTTP_404_NOT_FOUND)
+
+        if meeting.is_active != "ongoing":
+            return Response({"error": "진행 중인 회의가 아닙니다."}, status=status.HTTP_409_CONFLICT)
+
+        try:
+            with transaction.atomic():
+                LiveTranscription.objects.get_or_create(meeting=meeting)
+        except IntegrityError:
+            # 동시에 들어온 첫 청크 요청이 먼저 만들었다
+            pass
+
+        with transaction.atomic():
+            live = LiveTranscription.objects.select_for_update().get(meeting=meeting)
+
+            if offset != live.received_bytes:
+                return Response({"error": "offset이 현재 위치와 다릅니다.", "offset": live.received_bytes}, status=status.HTTP_409_CONFLICT)
+
+            try:
+                live.received_bytes = write_chunk_at(live_path(meeting.id), offset, request.stream, length, checksum)
+            except ValueError as e:
+                return Response({"error": str(e), "offset": live.received_bytes}, status=status.HTTP_400_BAD_REQUEST)
+
+            windows = schedule_windows(live)
+
+        num_speakers = meeting.attendees.count()
+        for start_sample, end_sample in windows:
+            process_live_window(meeting.id, start_sample, end_sample, num_speakers, schedule=0)
+
+        return Response(self.live_status(live), status=status.HTTP_200_OK)
+
+    def live_status(self, live):
+        return {
+            "offset": live.received_bytes,
+            "scheduled_seconds": live.scheduled_samples / TARGET_SR,
+            "processed_seconds": live.processed_samples / TARGET_SR,
+        }
 
 
 if os.path.exists("meetings/minutes_vector_db.npz"):
@@ -308,10 +818,15 @@ class MeetingStatusUpdateView(APIView):
         request_body=openapi.Schema(
             type=openapi.TYPE_OBJECT,
             properties={
+                'upload_id': openapi.Schema(
+                    type=openapi.TYPE_STRING,
+                    format="uuid",
+                    description="청크 업로드가 완료된 녹음 파일의 업로드 ID"
+                ),
                 'record_file': openapi.Schema(
                     type=openapi.TYPE_STRING,
                     format="binary",
-                    description="업로드할 녹음 파일 (wav 형식)"
+                    description="업로드할 녹음 파일 (wav, flac, ogg/opus, mp3 형식, upload_id가 없을 때 사용)"
                 ),
                 'total_duration': openapi.Schema(
                     type=openapi.TYPE_STRING,
@@ -329,7 +844,7 @@ class MeetingStatusUpdateView(APIView):
                     description="회의 시작 날짜"
                 ),
             },
-            required=['record_file', 'total_duration', 'section_end_times', 'start_time'],
+            required=['total_duration', 'section_end_times', 'start_time'],
         ),
         responses={
             200: openapi.Response(description="회의 상태가 성공적으로 업데이트되었습니다."),
@@ -352,43 +867,59 @@ class MeetingStatusUpdateView(APIView):
 
         # 요청 데이터 검증
         data = request.data
+        upload_id = data.get('upload_id')
         record_file = request.FILES.get('record_file') 
         total_duration = data.get('total_duration')
         section_end_times = data.getlist('section_end_times[]')
         start_time = data.get('start_time')
         end_time = datetime.now() 
         
-        meeting = Meeting.objects.get(id=meeting_id)
         num_speakers = meeting.attendees.count()  
 
         
-        if not record_file or not total_duration or not section_end_times or not start_time:
+        live = LiveTranscription.objects.filter(meeting=meeting, received_bytes__gt=0).first()
+
+        if (not upload_id and not record_file and not live) or not total_duration or not section_end_times or not start_time:
             return Response({"error": "요청 데이터가 누락되었습니다."}, status=status.HTTP_400_BAD_REQUEST)
 
-        if not record_file.name.endswith('.wav'):
-            return Response({"error": "녹음 파일은 .wav 형식이어야 합니다."}, status=status.HTTP_400_BAD_REQUEST)
-        
-        record_file_data = record_file.read()
-        record_file_base64 = base64.b64encode(record_file_data).decode('utf-8')
+        record_artifact = None
+        if upload_id or record_file:
+            record_artifact = self.take_record_artifact(meeting, upload_id, record_file)
+            if isinstance(record_artifact, Response):
+                return record_artifact
 
         meeting.is_active = "false"
         meeting.end_time = end_time
         meeting.total_duration = total_duration
         meeting.start_time = start_time
+        meeting.minutes_status = "processing"
+        meeting.minutes_draft = None
         meeting.save()
         
         section_titles = list(meeting.sections.values_list('name', flat=True))
 
-        process_meeting_data(
-            meeting_id=meeting.id,
-            meeting_title=meeting.title,
-            section_titles=section_titles,
-            record_file_data=record_file_base64,
-            start_time=start_time,
-            section_end_times=section_end_times,
-            num_speakers=num_speakers,
-            schedule=0
-        )
+        if record_artifact:
+            process_meeting_data(
+                meeting_id=meeting.id,
+                meeting_title=meeting.title,
+                section_titles=section_titles,
+                record_artifact=record_artifact,
+                start_time=start_time,
+                section_end_times=section_end_times,
+                num_speakers=num_speakers,
+                schedule=0
+            )
+        else:
+            # 실시간 전사 중이던 회의: 마지막 window만 처리하고 요약
+            finalize_live_meeting(
+                meeting_id=meeting.id,
+                meeting_title=meeting.title,
+                section_titles=section_titles,
+                start_time=start_time,
+                section_end_times=section_end_times,
+                num_speakers=num_speakers,
+                schedule=0
+            )
 
         sections = meeting.sections.all()
         
@@ -401,146 +932,176 @@ class MeetingStatusUpdateView(APIView):
 
         return Response({"message": "회의 상태가 'false'로 성공적으로 업데이트되었습니다."}, status=status.HTTP_200_OK)
 
+    def take_record_artifact(self, meeting, upload_id, record_file):
+        """
+        완료된 업로드(또는 기존 방식의 record_file)의 녹음 파일 참조를 작업으로 넘기고 sha256을 반환하는 함수.
+        요청이 올바르지 않으면 오류 Response를 반환한다.
+        """
+        if upload_id:
+            try:
+                upload = RecordingUpload.objects.get(id=upload_id, meeting=meeting)
+            except (RecordingUpload.DoesNotExist, ValidationError):
+                return Response({"error": "업로드를 찾을 수 없습니다."}, status=status.HTTP_404_NOT_FOUND)
+
+            if upload.status != "complete":
+                return Response({"error": "녹음 파일 업로드가 완료되지 않았습니다.", "offset": upload.offset}, status=status.HTTP_400_BAD_REQUEST)
+        else:
+            # 기존 방식: 파일 전체를 메모리에 올리지 않고 청크 단위로 업로드 경로에 저장 (형식은 헤더로 확인)
+            upload = RecordingUpload(meeting=meeting, filename=record_file.name, total_size=record_file.size)
+            try:
+                save_uploaded_file(upload, record_file)
+            except ValueError as e:
+                return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        # 녹음 파일 참조를 업로드에서 작업으로 넘긴다 (작업이 끝나면 해제)
+        record_artifact = upload.sha256
+        acquire(record_artifact)
+        upload.delete()
+        return record_artifact
+
 
 @background(schedule=0)
-def process_meeting_data(meeting_id, meeting_title, section_titles, section_end_times, start_time, record_file_data, num_speakers):
+def process_meeting_data(meeting_id, meeting_title, section_titles, section_end_times, start_time, record_artifact, num_speakers):
+    """
+    회의 녹음을 split → diarize → transcribe → summarize → save 단계로 처리하는 작업.
+    각 단계의 결과는 체크포인트로 저장되며, 실패 시 예외를 다시 발생시켜 background_task가 재시도하게 한다.
+    재시도하면 마지막으로 완료된 단계 다음부터 진행하며, 회의록을 저장하면 체크포인트를 지운다.
+    MAX_ATTEMPTS번 모두 실패하면 signals.fail_meeting_minutes가 회의록 상태를 failed로 바꾸고
+    체크포인트와 섹션 파일을 지운 뒤 녹음 파일 참조를 해제한다.
+    """
     try:
-        record_file_data_bytes = base64.b64decode(record_file_data)
-        file_content = BytesIO(record_file_data_bytes)
-
         meeting = Meeting.objects.get(id=meeting_id)
+    except Meeting.DoesNotExist:
+        print(f"회의 ID {meeting_id}를 찾을 수 없습니다.")
+        release(record_artifact)
+        return
 
-        base_dir = os.getcwd() 
-        save_dir = os.path.join(base_dir, f"meetings", f"meeting_{meeting.id}")
-        voice_seg_dir = os.path.join(base_dir, f"meetings", f"meeting_{meeting.id}", f"segmented")
-        
-        if not os.path.exists(save_dir):
-            os.makedirs(save_dir)
-
+    try:
+        boundaries = section_boundaries(start_time, section_end_times)
         start_time = convert_to_timedelta(start_time)
 
-        section_end_times = [convert_to_timedelta(time) for time in section_end_times]
+        section_file_paths = run_stage(
+            meeting, record_artifact, 'split',
+            lambda: split_recording(meeting.id, record_artifact, boundaries),
+            is_valid=lambda paths: all(os.path.exists(path) for path in paths),
+            measure=measure_sections,
+        )
 
-        audio, sr_ = librosa.load(file_content, sr=16000, mono=False)
-        
-        if audio.ndim == 1:
-            audio = audio[:, None]
-            audio = audio.repeat(2, axis=1)
-        
-        print(f"Audio loaded: {audio.shape} samples at {sr_} Hz")
+        for idx, section_audio_path in enumerate(section_file_paths):
+            print(f"Section {idx + 1} ({meeting_title}) 저장 완료: {section_audio_path}")
 
-        section_start = start_time
-        section_file_paths = [] 
-        for idx, section_end in enumerate(section_end_times):
-            start_sample = int(section_start.total_seconds() * sr_) 
-            end_sample = int(section_end.total_seconds() * sr_) 
+        # 섹션별 화자 분리/STT를 프로세스 풀에서 병렬로 처리 (결과는 섹션 순서대로)
+        diarizations = run_stage(
+            meeting, record_artifact, 'diarize',
+            lambda: process_sections(diarize_section_file, section_file_paths, [num_speakers] * len(section_file_paths)),
+            measure=measure_diarizations,
+        )
 
-            section_audio = audio[start_sample:end_sample, :] 
-            section_filename = f"section_{idx + 1}.wav"
-            section_audio_path = os.path.join(save_dir, section_filename)
+        def transcribe():
+            transcriptions = process_sections(transcribe_section_file, section_file_paths, diarizations)
+            save_transcript_segments(meeting, transcriptions)
+            return transcriptions
 
-            print(f"Saving section {idx + 1} to {section_audio_path}")
-            sf.write(section_audio_path, section_audio, sr_)
-            section_file_paths.append(section_audio_path)
+        transcriptions = run_stage(meeting, record_artifact, 'transcribe', transcribe, measure=measure_transcriptions)
+        all_stt_results = [transcription['text'] for transcription in transcriptions]
 
-            section_start = section_end
+        # 최종 STT 결과 배열 확인
+        print(all_stt_results)
 
-            print(f"Section {idx + 1} ({meeting_title}) 저장 완료: {section_filename}")
+        llm = get_llm_backend()
+        minutes = run_stage(
+            meeting, record_artifact, 'summarize',
+            lambda: run_async(create_minutes(meeting_title, section_titles, all_stt_results, start_time, llm, meeting)),
+            measure=lambda minutes: {'segment_count': len(section_titles), 'external_calls': llm.calls},
+        )
 
-        model_name = "eesungkim/stt_kr_conformer_transducer_large" 
-        asr_model = nemo_asr.models.ASRModel.from_pretrained(model_name)
-        
-        file_names = [i for i in os.listdir(save_dir) if 'wav' in i]
-        
-        all_stt_results = []
-        
-        for file_name in tqdm(file_names):
-            print(f"Processing {file_name}...")
-            
-            diar = Diarizer(embed_model='xvec', cluster_method='sc')
-
-            # 파일 경로 설정
-            file_path = os.path.join(save_dir, file_name)
-
-            # 소리 파일 읽기
-            sound_raw, sr_ = sf.read(file_path)
-            
-            seg_initial = diar.diarize(file_path)
-            
-            detected_speakers = len(set([seg_['label'] for seg_ in seg_initial]))
-            num_speakers = min(num_speakers, detected_speakers)
-
-            seg = diar.diarize(file_path, num_speakers=num_speakers)
-            
-            # 음성 파일 분할 폴더 준비
-            if os.path.exists(voice_seg_dir):
-                files = glob.glob(f'{voice_seg_dir}/*')
-                for f in files:
-                    os.remove(f)
-            else:
-                os.makedirs(voice_seg_dir)
-
-            # 화자 분리된 오디오 저장
-            for diar_num, seg_ in enumerate(seg):
-                start_index = seg_['start_sample']
-                end_index = seg_['end_sample'] + 1
-                speaker = seg_['label']
-                diar_num_str = str(diar_num).zfill(3)
-                slice_voice_path = f"{voice_seg_dir}/diar{diar_num_str}_speaker{speaker}.wav"
-                sf.write(slice_voice_path, sound_raw[start_index:end_index], sr_)
-
-            # 분할된 파일 순회하며 STT 처리
-            seg_file_list = np.sort(os.listdir(voice_seg_dir))
-            stt_dict = {i: [] for i in range(num_speakers)} 
-
-            for file_name_ in seg_file_list:
-                try:
-                    file_path_ = os.path.join(voice_seg_dir, file_name_)
-                    r = sr.Recognizer()
-
-                    with sr.AudioFile(file_path_) as source:
-                        audio = r.record(source)
-
-                    # 구글 음성 인식 서비스로 STT 실행
-                    stt = r.recognize_google(audio, language='ko-KR', show_all=True)
-                    diar_info = file_name_.replace('.wav', '')
-
-                    # STT 결과를 화자별로 저장
-                    if 'alternative' in stt and len(stt['alternative']) > 0:
-                        transcripts = [alt['transcript'] for alt in stt['alternative']]
-                        stt_text = ' '.join(transcripts)  # 결과 텍스트 합치기
-                        speaker = file_name_.split('_')[-1][7]  # speaker 번호 추출
-                        stt_dict[int(speaker)].append(stt_text)  # 화자별로 텍스트 저장
-
-                except sr.UnknownValueError:
-                    print(f"Google Speech Recognition could not understand audio in {file_name_}.")
-                except sr.RequestError as e:
-                    print(f"Could not request results from Google Speech Recognition service for {file_name_}; {e}")
-                except Exception as e:
-                    print(f"Error processing {file_name_}: {e}")
-
-            # 현재 파일에 대한 STT 결과를 합친 텍스트로 저장
-            file_stt_results = []
-            for speaker, transcripts in stt_dict.items():
-                result = f"speaker{speaker}: {' '.join(transcripts)},"  # 화자별 텍스트 합치기
-                file_stt_results.append(result)
-            
-            # 현재 파일에 대한 결과를 전체 결과 리스트에 추가
-            all_stt_results.append(' '.join(file_stt_results))  # 화자별 결과 합친 텍스트
+        run_stage(meeting, record_artifact, 'save', lambda: save_meeting_minutes(meeting, minutes))
+        clear_checkpoints(meeting.id, record_artifact)
+
+    except Exception as e:
+        print(f"비동기 작업 처리 중 오류 발생: {e}")
+        raise
+
+    release(record_artifact)
 
-        # 최종 STT 결과 배열 확인
-        print(all_stt_results)
-        
-        asyncio.run(save_minutes(meeting=meeting, topic=meeting_title, sub_topic_list=section_titles, speech_list=all_stt_results, date=start_time))
 
+@background(schedule=0)
+def process_live_window(meeting_id, start_sample, end_sample, num_speakers):
+    """
+    회의 진행 중 쌓인 실시간 전사 오디오의 한 window를 화자 분리/STT 처리하는 작업.
+    """
+    try:
+        meeting = Meeting.objects.get(id=meeting_id)
+    except Meeting.DoesNotExist:
+        print(f"회의 ID {meeting_id}를 찾을 수 없습니다.")
+        return
+
+    process_window(meeting, start_sample, end_sample, num_speakers)
+
+
+@background(schedule=0)
+def finalize_live_meeting(meeting_id, meeting_title, section_titles, section_end_times, start_time, num_speakers):
+    """
+    실시간 전사 중이던 회의를 마무리하는 작업. 마지막 window를 예약한 뒤 아직 결과가 저장되지 않은 window를
+    (process_live_window 작업이 실패했거나 재시도 횟수를 넘긴 경우 포함) 모두 직접 처리하고,
+    저장된 세그먼트를 섹션별로 나눈 뒤 요약해 회의록을 저장한다.
+    window 처리 중 예외가 나면 남은 window는 pending_windows에 그대로 남아 재시도 때 다시 처리된다.
+    """
+    try:
+        meeting = Meeting.objects.get(id=meeting_id)
     except Meeting.DoesNotExist:
         print(f"회의 ID {meeting_id}를 찾을 수 없습니다.")
+        return
+
+    boundaries = section_boundaries(start_time, section_end_times)
+    start_time = convert_to_timedelta(start_time)
+
+    def transcribe():
+        with transaction.atomic():
+            live = LiveTranscription.objects.select_for_update().get(meeting=meeting)
+            schedule_windows(live, final=True)
+
+        for start_sample, end_sample in live.pending_windows:
+            process_window(meeting, start_sample, end_sample, num_speakers)
+
+        live.refresh_from_db()
+        if live.pending_windows:
+            raise RuntimeError("처리되지 않은 실시간 전사 window가 있습니다.")
+
+        return assign_sections(meeting, boundaries, num_speakers)
+
+    try:
+        all_stt_results = run_stage(meeting, LIVE_ARTIFACT, 'transcribe', transcribe)
+
+        llm = get_llm_backend()
+        minutes = run_stage(
+            meeting, LIVE_ARTIFACT, 'summarize',
+            lambda: run_async(create_minutes(meeting_title, section_titles, all_stt_results, start_time, llm, meeting)),
+            measure=lambda minutes: {'segment_count': len(section_titles), 'external_calls': llm.calls},
+        )
+
+        run_stage(meeting, LIVE_ARTIFACT, 'save', lambda: save_meeting_minutes(meeting, minutes))
+        clear_checkpoints(meeting.id, LIVE_ARTIFACT)
+
     except Exception as e:
         print(f"비동기 작업 처리 중 오류 발생: {e}")
-        
-async def save_minutes(meeting, topic, sub_topic_list, speech_list, date):
-    minutes = await create_minutes(topic, sub_topic_list, speech_list, date)
-    await save_meeting_minutes(meeting, minutes)
+        raise
+
+    if os.path.exists(live_path(meeting.id)):
+        os.remove(live_path(meeting.id))
+
+
+def section_boundaries(start_time, section_end_times):
+    """
+    회의 시작 시간과 섹션 종료 시간 리스트를 [(섹션 시작 초, 섹션 종료 초), ...]로 변환하는 함수.
+    """
+    boundaries = []
+    section_start = convert_to_timedelta(start_time)
+    for section_end in [convert_to_timedelta(time) for time in section_end_times]:
+        boundaries.append((section_start.total_seconds(), section_end.total_seconds()))
+        section_start = section_end
+    return boundaries
+
 
 def convert_to_timedelta(time_str):
     """
@@ -570,7 +1131,7 @@ def retrieve_summary_style(text, vector_db):
     metadata = vector_db['indices']
 
     # 입력 텍스트의 벡터 추출
-    text_embedding = model.encode(text)  # (1, 384)
+    text_embedding = registry.get('sentence').encode(text)  # (1, 384)
     
     # embeddings가 2D 배열인지 확인 후 (N, 384) 형태로 처리
     if embeddings.ndim == 1:
@@ -596,7 +1157,7 @@ def retrieve_minutes_topic(text, vector_db):
     metadata = vector_db['indices']
 
     # 입력 텍스트의 벡터 추출
-    text_embedding = model.encode(text)  # (1, 384)
+    text_embedding = registry.get('sentence').encode(text)  # (1, 384)
     
     # embeddings가 2D 배열인지 확인 후 (N, 384) 형태로 처리
     if embeddings.ndim == 1:
@@ -606,39 +1167,52 @@ def retrieve_minutes_topic(text, vector_db):
     best_match_idx = similarity.argmax()
     return metadata[best_match_idx]
 
-# GPT-4 API 호출
-async def generate_summary(prompt):
-    response = await openai.ChatCompletion.acreate(
-        model="gpt-4",
-        messages=[
-            {"role": "system", "content": "당신은 전문 회의록 작성자입니다."},
-            {"role": "user", "content": prompt}
-        ]
-    )
-    return response['choices'][0]['message']['content']
-
 # 회의록 생성
-async def create_minutes(topic, sub_topic_list, speech_list, date):
-    summaries = []
-    for sub_topic, speech in zip(sub_topic_list, speech_list):
-        summary_style = retrieve_summary_style(speech, summary_vector_db)
-        prompt = f"""
-        다음 스타일로 회의 내용을 요약하세요:
-        {summary_style}
+async def create_minutes(topic, sub_topic_list, speech_list, date, llm=None, meeting=None):
+    """
+    섹션별 요약을 최대 MEETING_LLM_CONCURRENCY개까지 동시에 생성해 섹션 순서대로 회의록을 만드는 함수.
+    긴 섹션은 summarize_section에서 토큰 수 기준으로 나눠 요약한 뒤 합친다(map-reduce).
+    요약 요청은 MEETING_LLM_TIMEOUT초가 지나면 취소된다. 실패한 섹션은 다른 섹션을 막지 않고 초안에 안내 문구로 표시하되,
+    모든 섹션이 끝난 뒤 예외를 다시 발생시켜 작업이 재시도되도록 한다(성공한 섹션은 LLM 캐시에서 다시 사용된다).
+    meeting이 주어지면 요약을 스트리밍으로 받으면서 작성 중인 회의록을 minutes_draft에 기록한다.
+    """
+    semaphore = asyncio.Semaphore(settings.MEETING_LLM_CONCURRENCY)
+    llm = llm or get_llm_backend()
+    draft = MinutesDraft(meeting, topic, date, sub_topic_list) if meeting else None
 
-        소주제: {sub_topic}
-        내용: {speech}
-        """
-        summary = await generate_summary(prompt)
-        summaries.append(f"## {sub_topic}\n{summary}")
+    async def summarize(idx, sub_topic, speech):
+        summary_style = retrieve_summary_style(speech, summary_vector_db)
+        try:
+            summary = await summarize_section(
+                llm, sub_topic, speech, summary_style, semaphore,
+                on_delta=draft.on_delta(idx) if draft else None,
+            )
+        except Exception as e:
+            print(f"'{sub_topic}' 섹션 요약 중 오류 발생: {e!r}")
+            if draft:
+                await draft.set(idx, "(요약을 생성하지 못했습니다.)")
+            raise
+        if draft:
+            await draft.set(idx, summary)
+        return summary
+
+    summaries = await asyncio.gather(*(
+        summarize(idx, sub_topic, speech) for idx, (sub_topic, speech) in enumerate(zip(sub_topic_list, speech_list))
+    ), return_exceptions=True)
+    if isinstance(llm, CachedLLMBackend):
+        print(f"LLM 요약 캐시: {llm.hits}건 사용, {llm.calls}건 요청 (누적 {llm.cache.stats()})")
+
+    errors = [summary for summary in summaries if isinstance(summary, BaseException)]
+    if errors:
+        raise RuntimeError(f"{len(errors)}개 섹션 요약에 실패했습니다.") from errors[0]
 
     minutes_topic_info = retrieve_minutes_topic(topic, minutes_vector_db)
     minutes_topic_info_text = "\n".join(minutes_topic_info) if isinstance(minutes_topic_info, list) else minutes_topic_info
 
-    minutes = f"# {topic}\n\n**회의 일시**: {date}\n\n" + "\n\n".join(summaries) + f"\n\n---\n\n### 종합 정리\n{minutes_topic_info_text}"
-    return minutes
+    return render_minutes(topic, date, sub_topic_list, summaries, minutes_topic_info_text)
 
-@sync_to_async
 def save_meeting_minutes(meeting, minutes):
     meeting.meeting_minutes = minutes
+    meeting.minutes_draft = None
+    meeting.minutes_status = "done"
     meeting.save()
\ No newline at end of file
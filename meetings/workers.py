@@ -0,0 +1,118 @@
+import multiprocessing
+import os
+import resource
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from itertools import repeat
+
+# 섹션 워커가 사용하는 모델. sentence 모델은 부모 프로세스에서만 사용한다.
+SECTION_MODELS = ('diarizer', 'asr')
+
+# spawn으로 시작한 자식 프로세스는 initializer를 unpickle하면서 이 모듈을 import한다.
+# 이때는 아직 django.setup() 전이므로 이 모듈은 import 시점에 Django 앱(models 등)을 import하지 않아야 한다.
+
+_pool = None
+_pool_size = None
+_pool_lock = threading.Lock()
+
+# 워커 프로세스에서 initializer가 기록하는 설정 원래 값 (작업마다 동시에 실행되는 워커 수로 나눈다)
+_stt_limits = None
+
+
+def init_section_worker():
+    """
+    섹션 워커 프로세스 initializer. Django를 초기화하고 섹션 처리에 쓰는 모델을 미리 로드한다.
+    """
+    global _stt_limits
+    import django
+
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'app.settings')
+    django.setup()
+
+    from django.conf import settings
+    from .registry import registry
+
+    _stt_limits = (settings.MEETING_STT_RATE, settings.MEETING_STT_CONCURRENCY)
+    if settings.MEETING_WARM_MODELS:
+        registry.warm_up([name for name in SECTION_MODELS if name in registry.enabled])
+
+
+def run_section(fn, num_threads, active_workers, *args):
+    """
+    워커에서 섹션 하나를 처리하는 함수. torch 스레드 수를 정하고, 워커마다 STTDispatcher/TokenBucket을 따로 만들기 때문에
+    전체 STT 요청 한도가 MEETING_STT_RATE를 넘지 않도록 초당 요청 수와 동시 요청 수를 동시에 실행되는 워커 수로 나눈다.
+    풀의 워커는 종료되지 않아 부모의 RUSAGE_CHILDREN에 잡히지 않으므로,
+    (결과, pid, CPU 초, 최대 RSS 바이트)를 반환해 부모가 단계 측정값에 더하게 한다.
+    """
+    import torch
+    from django.conf import settings
+
+    torch.set_num_threads(num_threads)
+    rate, concurrency = _stt_limits
+    settings.MEETING_STT_RATE = rate / active_workers
+    settings.MEETING_STT_CONCURRENCY = max(1, concurrency // active_workers)
+
+    usage_before = resource.getrusage(resource.RUSAGE_SELF)
+    cpu_before = time.process_time()
+    result = fn(*args)
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    return result, os.getpid(), time.process_time() - cpu_before, max(usage.ru_maxrss, usage_before.ru_maxrss) * 1024
+
+
+def get_section_pool(max_workers):
+    """
+    워커 프로세스(백그라운드 작업 프로세스)마다 하나씩 유지하는 섹션 프로세스 풀을 반환하는 함수.
+    풀은 작업 사이에 재사용하므로 모델도 워커 프로세스가 살아 있는 동안 한 번만 로드된다.
+    풀 크기가 바뀌면 기존 풀을 닫고 새로 만든다.
+    """
+    global _pool, _pool_size
+    with _pool_lock:
+        if _pool is not None and _pool_size != max_workers:
+            _pool.shutdown()
+            _pool = None
+        if _pool is None:
+            _pool = ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=multiprocessing.get_context('spawn'),
+                initializer=init_section_worker,
+            )
+            _pool_size = max_workers
+        return _pool
+
+
+def discard_section_pool():
+    """
+    자식 프로세스가 비정상 종료되어 깨진 풀을 버리는 함수. 다음 호출(작업 재시도)에서 새 풀을 만든다.
+    """
+    global _pool, _pool_size
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
+        _pool_size = None
+
+
+def map_sections(fn, max_workers, cpu_budget, *iterables):
+    """
+    섹션마다 fn(*args)를 풀에서 실행하고 섹션 순서대로 결과를 반환하는 함수.
+    실제로 동시에 실행되는 워커 수(min(max_workers, 섹션 수))로 CPU 스레드와 STT 한도를 나누며,
+    워커가 보고한 CPU 시간과 최대 RSS는 실행 중인 StageTimer에 더한다.
+    """
+    from .profiling import record_worker_usage
+
+    iterables = [list(iterable) for iterable in iterables]
+    active_workers = max(1, min(max_workers, len(iterables[0])))
+    num_threads = max(1, cpu_budget // active_workers)
+    try:
+        outputs = list(get_section_pool(max_workers).map(
+            run_section, repeat(fn), repeat(num_threads), repeat(active_workers), *iterables,
+        ))
+    except BrokenProcessPool:
+        discard_section_pool()
+        raise
+
+    for _, pid, cpu_seconds, peak_rss_bytes in outputs:
+        record_worker_usage(pid, cpu_seconds, peak_rss_bytes)
+    return [result for result, *_ in outputs]
@@ -0,0 +1,56 @@
+import os
+import shutil
+import tempfile
+import uuid
+from django.conf import settings
+
+
+def output_dir(meeting_id, record_artifact):
+    """
+    녹음(record_artifact)별 출력 폴더 경로를 반환하는 함수.
+    """
+    return os.path.join(settings.MEETING_OUTPUT_ROOT, f"meeting_{meeting_id}", record_artifact)
+
+
+class JobWorkspace:
+    """
+    작업마다 독립된 임시 작업 공간을 만드는 컨텍스트 매니저.
+    같은 회의를 동시에 처리하거나 재시도해도 서로의 파일을 건드리지 않으며, 작업이 끝나면 항상 삭제된다.
+    결과 파일은 녹음(record_artifact)별 출력 폴더로 옮기므로, 같은 회의의 다른 녹음을 처리하는 작업끼리 덮어쓰지 않는다.
+
+    <MEETING_WORK_ROOT>/meeting_<id>/<job_id>/
+        sections/section_<n>.wav
+    <MEETING_OUTPUT_ROOT>/meeting_<id>/<record_artifact>/
+        section_<n>.wav
+    """
+
+    def __init__(self, meeting_id, record_artifact, job_id=None):
+        self.meeting_id = meeting_id
+        self.record_artifact = record_artifact
+        self.job_id = job_id or uuid.uuid4().hex
+        self.path = os.path.join(settings.MEETING_WORK_ROOT, f"meeting_{meeting_id}", self.job_id)
+        self.sections_dir = os.path.join(self.path, "sections")
+        self.output_dir = output_dir(meeting_id, record_artifact)
+
+    def __enter__(self):
+        os.makedirs(self.sections_dir)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        shutil.rmtree(self.path, ignore_errors=True)
+
+    def promote(self, src, name=None):
+        """
+        작업 공간의 파일을 녹음별 출력 폴더로 원자적으로 옮기는 함수.
+        다른 파일 시스템이면 출력 폴더 안의 임시 파일로 복사한 뒤 교체하므로, 반쯤 쓰인 파일이 보이는 일이 없다.
+        """
+        os.makedirs(self.output_dir, exist_ok=True)
+        dest = os.path.join(self.output_dir, name or os.path.basename(src))
+        try:
+            os.replace(src, dest)
+        except OSError:
+            fd, tmp_path = tempfile.mkstemp(dir=self.output_dir, suffix='.tmp')
+            os.close(fd)
+            shutil.copyfile(src, tmp_path)
+            os.replace(tmp_path, dest)
+        return dest